@@ -52,29 +52,22 @@ def collect_updates(files: list, region_map: dict, company_map: dict) -> list:
             continue
 
         today = _extract_date_from_path(path)
-
-        for _, row in df.iterrows():
-            company_name = str(row.get('기업명', '') or '').strip().replace(',', '')
-            announcement_name = str(row.get('공고명', '') or '').strip().replace(',', '')
-            deadline_raw = str(row.get('마감일', '') or '')
-            location_raw = str(row.get('지역', '') or '')
-
-            company_id = company_map.get(company_name)
-            if company_id is None:
-                continue
-
-            parsed_deadline = JobPreprocessor.parse_deadline(deadline_raw, today=today)
-            parsed_region = JobPreprocessor.parse_region(location_raw)
-            if not parsed_region:
-                continue
-
-            region_name, subregion_name = parsed_region
-            region_id = region_map.get(region_name)
-            if region_id is None:
-                continue
-
-            key = (company_id, announcement_name, str(parsed_deadline))
-            updates[key] = (region_id, subregion_name)
+        df = df.reindex(columns=['기업명', '공고명', '마감일', '지역']).fillna('').astype(str)
+
+        # 컬럼 단위 배치 파싱
+        company_names = df['기업명'].str.strip().str.replace(',', '', regex=False)
+        announcement_names = df['공고명'].str.strip().str.replace(',', '', regex=False)
+        deadlines = JobPreprocessor.to_python_list(JobPreprocessor.parse_deadline_array(df['마감일'], today=today))
+        region_names, subregion_names = JobPreprocessor.parse_region_array(df['지역'])
+        company_ids = company_names.map(company_map)
+        region_ids = region_names.map(region_map)
+
+        valid = (company_ids.notna() & region_ids.notna()).to_numpy()
+        for i in valid.nonzero()[0]:
+            if deadlines[i] is None:
+                continue  # 존재하지 않는 날짜
+            key = (int(company_ids[i]), announcement_names[i], str(deadlines[i]))
+            updates[key] = (int(region_ids[i]), subregion_names[i])
 
     return [
         (region_id, subregion_name, company_id, announcement_name, deadline)
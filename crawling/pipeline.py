@@ -0,0 +1,194 @@
+"""
+크롤러 → DB 적재 파이프라인.
+
+스크래퍼(브라우저 스레드)는 put()으로 행을 bounded 큐에 넣기만 하고,
+별도 writer 스레드가 행을 모아 batch_to_db로 적재한 뒤 신규 공고 id를
+tagger 스레드에 넘긴다. 브라우저는 DB 적재·LLM 태깅을 기다리지 않는다.
+
+- flush 조건: 모인 행 수 >= flush_rows 또는 첫 행 이후 flush_seconds 경과
+- backpressure: 큐가 가득 차면 put()이 블로킹 → 적재가 밀리면 스크래핑이 자연히 느려짐
+- close(): 남은 행을 flush하고 태깅까지 끝날 때까지 대기, 단계별 처리량을 로그로 남김
+- 적재 실패: write_retries회까지 재시도하고, 그래도 실패한 배치가 있으면 close()가 예외를 다시 던진다
+  (해당 행은 중복 사전 필터에 이미 등록돼 이번 실행에서 다시 읽히지 않으므로 크롤러 재시도로 복구)
+"""
+import logging
+import queue
+import threading
+import time
+
+_STOP = object()
+
+
+class StageStats:
+    """파이프라인 단계별 처리 건수·소요 시간."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.errors = 0
+
+    def record(self, items: int, seconds: float):
+        self.items += items
+        self.busy_seconds += seconds
+
+    def summary(self, wall_seconds: float) -> str:
+        rate = self.items / self.busy_seconds if self.busy_seconds > 0 else 0
+        wall_rate = self.items / wall_seconds if wall_seconds > 0 else 0
+        return (
+            f"{self.name}: {self.items}건, 작업 {self.busy_seconds:.1f}초 ({rate:,.1f}건/초), "
+            f"전체 기준 {wall_rate:,.1f}건/초, 실패 {self.errors}회"
+        )
+
+
+class IngestPipeline:
+    """스크래퍼 → writer → tagger 3단 파이프라인.
+
+    write_fn(rows) -> 신규 recruit_id 리스트, tag_fn(ids) -> stats dict.
+    tag_fn=None 이면 태깅 단계를 두지 않는다.
+    write_fn이 예외를 내면 retry_delay초 간격(시도마다 늘어남)으로 write_retries회 재시도한다.
+    """
+
+    def __init__(self, write_fn, tag_fn=None, flush_rows: int = 250,
+                 flush_seconds: float = 60.0, max_queue: int = 500,
+                 write_retries: int = 2, retry_delay: float = 1.0):
+        self.write_fn = write_fn
+        self.tag_fn = tag_fn
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.write_retries = write_retries
+        self.retry_delay = retry_delay
+        self._rows = queue.Queue(maxsize=max_queue)
+        self._tag_ids = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="ingest-writer", daemon=True)
+        self._tagger = threading.Thread(target=self._tag_loop, name="ingest-tagger", daemon=True)
+
+        self.scrape_stats = StageStats("scrape→queue")
+        self.write_stats = StageStats("write")
+        self.tag_stats = StageStats("tag")
+        self.put_wait_seconds = 0.0   # 큐가 가득 차 스크래퍼가 대기한 시간
+        self.flushes = 0
+        self.failed_rows = 0          # 재시도 후에도 적재하지 못한 행 수
+        self.write_error = None       # 그 첫 예외 — close()가 다시 던진다
+        self._started_at = None
+
+    def start(self):
+        self._started_at = time.perf_counter()
+        self._writer.start()
+        if self.tag_fn:
+            self._tagger.start()
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def put(self, row):
+        """행 1개 투입. 큐가 가득 차면 writer가 비울 때까지 블로킹."""
+        if not self._writer.is_alive():
+            raise RuntimeError("writer 스레드가 실행 중이 아닙니다.")
+        t0 = time.perf_counter()
+        self._rows.put(row)
+        self.put_wait_seconds += time.perf_counter() - t0
+        self.scrape_stats.items += 1
+
+    def close(self):
+        """남은 행 flush → 태깅 완료까지 대기 → 단계별 처리량 로그.
+        적재하지 못한 배치가 있으면 RuntimeError (원인 예외를 __cause__로 연결).
+        """
+        if self._writer.is_alive():
+            self._rows.put(_STOP)
+            self._writer.join()
+        if self._tagger.is_alive():
+            self._tag_ids.put(_STOP)
+            self._tagger.join()
+        self.log_stats()
+        if self.write_error is not None:
+            raise RuntimeError(f"{self.failed_rows}건 적재 실패") from self.write_error
+
+    # ── writer ────────────────────────────────────────────
+    def _write_loop(self):
+        batch = []
+        first_at = None
+        while True:
+            timeout = None
+            if batch:
+                timeout = max(0.0, first_at + self.flush_seconds - time.monotonic())
+            try:
+                item = self._rows.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # 시간 기준 flush
+
+            if item is _STOP:
+                self._flush(batch)
+                return
+            if item is not None:
+                if not batch:
+                    first_at = time.monotonic()
+                batch.append(item)
+
+            if batch and (len(batch) >= self.flush_rows or time.monotonic() - first_at >= self.flush_seconds):
+                self._flush(batch)
+                batch = []
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        t0 = time.perf_counter()
+        for attempt in range(1, self.write_retries + 2):
+            try:
+                new_ids = self.write_fn(batch)
+                break
+            except Exception as e:
+                self.write_stats.errors += 1
+                if attempt <= self.write_retries:
+                    delay = self.retry_delay * attempt
+                    logging.warning(f"[pipeline] {len(batch)}건 적재 실패 ({attempt}회차), {delay:.1f}초 후 재시도: {e}")
+                    time.sleep(delay)
+                    continue
+                self.failed_rows += len(batch)
+                if self.write_error is None:
+                    self.write_error = e
+                logging.error(f"[pipeline] {len(batch)}건 적재 실패 ({attempt}회 시도): {e}")
+                return
+        elapsed = time.perf_counter() - t0
+        self.write_stats.record(len(batch), elapsed)
+        self.flushes += 1
+        logging.info(
+            f"[pipeline] flush #{self.flushes}: {len(batch)}건 적재 (신규 {len(new_ids)}건), "
+            f"{elapsed:.2f}초, 큐 대기 {self._rows.qsize()}건"
+        )
+        if self.tag_fn and new_ids:
+            self._tag_ids.put(list(new_ids))
+
+    # ── tagger ────────────────────────────────────────────
+    def _tag_loop(self):
+        while True:
+            ids = self._tag_ids.get()
+            if ids is _STOP:
+                return
+            t0 = time.perf_counter()
+            try:
+                stats = self.tag_fn(ids)
+            except Exception as e:
+                self.tag_stats.errors += 1
+                logging.error(f"[pipeline] {len(ids)}건 태깅 실패: {e}")
+                continue
+            self.tag_stats.record(len(ids), time.perf_counter() - t0)
+            logging.info(
+                f"[pipeline] LLM 태깅 완료: 태깅됨={stats['tagged']} / 변화없음={stats['skipped']} / 실패={stats['failed']}"
+            )
+
+    def log_stats(self):
+        wall = time.perf_counter() - self._started_at if self._started_at else 0.0
+        self.scrape_stats.busy_seconds = max(0.0, wall - self.put_wait_seconds)
+        logging.info(
+            f"[pipeline] 전체 {wall:.1f}초, flush {self.flushes}회, 큐 가득 참 대기 {self.put_wait_seconds:.1f}초, "
+            f"적재 실패 {self.failed_rows}건"
+        )
+        for stage in (self.scrape_stats, self.write_stats, self.tag_stats):
+            if stage is self.tag_stats and not self.tag_fn:
+                continue
+            logging.info(f"[pipeline]   {stage.summary(wall)}")
@@ -7,12 +7,19 @@ from dotenv import load_dotenv
 from .page_handler import init_browser
 from .user_agent import random_user_agent
 from .utils import random_sleep, periodic_rest, safe_wait
-from db.base import batch_to_db
+from .pipeline import IngestPipeline
+from db.base import batch_to_db, connect_postgres, release_connection
+from db.prefilter import KnownPostings
 
 load_dotenv(override=True)
 
 TARGET_URL = os.getenv("TARGET_URL")
 
+# 적재 파이프라인: 250건(약 5페이지) 또는 60초마다 flush, 큐가 500건 차면 스크래퍼 대기
+FLUSH_ROWS = int(os.getenv("CRAWL_FLUSH_ROWS", "250"))
+FLUSH_SECONDS = float(os.getenv("CRAWL_FLUSH_SECONDS", "60"))
+QUEUE_SIZE = int(os.getenv("CRAWL_QUEUE_SIZE", "500"))
+
 
 def _posted_within_days(time_text: str, days: int) -> bool:
     """등록 시간 텍스트가 days일 이내인지 판별."""
@@ -32,11 +39,25 @@ def _posted_within_days(time_text: str, days: int) -> bool:
     return False
 
 
+def _load_known_postings() -> KnownPostings:
+    """기존 공고 키 적재. 실패해도 크롤링은 계속 (DB의 ON CONFLICT가 최종 중복 방지)."""
+    conn = None
+    try:
+        conn = connect_postgres()
+        return KnownPostings.load(conn)
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logging.warning(f"기존 공고 키 적재 실패, 사전 필터 없이 진행: {e}")
+        return KnownPostings()
+    finally:
+        release_connection(conn)
+
+
 def crawl_jobkorea_multiple_pages(days: int = 1):
     MAX_ITEMS = 50
-    SAVE_CNT = 5
     total_items = 0
-    data_batch = []
+    known = _load_known_postings()
 
     ua = random_user_agent()
     headers = {
@@ -46,6 +67,13 @@ def crawl_jobkorea_multiple_pages(days: int = 1):
     }
 
     playwright, browser, context, page = init_browser(ua, headers)
+    # LLM 태깅은 batch_to_db가 tagging_jobs에 등록 → db/tag_worker.py가 비동기 처리
+    pipeline = IngestPipeline(
+        write_fn=lambda rows: batch_to_db(rows, use_llm_tagging=True, mode="bulk"),
+        flush_rows=FLUSH_ROWS,
+        flush_seconds=FLUSH_SECONDS,
+        max_queue=QUEUE_SIZE,
+    ).start()
 
     try:
         page.goto(TARGET_URL)
@@ -92,6 +120,14 @@ def crawl_jobkorea_multiple_pages(days: int = 1):
                         link = f"https://www.jobkorea.co.kr{title_el.get_attribute('href')}"
                         company = row.query_selector("td.tplCo a").inner_text().strip()
 
+                        deadline_el = row.query_selector("td.odd .date")
+                        deadline = deadline_el.inner_text().strip() if deadline_el else ""
+
+                        # 이미 저장됐거나 이번 실행에서 배치에 넣은 공고는 나머지 필드를 읽지 않고 건너뜀
+                        if known.seen(company, title, deadline, link):
+                            logging.info(f"[SKIPPED - KNOWN] {company} | {title}")
+                            continue
+
                         etc_tags = row.query_selector_all("td.tplTit .etc .cell")
                         career = etc_tags[0].inner_text().strip() if len(etc_tags) > 0 else ""
                         education = etc_tags[1].inner_text().strip() if len(etc_tags) > 1 else ""
@@ -100,16 +136,14 @@ def crawl_jobkorea_multiple_pages(days: int = 1):
                         salary = etc_tags[4].inner_text().strip() if len(etc_tags) > 4 else ""
                         position = etc_tags[5].inner_text().strip() if len(etc_tags) > 5 else ""
 
-                        deadline_el = row.query_selector("td.odd .date")
-                        deadline = deadline_el.inner_text().strip() if deadline_el else ""
-
                         description_el = row.query_selector("td.tplTit p.dsc")
                         description = description_el.inner_text().strip() if description_el else ""
 
-                        data_batch.append([
+                        pipeline.put([
                             company, title, career, education, emp_type,
                             location, salary, deadline, description, position, link
                         ])
+                        known.add(company, title, deadline, link)
                         total_items += 1
                         logging.info(f"{total_items:04d} | {company} | {title} | {time_text}")
                     except Exception as e:
@@ -122,11 +156,6 @@ def crawl_jobkorea_multiple_pages(days: int = 1):
                 logging.info("⛔ 1일 이내 게시글 크롤링 완료 — 종료")
                 break
 
-            if current_page % SAVE_CNT == 0:
-                batch_to_db(data_batch, use_llm_tagging=True)
-                logging.info(f"✅ {SAVE_CNT}페이지마다 DB 저장 완료 (총 {total_items}건)")
-                data_batch.clear()
-
             random_sleep()
             periodic_rest(current_page)
 
@@ -150,13 +179,19 @@ def crawl_jobkorea_multiple_pages(days: int = 1):
                     logging.info("🔚 페이지 탐색 종료")
                     break
 
-        if data_batch:
-            batch_to_db(data_batch, use_llm_tagging=True)
-            logging.info(f"📝 마지막 데이터 DB 저장 완료 (총 {total_items}건)")
+        stats = known.stats()
+        logging.info(
+            f"🧹 중복 사전 필터: 확인 {stats['checked']}건 중 {stats['skipped']}건 건너뜀 "
+            f"(링크 {stats['skipped_link']} / 기업·공고·마감일 {stats['skipped_posting']}, "
+            f"{stats['skip_rate']:.1%}) → 신규 후보 {total_items}건"
+        )
 
     finally:
         browser.close()
         playwright.stop()
+        # 남은 행 적재가 끝날 때까지 대기
+        pipeline.close()
+        logging.info(f"📝 파이프라인 종료 — 수집 {total_items}건 적재 완료")
 
 def run_crawler_with_retry(max_retries=3, days: int = 1):
     """
@@ -1,6 +1,9 @@
 from datetime import datetime, date, timedelta
 import re
 
+import numpy as np
+import pandas as pd
+
 SALARY_MIN = 600      # 만원 (최저 기준, 파트타임 포함)
 SALARY_MAX = 50000    # 만원 (5억 초과는 파싱 오류로 간주)
 EXPERIENCE_MAX = 30   # 년
@@ -22,6 +25,41 @@ TAG_SYNONYMS = {
     'Front-end 개발': '프론트엔드',
 }
 
+# 배치(컬럼 단위) 파싱용 사전 컴파일 패턴
+_NUMBER_RE = re.compile(r"(\d+)")
+_DEADLINE_RE = re.compile(r"^~(\d{2})/(\d{2})")
+_DIGIT_RE = re.compile(r"\d")
+_NEWBIE_RE = re.compile(r"신입|경력무관")
+
+EDUCATION_LEVELS = {
+    '학력무관': 0,
+    '고졸↑': 1,
+    '초대졸↑': 2,
+    '대졸↑': 3,
+    '석사↑': 4,
+    '박사↑': 5
+}
+
+# 형태 키워드 → 고용형태 코드 (dict 순서 = 매칭 우선순위)
+FORM_KEYWORD_LEVELS = {
+    '정규직': 1,
+    '계약직': 2,
+    '인턴': 3,
+    '파견직': 4,
+    '프리랜서': 5,
+    '위촉직': 6,
+    '개인사업자': 6,
+    '도급': 7,
+    '연수생': 8,
+    '교육생': 8,
+    '병역특례': 9,
+    '아르바이트': 10,
+}
+
+REGION_EMPLOYMENT_KEYWORDS = ['정규직', '계약직', '인턴', '파견직', '프리랜서']
+
+ALWAYS_OPEN_DEADLINE = date(9999, 12, 31)
+
 
 class JobPreprocessor:
     @staticmethod
@@ -59,8 +97,7 @@ class JobPreprocessor:
         if not value or not isinstance(value, str):
             return None
 
-        employment_keywords = ['정규직', '계약직', '인턴', '파견직', '프리랜서']
-        if any(kw in value for kw in employment_keywords):
+        if any(kw in value for kw in REGION_EMPLOYMENT_KEYWORDS):
             return None
 
         # 전처리
@@ -80,15 +117,7 @@ class JobPreprocessor:
         학력 문자열을 숫자 등급으로 변환
         """
         value = cls.sanitize_string(value)
-        level_map = {
-            '학력무관': 0,
-            '고졸↑': 1,
-            '초대졸↑': 2,
-            '대졸↑': 3,
-            '석사↑': 4,
-            '박사↑': 5
-        }
-        return level_map.get(value, None)
+        return EDUCATION_LEVELS.get(value, None)
 
     @staticmethod
     def parse_form(value):
@@ -103,36 +132,9 @@ class JobPreprocessor:
         if re.search(r'\d', value):
             return None  # 숫자형 연봉 값 잘못 들어간 경우
 
-        form_map = {
-            '정규직': '정규직',
-            '계약직': '계약직',
-            '인턴': '인턴',
-            '파견직': '파견직',
-            '프리랜서': '프리랜서',
-            '위촉직': '위촉직',
-            '개인사업자': '위촉직',
-            '도급': '도급',
-            '연수생': '연수생',
-            '교육생': '연수생',
-            '병역특례': '병역특례',
-            '아르바이트': '아르바이트',
-        }
-
-        for keyword, normalized in form_map.items():
+        for keyword, level in FORM_KEYWORD_LEVELS.items():
             if keyword in value:
-                level_map = {
-                    '정규직': 1,
-                    '계약직': 2,
-                    '인턴': 3,
-                    '파견직': 4,
-                    '프리랜서': 5,
-                    '위촉직': 6,
-                    '도급': 7,
-                    '연수생': 8,
-                    '병역특례': 9,
-                    '아르바이트': 10
-                }
-                return level_map.get(normalized, None)
+                return level
 
         return None
     
@@ -251,6 +253,190 @@ class JobPreprocessor:
             return None, f"above_maximum({EXPERIENCE_MAX})"
         return value, None
 
+    # ──────────────────────────────
+    # BATCH (COLUMN-WISE) PARSING
+    # ──────────────────────────────
+    # 각 *_array 메서드는 원시 문자열 컬럼(list / ndarray / Series)을 받아
+    # 동일 길이의 타입 배열을 반환한다. 결과는 같은 이름의 스칼라 메서드와 행 단위로 일치한다.
+    # 정수 결과는 결측을 표현하기 위해 pandas nullable Int64 Series로 반환한다.
+    #
+    # 크롤링 원시 값은 종류가 적고 반복이 많으므로("신입", "~12/31(수)", "서울 강남구" ...)
+    # 컬럼을 factorize해 고유값에만 벡터 문자열 연산을 적용하고, codes로 전체 행에 펼친다.
+
+    @staticmethod
+    def _factorize(values):
+        """(codes, 고유값 Series). 문자열이 아닌 고유값은 NaN (스칼라의 isinstance(value, str) 검사에 대응)."""
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+        uniques = pd.Series(uniques, dtype=object)
+        is_str = np.fromiter((isinstance(v, str) for v in uniques), dtype=bool, count=len(uniques))
+        return codes, uniques.where(is_str)
+
+    @staticmethod
+    def _expand(parsed, codes):
+        """고유값 파싱 결과를 원래 행 순서로 펼친다."""
+        if isinstance(parsed, np.ndarray):
+            return parsed[codes]
+        return parsed.take(codes).reset_index(drop=True)
+
+    @staticmethod
+    def _sanitize_uniques(u):
+        """sanitize_string의 배치 버전. 빈 문자열은 NaN."""
+        u = u.str.strip().str.replace(",", "", regex=False)
+        return u.where(u.str.len() > 0)
+
+    @staticmethod
+    def _first_number_uniques(u):
+        """extract_first_number의 배치 버전.
+        \\d는 전각('３')·기타 유니코드 숫자도 잡는데 pd.to_numeric은 ASCII만 읽으므로 스칼라처럼 int()로 변환한다.
+        """
+        digits = u.str.extract(_NUMBER_RE, expand=False)
+        return digits.map(int, na_action="ignore").astype("Int64")
+
+    @classmethod
+    def parse_experience_array(cls, values):
+        """경력 컬럼 → Int64 Series (parse_experience 배치 버전)."""
+        codes, u = cls._factorize(values)
+        u = cls._sanitize_uniques(u)
+        parsed = cls._first_number_uniques(u)
+        parsed[u.str.contains(_NEWBIE_RE, na=False)] = 0
+        return cls._expand(parsed, codes)
+
+    @classmethod
+    def parse_education_array(cls, values):
+        """학력 컬럼 → Int64 Series (parse_education 배치 버전)."""
+        codes, u = cls._factorize(values)
+        return cls._expand(cls._sanitize_uniques(u).map(EDUCATION_LEVELS).astype("Int64"), codes)
+
+    @classmethod
+    def parse_form_array(cls, values):
+        """형태 컬럼 → Int64 Series (parse_form 배치 버전). 키워드 우선순위는 FORM_KEYWORD_LEVELS 순서."""
+        codes, u = cls._factorize(values)
+        u = u.str.strip()
+        conditions = [u.str.contains(kw, regex=False, na=False).to_numpy() for kw in FORM_KEYWORD_LEVELS]
+        levels = np.select(conditions, list(FORM_KEYWORD_LEVELS.values()), default=0)
+        parsed = pd.Series(levels, dtype="Int64")
+        invalid = (levels == 0) | u.str.contains(_DIGIT_RE, na=False).to_numpy()
+        parsed[invalid] = pd.NA
+        return cls._expand(parsed, codes)
+
+    @classmethod
+    def parse_region_array(cls, values):
+        """지역 컬럼 → (region_name Series, subregion_name Series) (parse_region 배치 버전).
+        스칼라가 None을 반환하는 행은 두 Series 모두 None.
+        """
+        codes, u = cls._factorize(values)
+        employment = u.str.contains("|".join(REGION_EMPLOYMENT_KEYWORDS), na=False)
+        parts = u.str.replace("외", "", regex=False).str.strip().str.split(n=1, expand=True)
+        region = parts[0] if 0 in parts else pd.Series(np.nan, index=u.index, dtype=object)
+        subregion = parts[1] if 1 in parts else pd.Series(np.nan, index=u.index, dtype=object)
+        invalid = employment | region.isna()
+        region = region.astype(object).where(~invalid, None)
+        subregion = subregion.astype(object).where(~invalid & subregion.notna(), None)
+        return cls._expand(region, codes), cls._expand(subregion, codes)
+
+    @classmethod
+    def parse_salary_array(cls, values):
+        """연봉 컬럼 → Int64 Series (만원/년, parse_salary 배치 버전)."""
+        codes, u = cls._factorize(values)
+        u = cls._sanitize_uniques(u)
+        num = cls._first_number_uniques(u)
+        daily = u.str.contains("일", regex=False, na=False)
+        monthly = ~daily & u.str.contains("월", regex=False, na=False)
+        yearly = ~daily & ~monthly & u.str.contains("만원", regex=False, na=False)
+
+        parsed = pd.Series(pd.NA, index=u.index, dtype="Int64")
+        monthly_num = num.where(monthly & (num != 0).fillna(False))   # 스칼라: num이 0이면 None
+        parsed = parsed.mask(monthly_num.notna(), monthly_num * 12)
+        parsed = parsed.mask(yearly, num)
+        return cls._expand(parsed, codes)
+
+    @classmethod
+    def parse_deadline_array(cls, values, today=None):
+        """마감일 컬럼 → numpy datetime64[D] 배열 (parse_deadline 배치 버전).
+        상시채용 등은 9999-12-31. 존재하지 않는 날짜(02/30 등)는 스칼라가 ValueError를 내는 대신 NaT.
+        """
+        if today is None:
+            today = datetime.today().date()
+        today64 = np.datetime64(today, "D")
+
+        codes, u = cls._factorize(values)
+        u = u.str.strip()
+        parsed = np.full(len(u), np.datetime64(ALWAYS_OPEN_DEADLINE, "D"), dtype="datetime64[D]")
+
+        relative = {"오늘마감": 0, "내일마감": 1, "모레마감": 2}
+        is_relative = u.isin(list(relative)).to_numpy()
+        for label, offset in relative.items():
+            parsed[(u == label).to_numpy()] = today64 + np.timedelta64(offset, "D")
+
+        always = u.str.contains("상시", regex=False, na=False).to_numpy()
+        parts = u.str.extract(_DEADLINE_RE)
+        dated = parts[0].notna().to_numpy() & ~is_relative & ~always
+        if dated.any():
+            months = parts.loc[dated, 0].astype(int).to_numpy()
+            days = parts.loc[dated, 1].astype(int).to_numpy()
+
+            def _build(year):
+                years = np.full(len(months), year - 1970)
+                month_start = years.astype("datetime64[Y]") + (months - 1).astype("timedelta64[M]")
+                d = month_start.astype("datetime64[D]") + (days - 1).astype("timedelta64[D]")
+                valid = (months >= 1) & (months <= 12) & (days >= 1) & (d.astype("datetime64[M]") == month_start)
+                return np.where(valid, d, np.datetime64("NaT"))
+
+            deadlines = _build(today.year)
+            # 마감일이 이미 지났다면 내년으로 보정
+            passed = deadlines < today64
+            if passed.any():
+                deadlines = np.where(passed, _build(today.year + 1), deadlines)
+            parsed[dated] = deadlines
+        return cls._expand(parsed, codes)
+
+    @staticmethod
+    def to_python_list(values):
+        """배치 결과 → 파이썬 값 리스트 (Int64 → int/None, datetime64[D] → date/None). DB 드라이버 전달용."""
+        if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+            return [None if np.isnat(v) else v.item() for v in values.astype("datetime64[D]")]
+        return [None if v is pd.NA or v is None or v != v else (int(v) if isinstance(v, np.integer) else v)
+                for v in pd.Series(values, dtype=object)]
+
+    @staticmethod
+    def validate_salary_array(values):
+        """연봉 배치 검증. (검증된 Int64 Series, 위반 규칙명 object Series — 위반 없으면 None) 반환."""
+        v = pd.Series(values).reset_index(drop=True).astype("Int64")
+        below = (v < SALARY_MIN).fillna(False).to_numpy(dtype=bool)
+        above = (v > SALARY_MAX).fillna(False).to_numpy(dtype=bool)
+        rules = np.select([below, above], [f"below_minimum({SALARY_MIN})", f"above_maximum({SALARY_MAX})"], default=None)
+        return v.mask(below | above), pd.Series(rules, dtype=object)
+
+    @staticmethod
+    def validate_experience_array(values):
+        """경력 배치 검증. (검증된 Int64 Series, 위반 규칙명 object Series — 위반 없으면 None) 반환."""
+        v = pd.Series(values).reset_index(drop=True).astype("Int64")
+        negative = (v < 0).fillna(False).to_numpy(dtype=bool)
+        above = (v > EXPERIENCE_MAX).fillna(False).to_numpy(dtype=bool)
+        rules = np.select([negative, above], ["negative_value", f"above_maximum({EXPERIENCE_MAX})"], default=None)
+        return v.mask(negative | above), pd.Series(rules, dtype=object)
+
+    @staticmethod
+    def quality_log_value(value):
+        """data_quality_log.parsed_value 표기. 값이 없으면(None·pd.NA·NaN) NULL — 스칼라·배치 경로가 같게 기록한다."""
+        return None if pd.isna(value) else str(value)
+
+    @staticmethod
+    def quality_log_rows(batch_id, companies, titles, field, rules, originals, parsed):
+        """validate_*_array 결과를 data_quality_log INSERT 행 튜플 리스트로 변환.
+        (batch_id, company_name, announcement_name, field, rule, original_value, parsed_value)
+        """
+        rules = pd.Series(rules, dtype=object).reset_index(drop=True)
+        idx = np.flatnonzero(rules.notna().to_numpy())
+        companies, titles, originals, parsed = (
+            pd.Series(c, dtype=object).reset_index(drop=True) for c in (companies, titles, originals, parsed)
+        )
+        return [
+            (batch_id, companies[i], titles[i], field, rules[i], originals[i],
+             JobPreprocessor.quality_log_value(parsed[i]))
+            for i in idx
+        ]
+
     # ──────────────────────────────
     # STRINGIFY
     # ──────────────────────────────
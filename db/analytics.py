@@ -11,7 +11,7 @@
 from datetime import date, timedelta
 from sqlalchemy import func, case
 
-from db.io import SessionLocal
+from db.io import SessionLocal, tags_contain, title_contains
 from db.models import Recruit, Tag, Region, EmploymentType, recruit_tags
 
 
@@ -50,10 +50,7 @@ def get_salary_by_tags(keywords: list[str]) -> list[dict]:
                 )
                 .filter(Recruit.deadline >= date.today())
                 .filter(Recruit.annual_salary.isnot(None))
-                .filter(
-                    Recruit.tags.any(Tag.name.ilike(f"%{kw}%"))
-                    | Recruit.announcement_name.ilike(f"%{kw}%")
-                )
+                .filter(tags_contain(kw) | title_contains(kw))
                 .one()
             )
             if row.count > 0:
@@ -2,8 +2,16 @@ import psycopg2
 from psycopg2 import pool
 from dotenv import load_dotenv
 from datetime import datetime
+import io
 import os
+import time
 from .JobPreprocessor import JobPreprocessor
+from .migrations import migrate, ensure_schema, reset_schema_state, LATEST_VERSION
+from . import tagging_queue
+from .cache import (
+    company_cache, region_cache, tag_cache,
+    warm_dimension_caches, clear_dimension_caches, dimension_cache_stats,
+)
 import csv
 import log_config
 import logging
@@ -17,7 +25,8 @@ _connection_pool = None
 
 def init_connection_pool():
     global _connection_pool
-    _connection_pool = pool.SimpleConnectionPool(
+    # 크롤링 파이프라인의 writer 스레드 등 여러 스레드가 공유하므로 스레드 안전 풀 사용
+    _connection_pool = pool.ThreadedConnectionPool(
         minconn=1,
         maxconn=10,
         host=os.getenv("POSTGRES_HOST"),
@@ -59,10 +68,13 @@ def reset_tables():
         cursor.execute("DROP TABLE IF EXISTS recruits;")
         cursor.execute("DROP TABLE IF EXISTS regions;")
         cursor.execute("DROP TABLE IF EXISTS companies;")
+        cursor.execute("DROP TABLE IF EXISTS schema_version;")
 
         # create_tables(conn=conn, cursor=cursor)
 
         conn.commit()
+        reset_schema_state()
+        clear_dimension_caches()
         logging.info("테이블 초기화 완료")
     except Exception as e:
         logging.error(f"테이블 초기화 중 오류 발생: {e}")
@@ -73,205 +85,12 @@ def reset_tables():
 
 
 def create_tables(conn, cursor):
+    """미적용 스키마 마이그레이션을 모두 실행 (db/migrations.py 참고).
+    수집 경로에서는 프로세스당 1회만 확인하는 ensure_schema()를 사용한다.
+    """
     try:
-        logging.info("테이블 생성 시작")
-
-        # 고용형태 차원 테이블
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS employment_types (
-            id INTEGER PRIMARY KEY,
-            name TEXT UNIQUE NOT NULL
-        );
-        """)
-        cursor.executemany("""
-            INSERT INTO employment_types (id, name) VALUES (%s, %s) ON CONFLICT DO NOTHING
-        """, [
-            (1,'정규직'),(2,'계약직'),(3,'인턴'),(4,'파견직'),(5,'프리랜서'),
-            (6,'위촉직'),(7,'도급'),(8,'연수생'),(9,'병역특례'),(10,'아르바이트'),
-        ])
-
-        # 지역 대분류
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS regions (
-            id SERIAL PRIMARY KEY,
-            name TEXT UNIQUE NOT NULL
-        );
-        """)
-
-        # 기업
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS companies (
-            id SERIAL PRIMARY KEY,
-            company_name TEXT UNIQUE NOT NULL
-        );
-        """)
-
-        # 채용 공고
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS recruits (
-            id SERIAL PRIMARY KEY,
-            company_id INTEGER REFERENCES companies(id),
-            announcement_name TEXT,
-            experience INTEGER,
-            education INTEGER,
-            form INTEGER REFERENCES employment_types(id),
-            region_id INTEGER REFERENCES regions(id),
-            subregion_name TEXT,
-            annual_salary INTEGER,
-            deadline DATE,
-            link TEXT,
-            UNIQUE (company_id, announcement_name, deadline)
-        );
-        """)
-
-        # 태그
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tags (
-            id SERIAL PRIMARY KEY,
-            name TEXT UNIQUE NOT NULL
-        );
-        """)
-
-        # 태그-공고 관계
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS recruit_tags (
-            recruit_id INTEGER REFERENCES recruits(id) ON DELETE CASCADE,
-            tag_id INTEGER REFERENCES tags(id) ON DELETE CASCADE,
-            PRIMARY KEY (recruit_id, tag_id)
-        );
-        """)
-
-        # recruits.created_at 컬럼 마이그레이션 (기존 테이블 대응)
-        cursor.execute("""
-        ALTER TABLE recruits
-        ADD COLUMN IF NOT EXISTS created_at TIMESTAMP DEFAULT NOW()
-        """)
-
-        # recruits.region_id 마이그레이션 (기존 테이블 대응)
-        cursor.execute("""
-        ALTER TABLE recruits
-        ADD COLUMN IF NOT EXISTS region_id INTEGER REFERENCES regions(id)
-        """)
-
-        # subregion 비정규화 마이그레이션: subregion_name 컬럼 추가 및 subregions 테이블 제거
-        cursor.execute("""
-        ALTER TABLE recruits
-        ADD COLUMN IF NOT EXISTS subregion_name TEXT
-        """)
-        # 기존 데이터 backfill: subregion_id → subregion_name
-        cursor.execute("""
-        DO $$ BEGIN
-            IF EXISTS (
-                SELECT 1 FROM information_schema.columns
-                WHERE table_name = 'recruits' AND column_name = 'subregion_id'
-            ) THEN
-                UPDATE recruits r
-                SET subregion_name = s.name
-                FROM subregions s
-                WHERE r.subregion_id = s.id AND r.subregion_name IS NULL;
-            END IF;
-        END $$;
-        """)
-        cursor.execute("DROP TRIGGER IF EXISTS trg_sync_region_id ON recruits")
-        cursor.execute("DROP FUNCTION IF EXISTS sync_region_id()")
-        cursor.execute("ALTER TABLE recruits DROP COLUMN IF EXISTS subregion_id")
-        cursor.execute("DROP TABLE IF EXISTS subregions CASCADE")
-
-        # recruits.form FK 마이그레이션 (기존 테이블 대응)
-        cursor.execute("""
-        DO $$ BEGIN
-            IF NOT EXISTS (
-                SELECT 1 FROM pg_constraint WHERE conname = 'fk_recruits_form'
-            ) THEN
-                ALTER TABLE recruits ADD CONSTRAINT fk_recruits_form
-                FOREIGN KEY (form) REFERENCES employment_types(id);
-            END IF;
-        END $$;
-        """)
-
-        # 알림 발송 이력
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS notification_log (
-            id SERIAL PRIMARY KEY,
-            discord_user_id TEXT NOT NULL,
-            recruit_id INTEGER REFERENCES recruits(id) ON DELETE CASCADE,
-            notified_at TIMESTAMP DEFAULT NOW(),
-            UNIQUE (discord_user_id, recruit_id)
-        );
-        """)
-
-        # 사용자 프로필 (공통 필터)
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS user_profiles (
-            discord_user_id TEXT PRIMARY KEY,
-            region TEXT,
-            form INTEGER,
-            max_experience INTEGER,
-            min_annual_salary INTEGER,
-            updated_at TIMESTAMP DEFAULT NOW()
-        );
-        """)
-
-        # 키워드 구독 테이블
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS user_subscriptions (
-            id SERIAL PRIMARY KEY,
-            discord_user_id TEXT NOT NULL,
-            keyword TEXT,
-            created_at TIMESTAMP DEFAULT NOW()
-        );
-        """)
-
-        # 데이터 품질 로그
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS data_quality_log (
-            id SERIAL PRIMARY KEY,
-            batch_id TEXT NOT NULL,
-            company_name TEXT,
-            announcement_name TEXT,
-            field TEXT NOT NULL,
-            rule TEXT NOT NULL,
-            original_value TEXT,
-            parsed_value TEXT,
-            created_at TIMESTAMP DEFAULT NOW()
-        );
-        """)
-
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS job_market_daily (
-            date DATE PRIMARY KEY,
-            total_valid_jobs INTEGER,
-            new_jobs INTEGER,
-            avg_salary INTEGER,
-            top_tags JSONB,
-            region_dist JSONB,
-            experience_dist JSONB,
-            created_at TIMESTAMP DEFAULT NOW()
-        );
-        """)
-
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_sub_user_id
-            ON user_subscriptions(discord_user_id)
-        """)
-
-        # 검색 필터 컬럼 인덱스
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_deadline    ON recruits(deadline)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_form        ON recruits(form)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_experience  ON recruits(experience)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_salary      ON recruits(annual_salary)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_region_id   ON recruits(region_id)")
-        # 복합 인덱스: 가장 빈번한 필터 조합 (deadline 필수 + form/experience)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_deadline_form ON recruits(deadline, form)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_deadline_exp  ON recruits(deadline, experience)")
-        # ILIKE 검색용 trigram 인덱스 (pg_trgm 필요)
-        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_name_trgm ON recruits USING gin(announcement_name gin_trgm_ops)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags_name_trgm ON tags USING gin(name gin_trgm_ops)")
-        # 태그 → 공고 방향 JOIN 인덱스 (tag_id 단독 인덱스 없으면 recruit_tags 풀스캔 발생)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruit_tags_tag_id ON recruit_tags(tag_id)")
-
-        logging.info("테이블 생성 완료")
+        applied = migrate(conn)
+        logging.info(f"스키마 마이그레이션 확인 완료 (적용 {applied}건, 최신 v{LATEST_VERSION})")
     except Exception as e:
         logging.error(f"테이블 생성 중 오류 발생: {e}")
         raise
@@ -290,6 +109,7 @@ def clear_recruit_data():
             RESTART IDENTITY CASCADE
         """)
         conn.commit()
+        clear_dimension_caches()
         logging.info("채용 공고 데이터 전체 삭제 완료")
     finally:
         release_connection(conn)
@@ -299,169 +119,443 @@ def ensure_tables():
     """봇 시작 시 등 단독으로 테이블을 보장할 때 사용."""
     conn = connect_postgres()
     try:
-        cursor = conn.cursor()
-        create_tables(conn, cursor)
-        conn.commit()
+        ensure_schema(conn)
     finally:
         release_connection(conn)
 
 
-def batch_to_db(data_batch, use_llm_tagging: bool = False):
+def _parse_batch_row(row, batch_id, quality_events):
+    """크롤링 행 1개를 파싱·검증해 _jobkorea_write 인자 dict로 반환.
+    검증 위반은 quality_events에 추가한다.
+    """
+    company, title, career, education, emp_type, location, salary, deadline, description, position, link = row
+    desc_tags = JobPreprocessor.parse_explanation(description) or []
+    pos_tags = [t.strip() for t in position.replace('·', ',').split(',') if t.strip()] if position else []
+    all_tags = desc_tags + [t for t in pos_tags if t not in desc_tags]
+
+    # 파싱 후 유효성 검사
+    parsed_salary = JobPreprocessor.parse_salary(salary)
+    parsed_experience = JobPreprocessor.parse_experience(career)
+
+    validated_salary, salary_rule = JobPreprocessor.validate_salary(parsed_salary)
+    validated_experience, exp_rule = JobPreprocessor.validate_experience(parsed_experience)
+
+    if salary_rule:
+        quality_events.append((batch_id, company, title, 'annual_salary', salary_rule, salary,
+                               JobPreprocessor.quality_log_value(parsed_salary)))
+    if exp_rule:
+        quality_events.append((batch_id, company, title, 'experience', exp_rule, career,
+                               JobPreprocessor.quality_log_value(parsed_experience)))
+
+    return dict(
+        company_name=company,
+        announcement_name=title,
+        experience=validated_experience,
+        education=JobPreprocessor.parse_education(education),
+        form=JobPreprocessor.parse_form(emp_type),
+        region=JobPreprocessor.parse_region(location),
+        annual_salary=validated_salary,
+        deadline=JobPreprocessor.parse_deadline(deadline),
+        tags=all_tags or None,
+        link=link,
+    )
+
+
+def batch_to_db(data_batch, use_llm_tagging: bool = False, mode: str = "row"):
     """크롤링된 배치 데이터를 직접 DB에 삽입.
     data_batch는 [company, title, career, education, emp_type, location, salary, deadline, description, position, link] 리스트의 리스트.
-    use_llm_tagging=True 이면 신규 삽입된 공고에 EXAONE 의미 태그를 추가로 부여한다.
+    use_llm_tagging=True 이면 신규 삽입된 공고를 tagging_jobs 큐에 등록한다 (EXAONE 의미 태그는 db/tag_worker.py가 부여).
+    mode:
+      - "row":       행마다 _jobkorea_write + commit (기존 방식)
+      - "savepoint": 배치 전체를 한 트랜잭션으로 적재. 행마다 SAVEPOINT를 두어
+                     실패한 행만 되돌리고 나머지는 마지막에 한 번 commit
+      - "bulk":      배치 전체를 임시 테이블에 COPY 후 집합 연산으로 한 트랜잭션에 적재.
+                     실패 시 "savepoint" 방식으로 재시도
+    파싱·적재에 실패한 행은 data_quality_log에 field='row', rule='parse_failed(예외명)' /
+    'write_failed(예외명)', original_value=오류 메시지로 기록한다.
+    반환: 신규 삽입된 recruit_id 리스트
     """
     conn = connect_postgres()
     batch_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     quality_events = []
     new_recruit_ids = []
+    started = time.perf_counter()
 
     try:
+        ensure_schema(conn)
         cursor = conn.cursor()
-        create_tables(conn, cursor)
-        conn.commit()
+        warm_dimension_caches(cursor)
 
+        parsed_rows = []
         for i, row in enumerate(data_batch):
             try:
-                company, title, career, education, emp_type, location, salary, deadline, description, position, link = row
-                desc_tags = JobPreprocessor.parse_explanation(description) or []
-                pos_tags = [t.strip() for t in position.replace('·', ',').split(',') if t.strip()] if position else []
-                all_tags = desc_tags + [t for t in pos_tags if t not in desc_tags]
-
-                # 파싱 후 유효성 검사
-                parsed_salary = JobPreprocessor.parse_salary(salary)
-                parsed_experience = JobPreprocessor.parse_experience(career)
-
-                validated_salary, salary_rule = JobPreprocessor.validate_salary(parsed_salary)
-                validated_experience, exp_rule = JobPreprocessor.validate_experience(parsed_experience)
-
-                if salary_rule:
-                    quality_events.append((batch_id, company, title, 'annual_salary', salary_rule, salary, str(parsed_salary)))
-                if exp_rule:
-                    quality_events.append((batch_id, company, title, 'experience', exp_rule, career, str(parsed_experience)))
-
-                recruit_id = _jobkorea_write(
-                    conn=conn,
-                    cursor=cursor,
-                    company_name=company,
-                    announcement_name=title,
-                    experience=validated_experience,
-                    education=JobPreprocessor.parse_education(education),
-                    form=JobPreprocessor.parse_form(emp_type),
-                    region=JobPreprocessor.parse_region(location),
-                    annual_salary=validated_salary,
-                    deadline=JobPreprocessor.parse_deadline(deadline),
-                    tags=all_tags or None,
-                    link=link,
-                )
-                if recruit_id:
-                    new_recruit_ids.append(recruit_id)
+                parsed_rows.append(_parse_batch_row(row, batch_id, quality_events))
+            except Exception as e:
+                logging.warning(f"배치 {i}번째 행 파싱 실패: {e}")
+                company, title = (list(row) + [None, None])[:2]
+                quality_events.append(_row_failure_event(batch_id, company, title, "parse_failed", e))
+
+        if mode == "bulk":
+            try:
+                new_recruit_ids = bulk_write(conn, cursor, parsed_rows)
             except Exception as e:
                 conn.rollback()
-                logging.warning(f"배치 {i}번째 행 처리 실패: {e}")
+                clear_dimension_caches()
+                logging.warning(f"bulk 적재 실패, savepoint 방식으로 재시도: {e}")
+                mode = "savepoint"
+
+        if mode == "savepoint":
+            new_recruit_ids = _savepoint_write(conn, cursor, parsed_rows, batch_id, quality_events)
+            quality_events = []  # 같은 트랜잭션에서 이미 기록됨
+
+        if mode == "row":
+            for i, parsed in enumerate(parsed_rows):
+                try:
+                    recruit_id = _jobkorea_write(conn=conn, cursor=cursor, **parsed)
+                    if recruit_id:
+                        new_recruit_ids.append(recruit_id)
+                except Exception as e:
+                    conn.rollback()
+                    clear_dimension_caches()
+                    logging.warning(f"배치 {i}번째 행 처리 실패: {e}")
+                    quality_events.append(_row_failure_event(
+                        batch_id, parsed['company_name'], parsed['announcement_name'], "write_failed", e
+                    ))
+
+        elapsed = time.perf_counter() - started
+        logging.info(
+            f"배치 적재 완료 [{mode}]: {len(parsed_rows)}건 처리, 신규 {len(new_recruit_ids)}건, "
+            f"{elapsed:.2f}초 ({len(parsed_rows) / elapsed if elapsed > 0 else 0:.0f} rows/sec)"
+        )
+        logging.info(f"차원 캐시 통계: {dimension_cache_stats()}")
 
         # 품질 이벤트 일괄 기록
         if quality_events:
-            cursor.executemany("""
-                INSERT INTO data_quality_log
-                    (batch_id, company_name, announcement_name, field, rule, original_value, parsed_value)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, quality_events)
+            _write_quality_events(cursor, quality_events)
             conn.commit()
             logging.info(f"데이터 품질 이벤트 {len(quality_events)}건 기록 (batch_id={batch_id})")
 
-        # 신규 공고 LLM 태깅
+        # 신규 공고 LLM 태깅 작업 등록 (db/tag_worker.py가 처리)
         if use_llm_tagging and new_recruit_ids:
-            from db.tagger import tag_recruit_batch
-            stats = tag_recruit_batch(new_recruit_ids)
-            logging.info(f"LLM 태깅 완료: 태깅됨={stats['tagged']} / 변화없음={stats['skipped']} / 실패={stats['failed']}")
+            enqueued = tagging_queue.enqueue(cursor, new_recruit_ids)
+            conn.commit()
+            logging.info(f"LLM 태깅 작업 {enqueued}건 등록 (tagging_jobs)")
 
+        return new_recruit_ids
     finally:
         release_connection(conn)
 
-def csv_to_db(csv_path, today=None):
-    """CSV 파일을 DB에 적재.
-    today: parse_deadline 기준 날짜. 미지정 시 파일명에서 추출, 그것도 없으면 현재 날짜.
+
+def _row_failure_event(batch_id, company_name, announcement_name, stage, error):
+    """파싱·적재 실패 행을 data_quality_log 행 튜플로 변환."""
+    return (batch_id, company_name, announcement_name, 'row', f"{stage}({type(error).__name__})", str(error)[:1000], None)
+
+
+def _write_quality_events(cursor, quality_events):
+    cursor.executemany("""
+        INSERT INTO data_quality_log
+            (batch_id, company_name, announcement_name, field, rule, original_value, parsed_value)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """, quality_events)
+
+
+def _savepoint_write(conn, cursor, parsed_rows, batch_id, quality_events):
+    """parsed_rows를 한 트랜잭션으로 적재. 행마다 SAVEPOINT를 두어 실패한 행만 되돌린다.
+    실패 행과 quality_events는 같은 트랜잭션에서 data_quality_log에 기록하고 마지막에 1회 commit.
+    commit 자체가 실패하면 배치 전체가 롤백된다. 반환: 신규 삽입된 recruit_id 리스트
     """
+    new_recruit_ids = []
+    failed = 0
+    try:
+        for i, parsed in enumerate(parsed_rows):
+            cursor.execute("SAVEPOINT batch_row")
+            try:
+                recruit_id = _jobkorea_write(conn=conn, cursor=cursor, commit=False, **parsed)
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT batch_row")
+                # 되돌린 구간에서 발급된 차원 id가 캐시에 남았을 수 있음
+                clear_dimension_caches()
+                failed += 1
+                logging.warning(f"배치 {i}번째 행 처리 실패 (savepoint 롤백): {e}")
+                quality_events.append(_row_failure_event(
+                    batch_id, parsed['company_name'], parsed['announcement_name'], "write_failed", e
+                ))
+                continue
+            cursor.execute("RELEASE SAVEPOINT batch_row")
+            if recruit_id:
+                new_recruit_ids.append(recruit_id)
+
+        if quality_events:
+            _write_quality_events(cursor, quality_events)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        clear_dimension_caches()
+        raise
+
+    if failed:
+        logging.info(f"savepoint 적재: {failed}건 실패 행 제외하고 커밋")
+    if quality_events:
+        logging.info(f"데이터 품질 이벤트 {len(quality_events)}건 기록 (batch_id={batch_id})")
+    return new_recruit_ids
+
+
+def _copy_value(value):
+    """COPY text 포맷 필드 인코딩. None → \\N, 구분·이스케이프 문자는 백슬래시 처리."""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_rows(cursor, table, columns, rows):
+    """rows를 COPY FROM STDIN (text 포맷)으로 적재."""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(_copy_value(v) for v in row))
+        buf.write("\n")
+    buf.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+
+
+def bulk_write(conn, cursor, parsed_rows):
+    """파싱된 행 전체를 집합 연산으로 한 트랜잭션에 적재하고 신규 recruit_id 리스트 반환.
+
+    1. 임시 테이블(_stage_recruits, _stage_tags)에 COPY
+    2. companies / regions / tags 를 INSERT ... SELECT DISTINCT 로 일괄 확보
+    3. recruits 삽입 (배치 내 동일 키는 첫 행만, tag_names 포함) + RETURNING 으로 신규 공고에만 recruit_tags 연결
+    """
+    if not parsed_rows:
+        return []
+
+    recruit_rows = []
+    tag_rows = []
+    for seq, p in enumerate(parsed_rows):
+        region_name, subregion_name = p['region'] if isinstance(p['region'], tuple) else (None, None)
+        recruit_rows.append((
+            seq, p['company_name'], p['announcement_name'], p['experience'], p['education'],
+            p['form'], region_name, subregion_name, p['annual_salary'],
+            p['deadline'], p['link'],
+        ))
+        for pos, tag in enumerate(dict.fromkeys(p['tags'] or [])):
+            tag_rows.append((seq, pos, tag))
+
+    cursor.execute("""
+        CREATE TEMP TABLE _stage_recruits (
+            seq INTEGER PRIMARY KEY,
+            company_name TEXT,
+            announcement_name TEXT,
+            experience INTEGER,
+            education INTEGER,
+            form INTEGER,
+            region_name TEXT,
+            subregion_name TEXT,
+            annual_salary INTEGER,
+            deadline DATE,
+            link TEXT
+        ) ON COMMIT DROP
+    """)
+    cursor.execute("CREATE TEMP TABLE _stage_tags (seq INTEGER, pos INTEGER, name TEXT) ON COMMIT DROP")
+    _copy_rows(cursor, "_stage_recruits", (
+        "seq", "company_name", "announcement_name", "experience", "education",
+        "form", "region_name", "subregion_name", "annual_salary", "deadline", "link",
+    ), recruit_rows)
+    _copy_rows(cursor, "_stage_tags", ("seq", "pos", "name"), tag_rows)
+
+    # 차원 테이블 일괄 확보
+    cursor.execute("""
+        INSERT INTO companies (company_name)
+        SELECT DISTINCT company_name FROM _stage_recruits WHERE company_name IS NOT NULL
+        ON CONFLICT (company_name) DO NOTHING
+    """)
+    cursor.execute("""
+        INSERT INTO regions (name)
+        SELECT DISTINCT region_name FROM _stage_recruits WHERE region_name IS NOT NULL
+        ON CONFLICT (name) DO NOTHING
+    """)
+    cursor.execute("""
+        INSERT INTO tags (name)
+        SELECT DISTINCT name FROM _stage_tags
+        ON CONFLICT (name) DO NOTHING
+    """)
+
+    # 공고 + 태그 연결: picked = 배치 내 (기업, 공고명, 마감일) 중복 중 첫 행
+    cursor.execute("""
+        WITH picked AS (
+            SELECT DISTINCT ON (c.id, s.announcement_name, s.deadline)
+                s.seq, c.id AS company_id, s.announcement_name, s.experience, s.education,
+                s.form, rg.id AS region_id, s.subregion_name, s.annual_salary, s.deadline, s.link,
+                ARRAY(SELECT st.name FROM _stage_tags st WHERE st.seq = s.seq ORDER BY st.pos) AS tag_names
+            FROM _stage_recruits s
+            JOIN companies c ON c.company_name = s.company_name
+            LEFT JOIN regions rg ON rg.name = s.region_name
+            ORDER BY c.id, s.announcement_name, s.deadline, s.seq
+        ),
+        inserted AS (
+            INSERT INTO recruits (
+                company_id, announcement_name, experience, education, form,
+                region_id, subregion_name, annual_salary, deadline, link, tag_names
+            )
+            SELECT company_id, announcement_name, experience, education, form,
+                   region_id, subregion_name, annual_salary, deadline, link, tag_names
+            FROM picked
+            ORDER BY seq
+            ON CONFLICT (company_id, announcement_name, deadline) DO NOTHING
+            RETURNING id, company_id, announcement_name, deadline
+        ),
+        linked AS (
+            INSERT INTO recruit_tags (recruit_id, tag_id)
+            SELECT i.id, t.id
+            FROM inserted i
+            JOIN picked p
+              ON p.company_id = i.company_id
+             AND p.announcement_name = i.announcement_name
+             AND p.deadline = i.deadline
+            JOIN _stage_tags st ON st.seq = p.seq
+            JOIN tags t ON t.name = st.name
+            ON CONFLICT DO NOTHING
+        )
+        SELECT id FROM inserted ORDER BY id
+    """)
+    new_recruit_ids = [r[0] for r in cursor.fetchall()]
+    conn.commit()
+
+    skipped = len(parsed_rows) - len(new_recruit_ids)
+    if skipped:
+        logging.info(f"[SKIPPED - DUPLICATE] bulk 적재 중 {skipped}건은 이미 존재하거나 배치 내 중복이라 삽입되지 않았습니다.")
+    return new_recruit_ids
+
+
+def csv_date_from_path(csv_path):
+    """파일명의 YYYY-MM-DD를 parse_deadline 기준 날짜로 추출. 없으면 None."""
     import re as _re
     from datetime import date as _date
 
+    m = _re.search(r'(\d{4})-(\d{2})-(\d{2})', csv_path)
+    if m:
+        return _date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    return None
+
+
+def _parse_csv_row(row, today=None):
+    """CSV DictReader 행 1개를 _jobkorea_write 인자 dict로 변환."""
+    return dict(
+        company_name=row['기업명'],
+        announcement_name=row['공고명'],
+        experience=JobPreprocessor.parse_experience(row['경력']),
+        education=JobPreprocessor.parse_education(row['학력']),
+        form=JobPreprocessor.parse_form(row['형태']),
+        region=JobPreprocessor.parse_region(row['지역']),
+        annual_salary=JobPreprocessor.parse_salary(row['연봉']),
+        deadline=JobPreprocessor.parse_deadline(row['마감일'], today=today),
+        tags=JobPreprocessor.parse_explanation(row['설명']),
+        link=row['링크'],
+    )
+
+
+def parse_csv_frame(df, today=None):
+    """CSV DataFrame 전체를 컬럼 단위로 파싱해 _jobkorea_write 인자 dict 리스트로 변환.
+    결과는 행마다 _parse_csv_row와 같다. 존재하지 않는 마감일(스칼라에서 ValueError)인 행은 제외하고
+    (rows, 제외된 행 수)를 반환한다.
+    """
+    P = JobPreprocessor
+    region_name, subregion_name = P.parse_region_array(df['지역'])
+    columns = dict(
+        company_name=df['기업명'].tolist(),
+        announcement_name=df['공고명'].tolist(),
+        experience=P.to_python_list(P.parse_experience_array(df['경력'])),
+        education=P.to_python_list(P.parse_education_array(df['학력'])),
+        form=P.to_python_list(P.parse_form_array(df['형태'])),
+        region_name=region_name.tolist(),
+        subregion_name=subregion_name.tolist(),
+        annual_salary=P.to_python_list(P.parse_salary_array(df['연봉'])),
+        deadline=P.to_python_list(P.parse_deadline_array(df['마감일'], today=today)),
+        tags=[P.parse_explanation(v) for v in df['설명'].tolist()],
+        link=df['링크'].tolist(),
+    )
+
+    rows, failed = [], 0
+    for i in range(len(df)):
+        if columns['deadline'][i] is None:
+            failed += 1
+            continue
+        region = columns['region_name'][i]
+        rows.append(dict(
+            company_name=columns['company_name'][i],
+            announcement_name=columns['announcement_name'][i],
+            experience=columns['experience'][i],
+            education=columns['education'][i],
+            form=columns['form'][i],
+            region=(region, columns['subregion_name'][i]) if region is not None else None,
+            annual_salary=columns['annual_salary'][i],
+            deadline=columns['deadline'][i],
+            tags=columns['tags'][i],
+            link=columns['link'][i],
+        ))
+    return rows, failed
+
+
+def csv_to_db(csv_path, today=None):
+    """CSV 파일을 DB에 적재.
+    today: parse_deadline 기준 날짜. 미지정 시 파일명에서 추출, 그것도 없으면 현재 날짜.
+    """
     if today is None:
-        m = _re.search(r'(\d{4})-(\d{2})-(\d{2})', csv_path)
-        if m:
-            today = _date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        today = csv_date_from_path(csv_path)
 
     conn = connect_postgres()
     try:
+        ensure_schema(conn)
         cursor = conn.cursor()
-        create_tables(conn, cursor)
-        conn.commit()
+        warm_dimension_caches(cursor)
 
         with open(csv_path, newline='', encoding='utf-8-sig') as csvfile:
             reader = csv.DictReader(csvfile)
             for i, row in enumerate(reader):
                 try:
-                    _jobkorea_write(
-                        conn=conn,
-                        cursor=cursor,
-                        company_name=row['기업명'],
-                        announcement_name=row['공고명'],
-                        experience=JobPreprocessor.parse_experience(row['경력']),
-                        education=JobPreprocessor.parse_education(row['학력']),
-                        form=JobPreprocessor.parse_form(row['형태']),
-                        region=JobPreprocessor.parse_region(row['지역']),
-                        annual_salary=JobPreprocessor.parse_salary(row['연봉']),
-                        deadline=JobPreprocessor.parse_deadline(row['마감일'], today=today),
-                        tags=JobPreprocessor.parse_explanation(row['설명']),
-                        link=row['링크'],
-                    )
+                    _jobkorea_write(conn=conn, cursor=cursor, **_parse_csv_row(row, today))
                 except Exception as e:
                     conn.rollback()
+                    clear_dimension_caches()
                     logging.warning(f"{i}번째 행 처리 실패: {e}")
     finally:
         release_connection(conn)
 
-def _ensure_company_and_get_id(cursor, company_name):
-    cursor.execute("""
-        INSERT INTO companies (company_name)
+def _insert_or_select_id(cursor, table, column, value):
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING id, 이미 있으면 SELECT로 id 조회.
+    다른 프로세스가 같은 값을 동시에 삽입해도 ON CONFLICT가 커밋을 기다린 뒤 SELECT로 같은 id를 얻는다.
+    """
+    cursor.execute(f"""
+        INSERT INTO {table} ({column})
         VALUES (%s)
-        ON CONFLICT (company_name) DO NOTHING
+        ON CONFLICT ({column}) DO NOTHING
         RETURNING id
-    """, (company_name,))
+    """, (value,))
     result = cursor.fetchone()
     if result:
         return result[0]
     else:
-        cursor.execute("SELECT id FROM companies WHERE company_name = %s", (company_name,))
+        cursor.execute(f"SELECT id FROM {table} WHERE {column} = %s", (value,))
         return cursor.fetchone()[0]
 
+def _ensure_company_and_get_id(cursor, company_name):
+    return company_cache.get_or_create(
+        company_name, lambda name: _insert_or_select_id(cursor, "companies", "company_name", name)
+    )
+
 def _ensure_tag_and_get_id(cursor, tag_name):
-    cursor.execute("""
-        INSERT INTO tags (name)
-        VALUES (%s)
-        ON CONFLICT (name) DO NOTHING
-        RETURNING id
-    """, (tag_name,))
-    result = cursor.fetchone()
-    if result:
-        return result[0]
-    else:
-        cursor.execute("SELECT id FROM tags WHERE name = %s", (tag_name,))
-        return cursor.fetchone()[0]
+    return tag_cache.get_or_create(
+        tag_name, lambda name: _insert_or_select_id(cursor, "tags", "name", name)
+    )
 
 def _ensure_region_and_get_id(cursor, region_name):
-    cursor.execute("""
-        INSERT INTO regions (name)
-        VALUES (%s)
-        ON CONFLICT (name) DO NOTHING
-        RETURNING id
-    """, (region_name,))
-    result = cursor.fetchone()
-    if result:
-        return result[0]
-    else:
-        cursor.execute("SELECT id FROM regions WHERE name = %s", (region_name,))
-        return cursor.fetchone()[0]
+    return region_cache.get_or_create(
+        region_name, lambda name: _insert_or_select_id(cursor, "regions", "name", name)
+    )
 
 
 
@@ -477,8 +571,12 @@ def _jobkorea_write(
     annual_salary,
     deadline,
     tags,
-    link
+    link,
+    commit=True,
 ):
+    """공고 1건 적재. 신규 삽입 시 recruit_id, 중복이면 None.
+    commit=False 이면 호출자가 트랜잭션을 관리한다 (batch_to_db의 savepoint 모드).
+    """
     # 1. 회사 ID 확보
     company_id = _ensure_company_and_get_id(cursor, company_name)
 
@@ -502,8 +600,9 @@ def _jobkorea_write(
             subregion_name,
             annual_salary,
             deadline,
-            link
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            link,
+            tag_names
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         ON CONFLICT (company_id, announcement_name, deadline) DO NOTHING
         RETURNING id
     """, (
@@ -516,7 +615,8 @@ def _jobkorea_write(
         subregion_name,
         annual_salary,
         deadline,
-        link
+        link,
+        list(dict.fromkeys(tags or [])),
     ))
     result = cursor.fetchone()
 
@@ -535,5 +635,6 @@ def _jobkorea_write(
         recruit_id = None
         logging.info(f"[SKIPPED - DUPLICATE] {company_name} / {announcement_name} / {deadline} 은 이미 존재하여 삽입되지 않았습니다.")
 
-    conn.commit()
+    if commit:
+        conn.commit()
     return recruit_id
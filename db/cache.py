@@ -0,0 +1,146 @@
+"""
+프로세스 내 LRU 캐시 모듈.
+
+- LRUCache:       스레드 안전한 크기 제한 LRU + hit/miss 카운터
+- DimensionCache: 차원 테이블(companies / regions / tags) name → id 캐시
+- company_cache, region_cache, tag_cache: 수집 경로(psycopg2)와 태거(SQLAlchemy)가 공유하는 인스턴스
+
+차원 id는 한 번 발급되면 바뀌지 않으므로 캐시에 그대로 둘 수 있다.
+단, 롤백된 트랜잭션에서 발급된 id나 TRUNCATE 이후의 id는 무효이므로
+수집 경로는 롤백·초기화 시 clear_dimension_caches()를 호출한다.
+"""
+import logging
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """크기 제한 LRU 캐시. maxsize 초과 시 가장 오래 사용되지 않은 항목부터 제거."""
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+class DimensionCache(LRUCache):
+    """차원 테이블 name → id 캐시.
+
+    get_or_create(name, loader): 캐시 미스 시 loader(name)로 DB에서 id를 확보해 저장.
+    loader는 INSERT ... ON CONFLICT DO NOTHING + SELECT 조합이어야 하며,
+    다른 프로세스가 같은 이름을 동시에 삽입해도 같은 id를 돌려받는다.
+    """
+
+    def __init__(self, name: str, maxsize: int, warm_sql: str):
+        super().__init__(name, maxsize)
+        self.warm_sql = warm_sql
+        self.warmed = False
+
+    def get_or_create(self, name, loader):
+        value = self.get(name)
+        if value is not None:
+            return value
+        value = loader(name)
+        if value is not None:
+            self.put(name, value)
+        return value
+
+    def warm(self, cursor):
+        """테이블에서 (name, id)를 최대 maxsize건 읽어 캐시를 채운다."""
+        cursor.execute(self.warm_sql, (self.maxsize,))
+        rows = cursor.fetchall()
+        # 자주 쓰이는 항목이 먼저 오도록 정렬된 쿼리 → 역순으로 넣어 LRU 최신 위치에 배치
+        for name, id_ in reversed(rows):
+            self.put(name, id_)
+        self.warmed = True
+        return len(rows)
+
+
+company_cache = DimensionCache("companies", maxsize=20000, warm_sql="""
+    SELECT c.company_name, c.id
+    FROM companies c
+    ORDER BY c.id DESC
+    LIMIT %s
+""")
+
+region_cache = DimensionCache("regions", maxsize=256, warm_sql="""
+    SELECT name, id FROM regions ORDER BY id LIMIT %s
+""")
+
+# 태그는 사용 빈도순으로 워밍업 (유효 공고 기준 인기 태그가 캐시에 남도록)
+tag_cache = DimensionCache("tags", maxsize=20000, warm_sql="""
+    SELECT t.name, t.id
+    FROM tags t
+    LEFT JOIN recruit_tags rt ON rt.tag_id = t.id
+    GROUP BY t.id, t.name
+    ORDER BY COUNT(rt.recruit_id) DESC, t.id DESC
+    LIMIT %s
+""")
+
+DIMENSION_CACHES = (company_cache, region_cache, tag_cache)
+
+
+def warm_dimension_caches(cursor, force: bool = False):
+    """프로세스 시작 후 첫 사용 시 1회 차원 캐시를 워밍업."""
+    for cache in DIMENSION_CACHES:
+        if cache.warmed and not force:
+            continue
+        loaded = cache.warm(cursor)
+        logging.info(f"[cache] {cache.name} 캐시 워밍업: {loaded}건")
+
+
+def clear_dimension_caches():
+    """롤백·TRUNCATE 등으로 캐시된 id가 무효가 될 수 있을 때 전체 비움 (다음 사용 시 재워밍업)."""
+    for cache in DIMENSION_CACHES:
+        cache.clear()
+        cache.warmed = False
+
+
+def dimension_cache_stats() -> dict:
+    """{'companies': {...}, 'regions': {...}, 'tags': {...}} hit/miss 통계."""
+    return {cache.name: cache.stats() for cache in DIMENSION_CACHES}
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 import logging
 from dotenv import load_dotenv
 import os
-from sqlalchemy import create_engine, or_, and_
+from sqlalchemy import create_engine, or_, and_, func, select
 from sqlalchemy.orm import sessionmaker, joinedload
 from typing import List, Optional
 
@@ -43,7 +43,7 @@ def _to_recruit_out(r: Recruit) -> RecruitOut:
         experience=r.experience,
         education=r.education,
         form=r.form,
-        tags=[tag.name for tag in r.tags],
+        tags=list(r.tag_names or []),
         region_name=r.region.name if r.region else None,
     )
 
@@ -76,6 +76,87 @@ def read_recruitOut(limit: int = 10000, order_desc: bool = False) -> List[Recrui
     finally:
         session.close()
 
+SHORT_GRAM_MAX = 2  # 이 길이 이하 검색어는 pg_trgm 대신 short_grams 배열(GIN)로 찾는다
+
+
+def _is_short_token(token: str) -> bool:
+    # 공백·LIKE 와일드카드가 든 토큰은 gram 배열로 표현할 수 없으므로 ILIKE 유지
+    return len(token) <= SHORT_GRAM_MAX and not any(c.isspace() or c in "%_\\" for c in token)
+
+
+def title_contains(token: str):
+    """공고명 ILIKE '%token%'와 같은 조건. 1~2글자 토큰은 title_grams @> ARRAY[token]."""
+    if _is_short_token(token):
+        return Recruit.title_grams.contains([token.lower()])
+    return Recruit.announcement_name.ilike(f"%{token}%")
+
+
+def tags_contain(token: str):
+    """태그 중 하나라도 ILIKE '%token%'와 같은 조건 — recruits.tag_names만 보고 JOIN하지 않는다.
+    1~2글자 토큰은 tag_grams @> ARRAY[token], 그 외는 줄바꿈으로 이은 태그 문자열 ILIKE (trigram 인덱스).
+    """
+    if _is_short_token(token):
+        return Recruit.tag_grams.contains([token.lower()])
+    return func.tag_search_text(Recruit.tag_names).ilike(f"%{token}%")
+
+
+def sync_tag_names(session, recruit_ids: List[int]):
+    """recruit_tags 기준으로 recruits.tag_names 재계산. 기존 순서는 유지하고 새 태그는 뒤에 붙인다.
+    호출자가 커밋한다 (recruit_tags 변경과 같은 트랜잭션).
+    """
+    from sqlalchemy import text
+    if not recruit_ids:
+        return
+    session.execute(text("""
+        UPDATE recruits r
+        SET tag_names = ARRAY(
+            SELECT t.name
+            FROM recruit_tags rt
+            JOIN tags t ON t.id = rt.tag_id
+            WHERE rt.recruit_id = r.id
+            ORDER BY array_position(r.tag_names, t.name) NULLS LAST, t.id
+        )
+        WHERE r.id = ANY(:ids)
+    """), {"ids": list(recruit_ids)})
+
+
+# 2단계 검색: 조건에 맞는 id만 정렬·LIMIT으로 고른 뒤 그 id만 한 번에 RecruitOut으로 채운다 (0이면 ORM joinedload 1단계)
+SEARCH_TWO_PHASE = os.getenv("SEARCH_TWO_PHASE", "1") == "1"
+# 점수 검색: AND → OR 폴백 → 확장 키워드 재검색을 쿼리 한 번으로 처리하고 일치 점수순으로 정렬
+SEARCH_SCORED = os.getenv("SEARCH_SCORED", "0") == "1"
+
+# 점수 가중치 — 검색어 하나가 공고명에 있으면 TITLE_WEIGHT, 태그에만 있으면 TAG_WEIGHT
+TITLE_WEIGHT = 2
+TAG_WEIGHT = 1
+
+# RecruitOut 필드 순서대로 읽는 SELECT — 뒤에 WHERE / ORDER BY를 붙여 쓴다 (db/search_index.py도 사용)
+RECRUIT_OUT_SQL = """
+    SELECT r.id, c.company_name, r.announcement_name, r.link, r.deadline, r.annual_salary,
+           r.experience, r.education, r.form, g.name AS region_name, r.tag_names AS tags
+    FROM recruits r
+    JOIN companies c ON c.id = r.company_id
+    LEFT JOIN regions g ON g.id = r.region_id
+"""
+
+
+def _hydrate_recruits(session, recruit_ids: List[int]) -> List[RecruitOut]:
+    """id 목록 → RecruitOut 목록 (입력 순서 유지). 기업·지역 이름과 태그를 쿼리 한 번으로 읽고 ORM 객체는 만들지 않는다."""
+    from sqlalchemy import text
+    if not recruit_ids:
+        return []
+    rows = session.execute(
+        text(RECRUIT_OUT_SQL + " WHERE r.id = ANY(:ids)"), {"ids": list(recruit_ids)}
+    ).mappings().all()
+    by_id = {row["id"]: RecruitOut(**row) for row in rows}
+    return [by_id[recruit_id] for recruit_id in recruit_ids if recruit_id in by_id]
+
+
+def score_terms(keyword: Optional[str], expanded_keywords: Optional[list]) -> List[str]:
+    """점수에 쓰는 검색어 — 키워드 토큰과 확장 키워드 (대소문자 무시 중복 제거, 순서 유지)."""
+    terms = (keyword.split() if keyword else []) + list(expanded_keywords or [])
+    return list({term.lower(): term for term in reversed(terms)}.values())[::-1]
+
+
 def search_recruits_by_filter(
     keyword: str = None,
     min_deadline=None,
@@ -87,44 +168,57 @@ def search_recruits_by_filter(
     limit: int = 5,
     expanded_keywords: list = None,
     use_tags: bool = True,
+    expand_below: int = 0,
+    scored: bool = None,
+) -> List[RecruitOut]:
+    """SEARCH_INDEX=1이면 인메모리 인덱스(db/search_index.py)로 검색하고, 인덱스 구축·검색 실패 시 SQL로 검색.
+
+    expand_below > 0이면 expanded_keywords는 키워드 결과(AND→OR 폴백)가 그 수 미만일 때만 쓴다
+    (sql_search의 "결과 부족 시 확장 키워드 재검색"). scored(기본 SEARCH_SCORED)면 결과 공고는 같고
+    순서만 검색어 일치 점수(공고명 > 태그) 내림차순, 같은 점수는 최신순이다.
+    """
+    filters = dict(
+        keyword=keyword, min_deadline=min_deadline, min_annual_salary=min_annual_salary,
+        company_name=company_name, max_experience=max_experience, form=form, region=region,
+        limit=limit, expanded_keywords=expanded_keywords, use_tags=use_tags, expand_below=expand_below,
+        scored=SEARCH_SCORED if scored is None else scored,
+    )
+    from .search_index import SEARCH_INDEX_ENABLED, get_index
+    if SEARCH_INDEX_ENABLED:
+        try:
+            return get_index().search(**filters)
+        except Exception as e:
+            logging.warning(f"[search_index] 인덱스 검색 실패 — SQL로 검색: {e}")
+    return _search_recruits_sql(**filters)
+
+
+def _search_recruits_sql(
+    keyword: str = None,
+    min_deadline=None,
+    min_annual_salary: int = None,
+    company_name: str = None,
+    max_experience: int = None,
+    form: int = None,
+    region: str = None,
+    limit: int = 5,
+    expanded_keywords: list = None,
+    use_tags: bool = True,
+    expand_below: int = 0,
+    scored: bool = None,
+    two_phase: bool = None,
 ) -> List[RecruitOut]:
     today = date.today()
+    scored = SEARCH_SCORED if scored is None else scored
+    two_phase = SEARCH_TWO_PHASE if two_phase is None else two_phase
+    tokens = keyword.split() if keyword else []
+    # AND 결과 부족 시 OR 폴백 (멀티토큰 키워드 한정)
+    # use_tags=True: 결과 3건 미만이면 폴백 (태그 AND 과적용으로 빈 결과 방지)
+    # use_tags=False: 결과 0건일 때만 폴백 (기존 동작 유지)
+    fallback_threshold = 3 if use_tags else 1
     session = SessionLocal()
     try:
-        def _build_query(keyword_mode: str = 'and'):
-            q = (
-                session.query(Recruit)
-                .options(
-                    joinedload(Recruit.company),
-                    joinedload(Recruit.region),
-                    joinedload(Recruit.tags),
-                )
-                .filter(Recruit.deadline >= today)
-            )
-            if expanded_keywords:
-                # 확장 키워드 OR 매칭: 하나라도 공고명·태그에 포함되면 통과
-                q = q.filter(or_(*[
-                    or_(
-                        Recruit.announcement_name.ilike(f"%{kw}%"),
-                        Recruit.tags.any(Tag.name.ilike(f"%{kw}%")),
-                    )
-                    for kw in expanded_keywords
-                ]))
-            elif keyword:
-                tokens = keyword.split()
-                if keyword_mode == 'and':
-                    for token in tokens:
-                        cond = Recruit.announcement_name.ilike(f"%{token}%")
-                        if use_tags:
-                            cond = or_(cond, Recruit.tags.any(Tag.name.ilike(f"%{token}%")))
-                        q = q.filter(cond)
-                else:  # 'or' 폴백
-                    name_conditions = [Recruit.announcement_name.ilike(f"%{token}%") for token in tokens]
-                    if use_tags:
-                        tag_conditions = [Recruit.tags.any(Tag.name.ilike(f"%{token}%")) for token in tokens]
-                        q = q.filter(or_(*name_conditions, *tag_conditions))
-                    else:
-                        q = q.filter(or_(*name_conditions))
+        def _filter(q):
+            q = q.filter(Recruit.deadline >= today)
             if min_deadline:
                 q = q.filter(Recruit.deadline >= min_deadline)
             if min_annual_salary:
@@ -144,19 +238,128 @@ def search_recruits_by_filter(
                 )
             return q
 
-        results = _build_query('and').order_by(Recruit.id.desc()).limit(limit).all()
+        if scored and (tokens or expanded_keywords):
+            return _scored_recruits(
+                _filter(session.query(Recruit.id)), tokens, expanded_keywords, use_tags,
+                limit, fallback_threshold, expand_below,
+            )
 
-        # AND 결과 부족 시 OR 폴백 (expanded_keywords 미사용, 멀티토큰 키워드 한정)
-        # use_tags=True: 결과 3건 미만이면 폴백 (태그 AND 과적용으로 빈 결과 방지)
-        # use_tags=False: 결과 0건일 때만 폴백 (기존 동작 유지)
-        fallback_threshold = 3 if use_tags else 1
-        if len(results) < fallback_threshold and not expanded_keywords and keyword and len(keyword.split()) > 1:
-            results = _build_query('or').order_by(Recruit.id.desc()).limit(limit).all()
+        def _build_query(keyword_mode: str = 'and'):
+            if two_phase:
+                q = session.query(Recruit.id)
+            else:
+                q = session.query(Recruit).options(
+                    joinedload(Recruit.company),
+                    joinedload(Recruit.region),
+                )
+            q = _filter(q)
+            if keyword_mode == 'expanded':
+                # 확장 키워드 OR 매칭: 하나라도 공고명·태그에 포함되면 통과
+                q = q.filter(or_(*[
+                    or_(title_contains(kw), tags_contain(kw))
+                    for kw in expanded_keywords
+                ]))
+            elif tokens:
+                if keyword_mode == 'and':
+                    for token in tokens:
+                        cond = title_contains(token)
+                        if use_tags:
+                            cond = or_(cond, tags_contain(token))
+                        q = q.filter(cond)
+                else:  # 'or' 폴백
+                    name_conditions = [title_contains(token) for token in tokens]
+                    if use_tags:
+                        tag_conditions = [tags_contain(token) for token in tokens]
+                        q = q.filter(or_(*name_conditions, *tag_conditions))
+                    else:
+                        q = q.filter(or_(*name_conditions))
+            return q.order_by(Recruit.id.desc()).limit(limit)
 
+        if expanded_keywords and (not expand_below or not tokens):
+            results = _build_query('expanded').all()
+        else:
+            results = _build_query('and').all()
+            if len(results) < fallback_threshold and len(tokens) > 1:
+                results = _build_query('or').all()
+            if expanded_keywords and len(results) < expand_below:
+                results = _build_query('expanded').all()
+
+        if two_phase:
+            return _hydrate_recruits(session, [row.id for row in results])
         return [_to_recruit_out(r) for r in results]
     finally:
         session.close()
 
+
+def _scored_recruits(
+    q, tokens: List[str], expanded_keywords: Optional[list], use_tags: bool,
+    limit: int, fallback_threshold: int, expand_below: int,
+) -> List[RecruitOut]:
+    """AND → OR 폴백 → 확장 키워드 재검색을 SQL 한 문장으로 실행하고 점수순으로 채워 반환.
+
+    q는 필터만 건 Recruit.id 쿼리. 경로별 id 내림차순 LIMIT 쿼리를 CTE로 두고, 앞 단계 결과 수를 센
+    스칼라 서브쿼리로 어느 단계를 쓸지 고른다 — 고르지 않은 단계는 PostgreSQL이 실행하지 않으므로
+    DB 작업은 기존 경로와 같고 왕복만 한 번으로 줄어든다. 점수(검색어별 공고명 TITLE_WEIGHT, 태그만
+    TAG_WEIGHT의 합)는 고른 limit건에만 계산하며, 같은 점수는 id 내림차순. 기업·지역 이름과 태그도 같이 읽는다.
+    """
+    from sqlalchemy import case, literal, union_all
+
+    def _ids(*conditions, cte_name: str = None):
+        # 두 번 읽히는 단계(결과 수 확인 + 결과)는 CTE로 한 번만 실행
+        ids = q.filter(*conditions).order_by(Recruit.id.desc()).limit(limit)
+        return ids.cte(cte_name) if cte_name else ids.subquery()
+
+    def _count(ids):
+        return select(func.count()).select_from(ids).scalar_subquery()
+
+    def _pick(use_first, first, second, cte_name: str = None):
+        # use_first는 행과 무관한 조건 — 거짓인 쪽 가지는 실행되지 않는다
+        ids = union_all(
+            select(first.c.id).where(use_first),
+            select(second.c.id).where(~use_first),
+        )
+        return ids.cte(cte_name) if cte_name else ids.subquery()
+
+    def _token(token):
+        return or_(title_contains(token), tags_contain(token)) if use_tags else title_contains(token)
+
+    expanded = None
+    if expanded_keywords:
+        # 확장 키워드 OR 매칭: 하나라도 공고명·태그에 포함되면 통과
+        expanded = _ids(or_(*[or_(title_contains(kw), tags_contain(kw)) for kw in expanded_keywords]))
+
+    if expanded is not None and (not expand_below or not tokens):
+        chosen = expanded
+    else:
+        chosen = _ids(*[_token(token) for token in tokens], cte_name="and_ids")
+        if len(tokens) > 1:
+            chosen = _pick(
+                _count(chosen) >= fallback_threshold, chosen, _ids(or_(*[_token(token) for token in tokens])),
+                cte_name="keyword_ids",
+            )
+        if expanded is not None:
+            chosen = _pick(_count(chosen) >= expand_below, chosen, expanded)
+
+    score = sum(
+        (case((title_contains(t), TITLE_WEIGHT), (tags_contain(t), TAG_WEIGHT), else_=0)
+         for t in score_terms(" ".join(tokens), expanded_keywords)),
+        literal(0),
+    )
+    rows = q.session.execute(
+        select(
+            Recruit.id, Company.company_name, Recruit.announcement_name, Recruit.link, Recruit.deadline,
+            Recruit.annual_salary, Recruit.experience, Recruit.education, Recruit.form,
+            Region.name.label("region_name"), Recruit.tag_names.label("tags"),
+        )
+        .select_from(chosen)
+        .join(Recruit, Recruit.id == chosen.c.id)
+        .join(Company, Company.id == Recruit.company_id)
+        .outerjoin(Region, Region.id == Recruit.region_id)
+        .order_by(score.desc(), Recruit.id.desc())
+    ).mappings().all()
+    return [RecruitOut(**row) for row in rows]
+
+
 def read_recruits_by_ids(recruit_ids: List[int]) -> List[RecruitOut]:
     session = SessionLocal()
     
@@ -185,7 +388,6 @@ def get_new_recruits(hours: int = 24) -> List[RecruitOut]:
             .options(
                 joinedload(Recruit.company),
                 joinedload(Recruit.region),
-                joinedload(Recruit.tags),
             )
             .filter(Recruit.created_at >= since)
             .all()
@@ -400,6 +602,78 @@ def save_notification_log(discord_user_id: str, recruit_ids: List[int]):
         session.close()
 
 
+def get_keyword_expansion(keyword_norm: str, prompt_version: str) -> Optional[tuple]:
+    """keyword_expansions에서 (확장 키워드 리스트, 마지막 갱신 후 경과 초) 조회. 없으면 None."""
+    from sqlalchemy import text
+    session = SessionLocal()
+    try:
+        row = session.execute(text("""
+            SELECT expansions, EXTRACT(EPOCH FROM NOW() - refreshed_at) AS age
+            FROM keyword_expansions
+            WHERE keyword_norm = :k AND prompt_version = :v
+        """), {"k": keyword_norm, "v": prompt_version}).first()
+        return (list(row.expansions), float(row.age)) if row else None
+    finally:
+        session.close()
+
+
+def save_keyword_expansion(keyword_norm: str, prompt_version: str, model: str, expansions: List[str]):
+    """키워드 확장 결과 저장. 이미 있으면 확장 결과와 refreshed_at 갱신."""
+    from sqlalchemy import text
+    session = SessionLocal()
+    try:
+        session.execute(text("""
+            INSERT INTO keyword_expansions (keyword_norm, prompt_version, expansions, model)
+            VALUES (:k, :v, :e, :m)
+            ON CONFLICT (keyword_norm, prompt_version) DO UPDATE
+                SET expansions = EXCLUDED.expansions, model = EXCLUDED.model, refreshed_at = NOW()
+        """), {"k": keyword_norm, "v": prompt_version, "e": expansions, "m": model})
+        session.commit()
+    finally:
+        session.close()
+
+
+def get_rerank_scores(keyword_norm: str, prompt_version: str, recruit_ids: List[int]) -> dict:
+    """rerank_scores에서 {recruit_id: score} 조회. 마감이 지난 공고의 점수는 제외."""
+    from sqlalchemy import text
+    if not recruit_ids:
+        return {}
+    session = SessionLocal()
+    try:
+        rows = session.execute(text("""
+            SELECT s.recruit_id, s.score
+            FROM rerank_scores s
+            JOIN recruits r ON r.id = s.recruit_id
+            WHERE s.keyword_norm = :k AND s.prompt_version = :v
+              AND s.recruit_id = ANY(:ids) AND r.deadline >= CURRENT_DATE
+        """), {"k": keyword_norm, "v": prompt_version, "ids": list(recruit_ids)}).all()
+        return {recruit_id: score for recruit_id, score in rows}
+    finally:
+        session.close()
+
+
+def save_rerank_scores(keyword_norm: str, prompt_version: str, scores: dict):
+    """{recruit_id: score}를 rerank_scores에 저장. 이미 있으면 점수 갱신.
+    재순위 스레드 여럿이 같은 키워드를 동시에 저장할 수 있으므로 id 순서로 써서 행 잠금 순서를 맞춘다.
+    """
+    from sqlalchemy import text
+    if not scores:
+        return
+    ids = sorted(scores)
+    session = SessionLocal()
+    try:
+        session.execute(text("""
+            INSERT INTO rerank_scores (keyword_norm, prompt_version, recruit_id, score)
+            SELECT :k, :v, t.recruit_id, t.score
+            FROM unnest(CAST(:ids AS INTEGER[]), CAST(:scores AS REAL[])) AS t(recruit_id, score)
+            ON CONFLICT (keyword_norm, prompt_version, recruit_id) DO UPDATE
+                SET score = EXCLUDED.score, created_at = NOW()
+        """), {"k": keyword_norm, "v": prompt_version, "ids": ids, "scores": [scores[i] for i in ids]})
+        session.commit()
+    finally:
+        session.close()
+
+
 def normalize_existing_tags() -> dict:
     """TAG_SYNONYMS 기준으로 기존 DB 태그 정규화.
 
@@ -411,12 +685,16 @@ def normalize_existing_tags() -> dict:
     from sqlalchemy import text
     session = SessionLocal()
     report = {'renamed': [], 'merged': [], 'skipped': []}
+    affected = set()
     try:
         for old_name, new_name in TAG_SYNONYMS.items():
             old_tag = session.query(Tag).filter_by(name=old_name).first()
             if not old_tag:
                 report['skipped'].append(old_name)
                 continue
+            affected.update(session.execute(
+                text("SELECT recruit_id FROM recruit_tags WHERE tag_id = :old_id"), {"old_id": old_tag.id}
+            ).scalars())
 
             new_tag = session.query(Tag).filter_by(name=new_name).first()
             if new_tag:
@@ -432,6 +710,9 @@ def normalize_existing_tags() -> dict:
                 old_tag.name = new_name
                 report['renamed'].append(f"{old_name} → {new_name}")
 
+        # 이름 변경·병합된 태그를 가진 공고의 tag_names 재계산
+        session.flush()
+        sync_tag_names(session, sorted(affected))
         session.commit()
         logging.info(f"태그 정규화 완료: {report}")
         return report
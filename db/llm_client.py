@@ -0,0 +1,390 @@
+"""
+Ollama /api/generate 공용 클라이언트.
+
+- LLMClient:  keep-alive 커넥션 풀(requests.Session) + 공통 타임아웃·재시도(backoff) + 호출 지표
+- LLMMetrics: 호출처(caller)별 호출 수·오류·재시도·지연(p50/p95)·토큰 수 집계
+- CircuitBreaker: 연속 실패·지연 응답(호출 타임아웃에 비례한 기준)이 쌓이면 호출을 즉시 거절(open)하고, 일정 시간 뒤 1건만 시험 호출(half-open)
+- get_client() / configure(): 프로세스 공용 인스턴스 (태거·키워드 확장·재순위·테스트 스크립트가 공유)
+
+엔드포인트는 OLLAMA_URL 환경변수(호스트 주소, 예: http://192.168.219.114:11434)로 지정한다.
+연결 실패·5xx·429만 재시도하고, 응답 지연(read timeout)은 재시도하지 않는다 —
+서버가 바쁜 상황에서 같은 요청을 다시 보내면 대기 시간만 두 배가 되기 때문.
+
+generate(stop=...)를 주면 토큰을 스트리밍으로 받다가 stop(지금까지의 텍스트)이 True가 되는 즉시
+연결을 끊는다 (Ollama는 연결이 끊기면 생성을 중단). 파서가 첫 줄만 쓰는 호출은 first_line_complete를 넘기면
+num_predict까지 기다리지 않는다. 지표에 첫 토큰까지 시간(TTFT)과 절약한 토큰 수가 함께 기록된다.
+"""
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import defaultdict, deque
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_URL = "http://192.168.219.114:11434"
+DEFAULT_MODEL = "exaone3.5:7.8b"
+
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "0.5"))
+# 커넥션 풀 크기 — 동시 호출 수(TAGGER_PARALLELISM 등)보다 작으면 초과분은 매번 새 연결을 맺는다
+LLM_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "16"))
+# stop 조건이 있는 호출을 스트리밍으로 받아 조기 종료할지 (0이면 항상 응답 전체를 기다림)
+LLM_STREAM = os.getenv("LLM_STREAM", "1") != "0"
+# 서킷 브레이커: 연속 실패 N회면 open / 이 시간(초)보다 느린 성공 응답도 실패로 셈 / open 후 시험 호출까지 대기(초)
+# 지연 기준은 기본 타임아웃(LLM_TIMEOUT) 호출 기준 — 타임아웃을 늘려 잡은 호출(배치 태깅 등)은 같은 비율로 늘어난다
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "3"))
+LLM_BREAKER_SLOW_SECONDS = float(os.getenv("LLM_BREAKER_SLOW_SECONDS", "15"))
+LLM_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+_LATENCY_WINDOW = 1000  # 호출처별로 최근 N건의 지연만 보관해 분위수 계산
+
+
+def first_line_complete(text: str) -> bool:
+    """앞 공백을 제외한 첫 줄이 줄바꿈으로 끝났는지 — 첫 줄만 파싱하는 호출의 stop 조건."""
+    return "\n" in text.lstrip()
+
+
+class LLMError(Exception):
+    """재시도 후에도 LLM 응답을 받지 못한 경우."""
+
+
+class CircuitOpenError(LLMError):
+    """서킷 브레이커가 열려 있어 호출하지 않고 거절한 경우."""
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커. 스레드 안전.
+
+    closed    → 정상 호출. 실패(또는 slow_seconds 초과 응답)가 failure_threshold회 연속되면 open
+    open      → 모든 호출 즉시 거절. reset_seconds가 지나면 다음 호출 1건을 시험 호출로 통과(half_open)
+    half_open → 시험 호출 결과가 성공이면 closed, 실패면 다시 open (나머지 호출은 계속 거절)
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = LLM_BREAKER_FAILURES,
+                 slow_seconds: float = LLM_BREAKER_SLOW_SECONDS,
+                 reset_seconds: float = LLM_BREAKER_RESET_SECONDS, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.slow_seconds = slow_seconds
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """지금 호출하면 거절되는지 여부. 시험 호출 시점이 되었으면 False (호출해서 복구를 확인해야 하므로)."""
+        with self._lock:
+            if self._state == self.OPEN:
+                return self._clock() - self._opened_at < self.reset_seconds
+            return self._state == self.HALF_OPEN and self._probe_in_flight
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_seconds:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+                logging.info("[llm] 서킷 half-open — 시험 호출 1건 허용")
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, latency: float, slow_seconds: float = None):
+        """성공 응답 기록. slow_seconds(기본 self.slow_seconds)보다 느리면 실패로 센다."""
+        if latency > (slow_seconds or self.slow_seconds):
+            self.record_failure(f"지연 응답 {latency:.1f}초")
+            return
+        with self._lock:
+            if self._state != self.CLOSED:
+                logging.warning(f"[llm] 서킷 closed — LLM 응답 복구 (open 중 거절 {self.rejected}건 누적)")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, reason: str = ""):
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or (
+                    self._state == self.CLOSED and self._failures >= self.failure_threshold):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self.times_opened += 1
+                logging.warning(
+                    f"[llm] 서킷 open — 연속 실패 {self._failures}회 ({reason}), "
+                    f"{self.reset_seconds:.0f}초 동안 LLM 호출 생략"
+                )
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+def _percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class LLMMetrics:
+    """호출처별 LLM 호출 지표. 스레드 안전."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latency = defaultdict(lambda: deque(maxlen=_LATENCY_WINDOW))
+        self._ttft = defaultdict(lambda: deque(maxlen=_LATENCY_WINDOW))
+        self._counters = defaultdict(lambda: defaultdict(int))
+
+    def record(self, caller: str, latency: float, ok: bool, retries: int = 0,
+               prompt_tokens: int = 0, completion_tokens: int = 0,
+               ttft: float = None, tokens_saved: int = 0, stopped_early: bool = False):
+        with self._lock:
+            c = self._counters[caller]
+            c["calls"] += 1
+            c["errors"] += 0 if ok else 1
+            c["retries"] += retries
+            c["prompt_tokens"] += prompt_tokens
+            c["completion_tokens"] += completion_tokens
+            c["latency_total"] += latency
+            c["early_stops"] += 1 if stopped_early else 0
+            c["tokens_saved"] += tokens_saved
+            self._latency[caller].append(latency)
+            if ttft is not None:
+                self._ttft[caller].append(ttft)
+
+    def snapshot(self) -> dict:
+        """{caller: {calls, errors, retries, avg_ms, p50_ms, p95_ms, ttft_p50_ms, ttft_p95_ms,
+        prompt_tokens, completion_tokens, early_stops, tokens_saved}}"""
+        with self._lock:
+            result = {}
+            for caller, c in self._counters.items():
+                window = list(self._latency[caller])
+                ttft = list(self._ttft[caller])
+                result[caller] = {
+                    "calls": c["calls"],
+                    "errors": c["errors"],
+                    "retries": c["retries"],
+                    "avg_ms": round(c["latency_total"] / c["calls"] * 1000, 1) if c["calls"] else 0.0,
+                    "p50_ms": round(_percentile(window, 0.50) * 1000, 1),
+                    "p95_ms": round(_percentile(window, 0.95) * 1000, 1),
+                    "ttft_p50_ms": round(_percentile(ttft, 0.50) * 1000, 1),
+                    "ttft_p95_ms": round(_percentile(ttft, 0.95) * 1000, 1),
+                    "prompt_tokens": c["prompt_tokens"],
+                    "completion_tokens": c["completion_tokens"],
+                    "early_stops": c["early_stops"],
+                    "tokens_saved": c["tokens_saved"],
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._latency.clear()
+            self._ttft.clear()
+            self._counters.clear()
+
+    def log_summary(self):
+        for caller, s in sorted(self.snapshot().items()):
+            logging.info(
+                f"[llm] {caller}: {s['calls']}회 (오류 {s['errors']}, 재시도 {s['retries']}) "
+                f"avg {s['avg_ms']}ms / p50 {s['p50_ms']}ms / p95 {s['p95_ms']}ms, "
+                f"TTFT p50 {s['ttft_p50_ms']}ms, 토큰 입력 {s['prompt_tokens']} / 출력 {s['completion_tokens']}, "
+                f"조기 종료 {s['early_stops']}회 (절약 {s['tokens_saved']}토큰)"
+            )
+
+
+class LLMClient:
+    """Ollama 호출 클라이언트. 여러 스레드에서 하나의 인스턴스를 공유해도 된다."""
+
+    def __init__(self, base_url: str = None, model: str = DEFAULT_MODEL, timeout: float = LLM_TIMEOUT,
+                 max_retries: int = LLM_MAX_RETRIES, backoff_base: float = LLM_BACKOFF_BASE,
+                 pool_size: int = LLM_POOL_SIZE, breaker: CircuitBreaker = None, stream: bool = LLM_STREAM):
+        self.base_url = (base_url or os.getenv("OLLAMA_URL") or DEFAULT_URL).rstrip("/")
+        self.model = model
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.stream = stream
+        self.metrics = LLMMetrics()
+        self.breaker = breaker or CircuitBreaker()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @property
+    def generate_url(self) -> str:
+        return f"{self.base_url}/api/generate"
+
+    def _backoff(self, attempt: int) -> float:
+        return self.backoff_base * (2 ** attempt) * (0.5 + random.random() / 2)
+
+    def generate(self, prompt: str, options: dict = None, caller: str = "default",
+                 model: str = None, timeout: float = None, stop=None, slow_seconds: float = None) -> str:
+        """프롬프트 1건을 생성하고 응답 텍스트를 반환.
+        stop(text) -> bool을 주면 스트리밍으로 받다가 True가 되는 시점에 생성을 끊고 그때까지의 텍스트를 반환.
+        slow_seconds보다 느린 성공은 서킷에 실패로 기록 (기본: 브레이커 기준 × timeout / 기본 타임아웃, 줄이지는 않음).
+        재시도 후에도 실패하면 LLMError, 서킷이 열려 있으면 호출 없이 CircuitOpenError.
+        """
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"{caller}: 서킷 open — LLM 호출 생략")
+
+        options = options or {}
+        stream = stop is not None and self.stream
+        timeout = timeout or self.timeout
+        slow_seconds = slow_seconds or self.breaker.slow_seconds * max(1.0, timeout / self.timeout)
+        payload = {
+            "model": model or self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": options,
+        }
+        t0 = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                resp = self.session.post(self.generate_url, json=payload, timeout=timeout, stream=stream)
+                if resp.status_code in _RETRY_STATUS and attempt < self.max_retries:
+                    resp.close()
+                    raise requests.HTTPError(f"{resp.status_code} 응답", response=resp)
+                resp.raise_for_status()
+                if stream:
+                    text, usage = self._read_stream(resp, stop, t0, timeout, options.get("num_predict"))
+                else:
+                    data = resp.json()
+                    text, usage = data["response"], {
+                        "prompt_tokens": data.get("prompt_eval_count", 0),
+                        "completion_tokens": data.get("eval_count", 0),
+                    }
+                latency = time.perf_counter() - t0
+                self.breaker.record_success(latency, slow_seconds)
+                self.metrics.record(caller, latency, ok=True, retries=attempt, **usage)
+                return text
+            except (requests.ConnectionError, requests.HTTPError) as e:
+                # ConnectTimeout은 ConnectionError라 재시도, ReadTimeout은 아래 except로 바로 실패
+                retryable = isinstance(e, requests.ConnectionError) or (
+                    e.response is not None and e.response.status_code in _RETRY_STATUS
+                )
+                if retryable and attempt < self.max_retries and self.breaker.state == CircuitBreaker.CLOSED:
+                    delay = self._backoff(attempt)
+                    attempt += 1
+                    logging.info(f"[llm] {caller} 호출 실패 ({e}) — {delay:.1f}초 후 재시도 {attempt}/{self.max_retries}")
+                    time.sleep(delay)
+                    continue
+                self._fail(caller, t0, attempt, e)
+            except Exception as e:
+                self._fail(caller, t0, attempt, e)
+
+    @staticmethod
+    def _read_stream(resp, stop, t0: float, timeout: float, num_predict: int = None):
+        """Ollama 스트리밍 응답(줄 단위 JSON)을 읽어 (텍스트, 지표 dict) 반환.
+        stop이 True가 되면 응답을 닫아 생성을 중단시킨다. 이 경우 연결은 풀로 돌아가지 않고 새로 맺는다.
+        """
+        pieces = []
+        chunks = 0
+        ttft = None
+        usage = {"prompt_tokens": 0, "completion_tokens": 0}
+        stopped_early = False
+        try:
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise LLMError(chunk["error"])
+                piece = chunk.get("response", "")
+                if piece:
+                    if ttft is None:
+                        ttft = time.perf_counter() - t0
+                    pieces.append(piece)
+                    chunks += 1
+                if chunk.get("done"):
+                    usage = {
+                        "prompt_tokens": chunk.get("prompt_eval_count", 0),
+                        "completion_tokens": chunk.get("eval_count", chunks),
+                    }
+                    continue
+                if piece and stop("".join(pieces)):
+                    stopped_early = True
+                    break
+                # requests의 timeout은 청크 사이 간격에만 적용되므로 전체 시간은 직접 확인
+                if time.perf_counter() - t0 > timeout:
+                    raise requests.ReadTimeout(f"스트리밍 응답 {timeout:.0f}초 초과")
+        finally:
+            resp.close()
+
+        if stopped_early:
+            # Ollama 스트리밍은 청크 1개가 토큰 1개
+            usage = {"prompt_tokens": 0, "completion_tokens": chunks}
+        usage.update(
+            ttft=ttft,
+            stopped_early=stopped_early,
+            tokens_saved=max(0, num_predict - chunks) if stopped_early and num_predict else 0,
+        )
+        return "".join(pieces), usage
+
+    def log_summary(self):
+        """호출 지표와 서킷 상태를 로그로 남김 (배치 스크립트 종료 시 등)."""
+        b = self.breaker.snapshot()
+        logging.info(f"[llm] 서킷 {b['state']} (open {b['times_opened']}회, 거절 {b['rejected']}건)")
+        self.metrics.log_summary()
+
+    def _fail(self, caller, t0, attempt, error):
+        self.breaker.record_failure(f"{type(error).__name__}")
+        self.metrics.record(caller, time.perf_counter() - t0, ok=False, retries=attempt)
+        raise LLMError(f"{caller}: {error}") from error
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> LLMClient:
+    """프로세스 공용 LLMClient (최초 호출 시 생성)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = LLMClient()
+    return _client
+
+
+def llm_available() -> bool:
+    """공용 클라이언트의 서킷이 닫혀 있는지 (또는 시험 호출 시점인지).
+    False면 LLM 단계를 건너뛰고 비LLM 경로로 바로 진행한다.
+    """
+    return not get_client().breaker.is_open
+
+
+def configure(**kwargs) -> LLMClient:
+    """공용 클라이언트를 새 설정으로 교체 (벤치마크에서 대역 서버로 돌릴 때 등). 인자는 LLMClient와 같다."""
+    global _client
+    with _client_lock:
+        _client = LLMClient(**kwargs)
+    return _client
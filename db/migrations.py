@@ -0,0 +1,464 @@
+"""
+버전 기반 스키마 마이그레이션 모듈.
+
+- MIGRATIONS:      (버전, 설명, 적용 함수) 목록. 버전 오름차순으로 한 번씩만 적용된다.
+- migrate():       schema_version 테이블 기준으로 미적용 마이그레이션만 실행
+- ensure_schema(): 프로세스당 1회만 버전을 확인하고, 최신이면 아무 DDL도 실행하지 않음
+
+새 스키마 변경은 기존 함수를 고치지 말고 MIGRATIONS 끝에 새 버전으로 추가한다.
+"""
+import logging
+import threading
+
+# 여러 프로세스(크롤러·봇·CSV 적재)가 동시에 마이그레이션하지 않도록 잡는 advisory lock 키
+_MIGRATION_LOCK_KEY = 73410001
+
+
+def _v1_core_tables(cursor):
+    # 고용형태 차원 테이블
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS employment_types (
+        id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL
+    );
+    """)
+    cursor.executemany("""
+        INSERT INTO employment_types (id, name) VALUES (%s, %s) ON CONFLICT DO NOTHING
+    """, [
+        (1,'정규직'),(2,'계약직'),(3,'인턴'),(4,'파견직'),(5,'프리랜서'),
+        (6,'위촉직'),(7,'도급'),(8,'연수생'),(9,'병역특례'),(10,'아르바이트'),
+    ])
+
+    # 지역 대분류
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS regions (
+        id SERIAL PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL
+    );
+    """)
+
+    # 기업
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS companies (
+        id SERIAL PRIMARY KEY,
+        company_name TEXT UNIQUE NOT NULL
+    );
+    """)
+
+    # 채용 공고
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS recruits (
+        id SERIAL PRIMARY KEY,
+        company_id INTEGER REFERENCES companies(id),
+        announcement_name TEXT,
+        experience INTEGER,
+        education INTEGER,
+        form INTEGER REFERENCES employment_types(id),
+        region_id INTEGER REFERENCES regions(id),
+        subregion_name TEXT,
+        annual_salary INTEGER,
+        deadline DATE,
+        link TEXT,
+        UNIQUE (company_id, announcement_name, deadline)
+    );
+    """)
+
+    # 태그
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tags (
+        id SERIAL PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL
+    );
+    """)
+
+    # 태그-공고 관계
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS recruit_tags (
+        recruit_id INTEGER REFERENCES recruits(id) ON DELETE CASCADE,
+        tag_id INTEGER REFERENCES tags(id) ON DELETE CASCADE,
+        PRIMARY KEY (recruit_id, tag_id)
+    );
+    """)
+
+
+def _v2_recruits_legacy_columns(cursor):
+    # recruits.created_at 컬럼 마이그레이션 (기존 테이블 대응)
+    cursor.execute("""
+    ALTER TABLE recruits
+    ADD COLUMN IF NOT EXISTS created_at TIMESTAMP DEFAULT NOW()
+    """)
+
+    # recruits.region_id 마이그레이션 (기존 테이블 대응)
+    cursor.execute("""
+    ALTER TABLE recruits
+    ADD COLUMN IF NOT EXISTS region_id INTEGER REFERENCES regions(id)
+    """)
+
+    # subregion 비정규화 마이그레이션: subregion_name 컬럼 추가 및 subregions 테이블 제거
+    cursor.execute("""
+    ALTER TABLE recruits
+    ADD COLUMN IF NOT EXISTS subregion_name TEXT
+    """)
+    # 기존 데이터 backfill: subregion_id → subregion_name
+    cursor.execute("""
+    DO $$ BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'recruits' AND column_name = 'subregion_id'
+        ) THEN
+            UPDATE recruits r
+            SET subregion_name = s.name
+            FROM subregions s
+            WHERE r.subregion_id = s.id AND r.subregion_name IS NULL;
+        END IF;
+    END $$;
+    """)
+    cursor.execute("DROP TRIGGER IF EXISTS trg_sync_region_id ON recruits")
+    cursor.execute("DROP FUNCTION IF EXISTS sync_region_id()")
+    cursor.execute("ALTER TABLE recruits DROP COLUMN IF EXISTS subregion_id")
+    cursor.execute("DROP TABLE IF EXISTS subregions CASCADE")
+
+    # recruits.form FK 마이그레이션 (기존 테이블 대응)
+    cursor.execute("""
+    DO $$ BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint WHERE conname = 'fk_recruits_form'
+        ) THEN
+            ALTER TABLE recruits ADD CONSTRAINT fk_recruits_form
+            FOREIGN KEY (form) REFERENCES employment_types(id);
+        END IF;
+    END $$;
+    """)
+
+
+def _v3_bot_and_analytics_tables(cursor):
+    # 알림 발송 이력
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS notification_log (
+        id SERIAL PRIMARY KEY,
+        discord_user_id TEXT NOT NULL,
+        recruit_id INTEGER REFERENCES recruits(id) ON DELETE CASCADE,
+        notified_at TIMESTAMP DEFAULT NOW(),
+        UNIQUE (discord_user_id, recruit_id)
+    );
+    """)
+
+    # 사용자 프로필 (공통 필터)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS user_profiles (
+        discord_user_id TEXT PRIMARY KEY,
+        region TEXT,
+        form INTEGER,
+        max_experience INTEGER,
+        min_annual_salary INTEGER,
+        updated_at TIMESTAMP DEFAULT NOW()
+    );
+    """)
+
+    # 키워드 구독 테이블
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS user_subscriptions (
+        id SERIAL PRIMARY KEY,
+        discord_user_id TEXT NOT NULL,
+        keyword TEXT,
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+    """)
+
+    # 데이터 품질 로그
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS data_quality_log (
+        id SERIAL PRIMARY KEY,
+        batch_id TEXT NOT NULL,
+        company_name TEXT,
+        announcement_name TEXT,
+        field TEXT NOT NULL,
+        rule TEXT NOT NULL,
+        original_value TEXT,
+        parsed_value TEXT,
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+    """)
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS job_market_daily (
+        date DATE PRIMARY KEY,
+        total_valid_jobs INTEGER,
+        new_jobs INTEGER,
+        avg_salary INTEGER,
+        top_tags JSONB,
+        region_dist JSONB,
+        experience_dist JSONB,
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_user_sub_user_id
+        ON user_subscriptions(discord_user_id)
+    """)
+
+
+def _v4_search_indexes(cursor):
+    # 검색 필터 컬럼 인덱스
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_deadline    ON recruits(deadline)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_form        ON recruits(form)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_experience  ON recruits(experience)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_salary      ON recruits(annual_salary)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_region_id   ON recruits(region_id)")
+    # 복합 인덱스: 가장 빈번한 필터 조합 (deadline 필수 + form/experience)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_deadline_form ON recruits(deadline, form)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_deadline_exp  ON recruits(deadline, experience)")
+    # ILIKE 검색용 trigram 인덱스 (pg_trgm 필요)
+    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_name_trgm ON recruits USING gin(announcement_name gin_trgm_ops)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags_name_trgm ON tags USING gin(name gin_trgm_ops)")
+    # 태그 → 공고 방향 JOIN 인덱스 (tag_id 단독 인덱스 없으면 recruit_tags 풀스캔 발생)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruit_tags_tag_id ON recruit_tags(tag_id)")
+
+
+def _v5_tagging_jobs(cursor):
+    # LLM 태깅 작업 큐 — 수집 경로가 적재하고 db/tag_worker.py가 FOR UPDATE SKIP LOCKED로 가져간다
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tagging_jobs (
+        id SERIAL PRIMARY KEY,
+        recruit_id INTEGER NOT NULL UNIQUE REFERENCES recruits(id) ON DELETE CASCADE,
+        status TEXT NOT NULL DEFAULT 'pending',     -- pending / running / done / dead
+        attempts INTEGER NOT NULL DEFAULT 0,
+        run_after TIMESTAMP NOT NULL DEFAULT NOW(), -- 재시도 backoff: 이 시각 이후에만 가져감
+        locked_by TEXT,
+        locked_at TIMESTAMP,
+        last_error TEXT,
+        created_at TIMESTAMP DEFAULT NOW(),
+        updated_at TIMESTAMP DEFAULT NOW()
+    );
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tagging_jobs_pending
+        ON tagging_jobs(run_after, id) WHERE status = 'pending'
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tagging_jobs_running
+        ON tagging_jobs(locked_at) WHERE status = 'running'
+    """)
+
+
+def _v6_llm_tag_cache(cursor):
+    # 공고명 → LLM 태그 캐시 (db/tagger.py). cache_key에 모델·프롬프트 버전이 포함됨
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS llm_tag_cache (
+        cache_key TEXT PRIMARY KEY,
+        tags TEXT[] NOT NULL,
+        model TEXT NOT NULL,
+        prompt_version TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_tag_cache_version ON llm_tag_cache(prompt_version)")
+
+
+def _v7_tagging_runs(cursor):
+    # db/tag_recruits.py 소급 태깅 진행 상황 (실행 이름 × 샤드별 high-water mark)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tagging_runs (
+        run_name TEXT NOT NULL,
+        shard_index INTEGER NOT NULL,
+        shard_count INTEGER NOT NULL,
+        high_water_mark INTEGER NOT NULL DEFAULT 0,  -- 처리 완료한 마지막 recruit_id
+        processed INTEGER NOT NULL DEFAULT 0,
+        tagged INTEGER NOT NULL DEFAULT 0,
+        skipped INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        started_at TIMESTAMP DEFAULT NOW(),
+        updated_at TIMESTAMP DEFAULT NOW(),
+        finished_at TIMESTAMP,
+        PRIMARY KEY (run_name, shard_index, shard_count)
+    );
+    """)
+
+
+def _v8_keyword_expansions(cursor):
+    # 구독·검색 키워드 → LLM 확장 키워드 캐시 (discord_bot/keyword_expander.py)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS keyword_expansions (
+        keyword_norm TEXT NOT NULL,
+        prompt_version TEXT NOT NULL,
+        expansions TEXT[] NOT NULL,
+        model TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT NOW(),
+        refreshed_at TIMESTAMP DEFAULT NOW(),
+        PRIMARY KEY (keyword_norm, prompt_version)
+    );
+    """)
+
+
+def _v9_rerank_scores(cursor):
+    # (키워드, 공고)별 재순위 점수 캐시 (discord_bot/reranker.py). 공고가 삭제되면 함께 삭제
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS rerank_scores (
+        keyword_norm TEXT NOT NULL,
+        prompt_version TEXT NOT NULL,
+        recruit_id INTEGER NOT NULL REFERENCES recruits(id) ON DELETE CASCADE,
+        score REAL NOT NULL,
+        created_at TIMESTAMP DEFAULT NOW(),
+        PRIMARY KEY (keyword_norm, prompt_version, recruit_id)
+    );
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_rerank_scores_recruit ON rerank_scores(recruit_id)")
+
+
+def _v10_short_grams(cursor):
+    # 1~2글자 검색어용 n-gram 배열 — pg_trgm은 3글자 미만 검색어에 인덱스를 쓰지 못한다 ("AI", "보안", "신입").
+    # 공백이 들어간 gram은 제외 (검색 토큰은 공백으로 나뉜 단어)
+    cursor.execute("""
+    CREATE OR REPLACE FUNCTION short_grams(t TEXT) RETURNS TEXT[]
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT COALESCE(array_agg(DISTINCT g), '{}')
+        FROM (
+            SELECT substr(lower(t), i, n) AS g
+            FROM generate_series(1, 2) AS n, generate_series(1, char_length(t) - n + 1) AS i
+        ) s
+        WHERE g !~ '[[:space:]]'
+    $$;
+    """)
+    # 생성 컬럼이므로 수집 경로(행별·bulk)·CSV 적재 모두 별도 코드 없이 갱신된다.
+    # 태그의 1~2글자 검색은 v11의 recruits.tag_grams가 맡으므로 tags 테이블에는 두지 않는다
+    cursor.execute("""
+        ALTER TABLE recruits ADD COLUMN IF NOT EXISTS title_grams TEXT[]
+        GENERATED ALWAYS AS (short_grams(announcement_name)) STORED
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_title_grams ON recruits USING gin(title_grams)")
+
+
+def _v11_recruit_tag_names(cursor):
+    # 공고별 태그 이름 비정규화 — 검색·결과 조회가 recruit_tags/tags JOIN 없이 태그를 읽는다.
+    # recruit_tags가 원본이며 수집 경로·태거·normalize_existing_tags가 함께 갱신한다 (db/io.py sync_tag_names)
+    cursor.execute("""
+    CREATE OR REPLACE FUNCTION tag_search_text(names TEXT[]) RETURNS TEXT
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT array_to_string(names, E'\\n')
+    $$;
+    """)
+    cursor.execute("ALTER TABLE recruits ADD COLUMN IF NOT EXISTS tag_names TEXT[] NOT NULL DEFAULT '{}'")
+    cursor.execute("""
+        UPDATE recruits r
+        SET tag_names = s.names
+        FROM (
+            SELECT rt.recruit_id, array_agg(t.name ORDER BY t.id) AS names
+            FROM recruit_tags rt
+            JOIN tags t ON t.id = rt.tag_id
+            GROUP BY rt.recruit_id
+        ) s
+        WHERE s.recruit_id = r.id
+    """)
+    # 태그 1~2글자 gram (short_grams는 공백 gram을 버리므로 줄바꿈으로 이은 태그 사이에 걸친 gram은 생기지 않는다)
+    cursor.execute("""
+        ALTER TABLE recruits ADD COLUMN IF NOT EXISTS tag_grams TEXT[]
+        GENERATED ALWAYS AS (short_grams(tag_search_text(tag_names))) STORED
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_recruits_tag_grams ON recruits USING gin(tag_grams)")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_recruits_tag_names_trgm
+        ON recruits USING gin(tag_search_text(tag_names) gin_trgm_ops)
+    """)
+
+
+def _v12_tagging_run_failures(cursor):
+    # high-water mark를 지나간 뒤에도 태깅하지 못한 공고 — --resume 때 먼저 재시도
+    cursor.execute("ALTER TABLE tagging_runs ADD COLUMN IF NOT EXISTS failed_ids INTEGER[] NOT NULL DEFAULT '{}'")
+
+
+# 버전 1~4는 기존 create_tables()의 DDL을 그대로 나눈 것 — 모두 IF NOT EXISTS 이므로
+# schema_version이 없는 기존 DB에도 안전하게 적용된다.
+MIGRATIONS = [
+    (1, "핵심 테이블 (employment_types, regions, companies, recruits, tags, recruit_tags)", _v1_core_tables),
+    (2, "recruits 레거시 컬럼 정리 (created_at, region_id, subregion_name, form FK)", _v2_recruits_legacy_columns),
+    (3, "봇·분석 테이블 (notification_log, user_profiles, user_subscriptions, data_quality_log, job_market_daily)", _v3_bot_and_analytics_tables),
+    (4, "검색 인덱스 (필터 컬럼, pg_trgm)", _v4_search_indexes),
+    (5, "LLM 태깅 작업 큐 (tagging_jobs)", _v5_tagging_jobs),
+    (6, "공고명 태그 캐시 (llm_tag_cache)", _v6_llm_tag_cache),
+    (7, "소급 태깅 진행 상황 (tagging_runs)", _v7_tagging_runs),
+    (8, "키워드 확장 캐시 (keyword_expansions)", _v8_keyword_expansions),
+    (9, "재순위 점수 캐시 (rerank_scores)", _v9_rerank_scores),
+    (10, "1~2글자 검색어용 n-gram 배열 (recruits.title_grams)", _v10_short_grams),
+    (11, "공고 태그 이름 비정규화 (recruits.tag_names, tag_grams)", _v11_recruit_tag_names),
+    (12, "소급 태깅 실패 공고 기록 (tagging_runs.failed_ids)", _v12_tagging_run_failures),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+
+def current_version(cursor) -> int:
+    """DB에 적용된 최신 스키마 버전. schema_version 테이블이 없으면 0."""
+    cursor.execute("SELECT to_regclass('schema_version')")
+    if cursor.fetchone()[0] is None:
+        return 0
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+    return cursor.fetchone()[0]
+
+
+def migrate(conn) -> int:
+    """미적용 마이그레이션을 버전 순으로 실행. 실행한 마이그레이션 수 반환.
+    각 버전은 schema_version 기록과 함께 개별 트랜잭션으로 커밋된다.
+    """
+    cursor = conn.cursor()
+    if current_version(cursor) >= LATEST_VERSION:
+        conn.commit()
+        return 0
+
+    cursor.execute("SELECT pg_advisory_lock(%s)", (_MIGRATION_LOCK_KEY,))
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TIMESTAMP DEFAULT NOW()
+            )
+        """)
+        conn.commit()
+
+        # 락 대기 중 다른 프로세스가 적용했을 수 있으므로 다시 확인
+        version = current_version(cursor)
+        applied = 0
+        for migration_version, description, apply in MIGRATIONS:
+            if migration_version <= version:
+                continue
+            logging.info(f"[migration] v{migration_version} 적용 시작: {description}")
+            try:
+                apply(cursor)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                    (migration_version, description),
+                )
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logging.error(f"[migration] v{migration_version} 적용 실패: {e}")
+                raise
+            applied += 1
+            logging.info(f"[migration] v{migration_version} 적용 완료")
+        return applied
+    finally:
+        cursor.execute("SELECT pg_advisory_unlock(%s)", (_MIGRATION_LOCK_KEY,))
+        conn.commit()
+
+
+def ensure_schema(conn):
+    """프로세스당 1회만 스키마 버전을 확인·적용. 이후 호출은 DB에 접근하지 않는다."""
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        migrate(conn)
+        _schema_ready = True
+
+
+def reset_schema_state():
+    """테이블을 직접 삭제한 뒤 다음 ensure_schema() 호출에서 다시 확인하도록 플래그 초기화."""
+    global _schema_ready
+    _schema_ready = False
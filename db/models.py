@@ -1,6 +1,7 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Table, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Table, JSON, Computed
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import relationship, deferred
 from typing import List, Optional
 from datetime import date, datetime
 from pydantic import BaseModel, ConfigDict
@@ -44,6 +45,11 @@ class Recruit(Base):
     annual_salary = Column(Integer)
     deadline = Column(Date)
     link = Column(String)
+    # 공고명 1~2글자 n-gram (DB 생성 컬럼, GIN 인덱스) — 짧은 검색어 조건에만 쓰고 조회 시에는 읽지 않음
+    title_grams = deferred(Column(ARRAY(Text), Computed("short_grams(announcement_name)", persisted=True)))
+    # 태그 이름 (recruit_tags 비정규화) — 결과 조회·검색은 JOIN 없이 이 컬럼을 읽는다
+    tag_names = Column(ARRAY(Text), nullable=False, server_default="{}")
+    tag_grams = deferred(Column(ARRAY(Text), Computed("short_grams(tag_search_text(tag_names))", persisted=True)))
 
     created_at = Column(DateTime, default=datetime.now)
 
@@ -0,0 +1,284 @@
+"""
+유효 공고(마감 미도래) 인메모리 검색 인덱스.
+
+search_recruits_by_filter()와 같은 조건·결과를 DB 왕복 없이 돌려준다 (SEARCH_INDEX=1이면 db/io.py가 먼저 사용).
+
+- 공고명·태그: 1~3글자 n-gram → 공고 위치 postings (정렬된 numpy int32 배열).
+  3글자 이하 토큰은 postings가 곧 결과이고, 더 긴 토큰은 3-gram postings 교집합이 후보(상위 집합)다.
+  후보가 섞인 질의는 id 순으로 후보를 훑으며 실제 부분 문자열 일치를 확인하고 limit건에서 멈춘다.
+  ILIKE '%token%'과 같은 대소문자 무시 부분 일치이며, 태그는 Tag.name ILIKE처럼 태그 하나 안에서
+  일치해야 한다 (여러 태그에 걸친 일치는 인정하지 않음).
+- 마감일·연봉·경력·고용형태·지역·기업: 공고 위치별 numpy 배열 → 조건마다 불리언 마스크.
+- 공고 위치는 id 내림차순 — 마스크에서 앞쪽 limit건이 곧 ORDER BY id DESC LIMIT 결과.
+
+인덱스는 첫 검색 때 호출 스레드에서 만들고, 이후 SEARCH_INDEX_REFRESH_SECONDS마다 백그라운드에서 다시 만든다
+(갱신 중·갱신 실패 시 기존 인덱스로 응답). 마감일은 검색 시점 날짜로 거르므로 갱신 사이에 마감된 공고는
+나오지 않고, 갱신 사이에 새로 수집·태깅된 내용은 다음 갱신부터 반영된다.
+"""
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+from typing import List, Optional
+
+import numpy as np
+
+from .models import RecruitOut
+
+SEARCH_INDEX_ENABLED = os.getenv("SEARCH_INDEX", "0") == "1"
+REFRESH_SECONDS = float(os.getenv("SEARCH_INDEX_REFRESH_SECONDS", "300"))
+
+MAX_GRAM = 3
+# 긴 토큰은 postings가 가장 짧은 3-gram 몇 개만 교집합 — 나머지는 부분 문자열 확인이 거른다
+MAX_INTERSECT = 4
+NULL = -1  # 정수 컬럼의 NULL 표시 (연봉·경력·고용형태·지역·기업 코드는 음수가 없음)
+_EMPTY = np.empty(0, dtype=np.int32)
+
+
+def _grams(text: str) -> set:
+    """text의 1~MAX_GRAM글자 부분 문자열 전체."""
+    return {text[i:i + n] for n in range(1, MAX_GRAM + 1) for i in range(len(text) - n + 1)}
+
+
+def _codes(values: list) -> tuple[np.ndarray, list[str]]:
+    """문자열 리스트 → (위치별 코드 배열, 코드별 소문자 이름). None은 NULL 코드."""
+    names, code_of, codes = [], {}, []
+    for value in values:
+        if value is None:
+            codes.append(NULL)
+            continue
+        if value not in code_of:
+            code_of[value] = len(names)
+            names.append(value.lower())
+        codes.append(code_of[value])
+    return np.array(codes, dtype=np.int32), names
+
+
+def _name_mask(codes: np.ndarray, names: list[str], needle: str) -> np.ndarray:
+    """이름에 needle(대소문자 무시)이 들어간 코드의 공고 마스크. 조회표 끝 칸(False)이 NULL 코드(-1)를 받는다."""
+    needle = needle.lower()
+    table = np.zeros(len(names) + 1, dtype=bool)
+    table[[code for code, name in enumerate(names) if needle in name]] = True
+    return table[codes]
+
+
+def _int_column(values: list) -> np.ndarray:
+    return np.array([NULL if v is None else v for v in values], dtype=np.int64)
+
+
+class SearchIndex:
+    """공고 리스트로 만든 읽기 전용 인덱스. 갱신은 새 인스턴스로 교체한다."""
+
+    def __init__(self, recruits: List[RecruitOut]):
+        self.recruits = sorted(recruits, key=lambda r: r.id, reverse=True)
+        self.built_at = time.time()
+        self.titles = [(r.announcement_name or "").lower() for r in self.recruits]
+        self.tags = [tuple(t.lower() for t in r.tags) for r in self.recruits]
+
+        title_postings, tag_postings = defaultdict(list), defaultdict(list)
+        for pos, (title, tags) in enumerate(zip(self.titles, self.tags)):
+            for gram in _grams(title):
+                title_postings[gram].append(pos)
+            for gram in set().union(*map(_grams, tags)):
+                tag_postings[gram].append(pos)
+        # 위치를 오름차순으로 넣었으므로 그대로 정렬된 배열
+        self.title_postings = {g: np.array(p, dtype=np.int32) for g, p in title_postings.items()}
+        self.tag_postings = {g: np.array(p, dtype=np.int32) for g, p in tag_postings.items()}
+
+        self.deadline = np.array([r.deadline.toordinal() for r in self.recruits], dtype=np.int32)
+        self.annual_salary = _int_column([r.annual_salary for r in self.recruits])
+        self.experience = _int_column([r.experience for r in self.recruits])
+        self.form = _int_column([r.form for r in self.recruits])
+        self.region_codes, self.region_names = _codes([r.region_name for r in self.recruits])
+        self.company_codes, self.company_names = _codes([r.company_name for r in self.recruits])
+
+    @property
+    def size(self) -> int:
+        return len(self.recruits)
+
+    def stats(self) -> dict:
+        return {
+            "recruits": self.size,
+            "title_grams": len(self.title_postings),
+            "tag_grams": len(self.tag_postings),
+            "postings": sum(len(p) for p in self.title_postings.values())
+                        + sum(len(p) for p in self.tag_postings.values()),
+        }
+
+    # ── 키워드 ──────────────────────────────
+    def _postings_mask(self, token: str, postings: dict) -> tuple[np.ndarray, bool]:
+        """token(소문자)을 포함하는 공고 마스크와 정확 여부. 긴 토큰은 3-gram 교집합(상위 집합)이라 정확하지 않다."""
+        mask = np.zeros(self.size, dtype=bool)
+        if len(token) <= MAX_GRAM:
+            mask[postings.get(token, _EMPTY)] = True
+            return mask, True
+        lists = sorted(
+            (postings.get(token[i:i + MAX_GRAM], _EMPTY) for i in range(len(token) - MAX_GRAM + 1)),
+            key=len,
+        )
+        mask[lists[0]] = True
+        for other in lists[1:MAX_INTERSECT]:
+            other_mask = np.zeros(self.size, dtype=bool)
+            other_mask[other] = True
+            mask &= other_mask
+        return mask, False
+
+    def _term_mask(self, term: str, use_tags: bool) -> tuple[np.ndarray, bool]:
+        """공고명 ILIKE '%term%' (use_tags면 OR 태그 ILIKE '%term%') 후보 마스크와 정확 여부."""
+        term = term.lower()
+        mask, exact = self._postings_mask(term, self.title_postings)
+        if use_tags:
+            tag_mask, tag_exact = self._postings_mask(term, self.tag_postings)
+            mask |= tag_mask
+            exact = exact and tag_exact
+        return mask, exact
+
+    def _has(self, pos: int, term: str, use_tags: bool) -> bool:
+        term = term.lower()
+        return term in self.titles[pos] or (use_tags and any(term in tag for tag in self.tags[pos]))
+
+    def _keyword_condition(self, terms: list, require_all: bool, use_tags: bool):
+        """검색어 조건 → (후보 마스크, 공고 위치 확인 함수 또는 None(후보가 곧 결과)). 검색어가 없으면 (None, None)."""
+        if not terms:
+            return None, None
+        mask, exact = self._term_mask(terms[0], use_tags)
+        for term in terms[1:]:
+            term_mask, term_exact = self._term_mask(term, use_tags)
+            if require_all:
+                mask &= term_mask
+            else:
+                mask |= term_mask
+            exact = exact and term_exact
+        if exact:
+            return mask, None
+        combine = all if require_all else any
+        return mask, lambda pos: combine(self._has(pos, term, use_tags) for term in terms)
+
+    def _score(self, pos: int, terms: list) -> int:
+        """검색어(소문자)별로 공고명에 있으면 TITLE_WEIGHT, 태그에만 있으면 TAG_WEIGHT를 더한 점수."""
+        from .io import TAG_WEIGHT, TITLE_WEIGHT
+        return sum(
+            TITLE_WEIGHT if term in self.titles[pos] else TAG_WEIGHT if any(term in tag for tag in self.tags[pos]) else 0
+            for term in terms
+        )
+
+    # ── 필터 ──────────────────────────────
+    def _filter_mask(self, today: date, min_deadline, min_annual_salary, company_name,
+                     max_experience, form, region) -> np.ndarray:
+        mask = self.deadline >= today.toordinal()
+        if min_deadline:
+            mask &= self.deadline >= min_deadline.toordinal()
+        if min_annual_salary:
+            mask &= self.annual_salary >= min_annual_salary
+        if company_name:
+            mask &= _name_mask(self.company_codes, self.company_names, company_name)
+        if max_experience is not None:
+            mask &= (self.experience == NULL) | (self.experience <= max_experience)
+        if form is not None:
+            mask &= self.form == form
+        if region:
+            mask &= _name_mask(self.region_codes, self.region_names, region)
+        return mask
+
+    def search(
+        self,
+        keyword: str = None,
+        min_deadline=None,
+        min_annual_salary: int = None,
+        company_name: str = None,
+        max_experience: int = None,
+        form: int = None,
+        region: str = None,
+        limit: int = 5,
+        expanded_keywords: list = None,
+        use_tags: bool = True,
+        expand_below: int = 0,
+        scored: bool = False,
+        today: date = None,
+    ) -> List[RecruitOut]:
+        """search_recruits_by_filter()와 같은 계약 (AND 결과 부족 시 OR 폴백, expand_below, scored 정렬 포함)."""
+        base = self._filter_mask(today or date.today(), min_deadline, min_annual_salary, company_name,
+                                 max_experience, form, region)
+
+        def _run(terms: list, require_all: bool, with_tags: bool) -> List[int]:
+            keyword_mask, verify = self._keyword_condition(terms, require_all, with_tags)
+            candidates = np.flatnonzero(base if keyword_mask is None else base & keyword_mask)
+            if verify is None:
+                return candidates[:limit].tolist()
+            positions = []
+            for pos in candidates:
+                if len(positions) >= limit:
+                    break
+                if verify(pos):
+                    positions.append(int(pos))
+            return positions
+
+        # 확장 키워드 OR 매칭은 use_tags와 무관하게 태그도 본다 (SQL 경로와 동일)
+        tokens = keyword.split() if keyword else []
+        if expanded_keywords and (not expand_below or not tokens):
+            positions = _run(expanded_keywords, False, True)
+        else:
+            positions = _run(tokens, True, use_tags)
+            fallback_threshold = 3 if use_tags else 1
+            if len(positions) < fallback_threshold and len(tokens) > 1:
+                positions = _run(tokens, False, use_tags)
+            if expanded_keywords and len(positions) < expand_below:
+                positions = _run(expanded_keywords, False, True)
+
+        if scored:
+            from .io import score_terms
+            terms = [term.lower() for term in score_terms(keyword, expanded_keywords)]
+            # 안정 정렬 — 같은 점수는 기존 id 내림차순 유지
+            positions.sort(key=lambda pos: -self._score(pos, terms))
+        return [self.recruits[pos] for pos in positions]
+
+
+# ──────────────────────────────
+# 프로세스 공유 인덱스
+# ──────────────────────────────
+_index: Optional[SearchIndex] = None
+_next_refresh = 0.0
+_lock = threading.Lock()
+
+
+def load_index() -> SearchIndex:
+    """DB에서 유효 공고를 한 번에 읽어 인덱스 구축."""
+    from sqlalchemy import text
+    from .io import RECRUIT_OUT_SQL, SessionLocal
+
+    t0 = time.perf_counter()
+    session = SessionLocal()
+    try:
+        rows = session.execute(
+            text(RECRUIT_OUT_SQL + " WHERE r.deadline >= CURRENT_DATE ORDER BY r.id DESC")
+        ).mappings().all()
+    finally:
+        session.close()
+    index = SearchIndex([RecruitOut(**row) for row in rows])
+    logging.info(f"[search_index] 인덱스 구축: {index.stats()}, {time.perf_counter() - t0:.2f}초")
+    return index
+
+
+def _refresh():
+    global _index
+    try:
+        _index = load_index()
+    except Exception as e:
+        logging.warning(f"[search_index] 인덱스 갱신 실패 — 기존 인덱스 유지: {e}")
+
+
+def get_index() -> SearchIndex:
+    """현재 인덱스. 없으면 지금 만들고, 갱신 주기가 지났으면 백그라운드 갱신을 시작한 뒤 기존 인덱스를 반환."""
+    global _index, _next_refresh
+    with _lock:
+        if _index is None:
+            _index = load_index()
+            _next_refresh = time.time() + REFRESH_SECONDS
+            return _index
+        if time.time() < _next_refresh:
+            return _index
+        _next_refresh = time.time() + REFRESH_SECONDS
+    threading.Thread(target=_refresh, daemon=True, name="search-index-refresh").start()
+    return _index
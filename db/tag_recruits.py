@@ -1,72 +1,277 @@
 """
 기존 DB 공고에 EXAONE 의미 태그를 소급 적용하는 배치 스크립트.
 
+id 오름차순으로 batch-size건씩 가져와 태깅하고, 배치마다 처리한 마지막 id(high-water mark)와
+태깅하지 못한 공고 id(failed_ids)를 tagging_runs에 기록한다. 중단 후 --resume 으로 같은 실행 이름을 다시
+실행하면 실패한 공고를 먼저 재시도하고 그 다음 id부터 이어간다. 실패한 공고가 남아 있으면 완료로 표시하지 않는다.
+--shard i/n 은 recruit_id % n == i 인 공고만 처리하므로, 여러 서버에서 n개로 나눠 같은 Ollama 풀을 공유할 수 있다.
+LLM 서킷이 열려 있으면 배치를 보내지 않고 기다리며, 장애가 --max-wait초 넘게 이어지면 진행 기록을 남기고 중단한다.
+
 Usage:
     python db/tag_recruits.py                  # 마감 유효 공고 전체
     python db/tag_recruits.py --limit 1000     # 1000건만
     python db/tag_recruits.py --batch-size 50  # 배치 크기 조정
+    python db/tag_recruits.py --parallelism 8  # 동시 LLM 호출 수 (Ollama OLLAMA_NUM_PARALLEL 이하)
+    python db/tag_recruits.py --run retag-exaone --shard 0/4 --resume   # 4대 중 0번, 이어서 실행
 """
 import argparse
 import logging
 import sys
 import os
-from datetime import date
+import time
+from datetime import date, timedelta
 from dotenv import load_dotenv
 
 load_dotenv(override=True)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import log_config
+from sqlalchemy import func, text
+from db.base import ensure_tables
 from db.io import SessionLocal
+from db.llm_client import get_client, llm_available
 from db.models import Recruit
 from db.tagger import tag_recruit_batch
 
 
+def parse_shard(value: str) -> tuple[int, int]:
+    """'i/n' → (i, n). 0 <= i < n."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"--shard 형식은 i/n 입니다: {value}")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"--shard 범위 오류 (0 <= i < n): {value}")
+    return index, count
+
+
+def _target_query(session, args, shard_index, shard_count):
+    query = session.query(Recruit.id)
+    if args.date:
+        query = query.filter(func.date(Recruit.created_at) == args.date)
+    else:
+        query = query.filter(Recruit.deadline >= date.today())
+    if shard_count > 1:
+        query = query.filter(Recruit.id % shard_count == shard_index)
+    return query
+
+
+def load_checkpoint(session, run_name, shard_index, shard_count):
+    row = session.execute(text("""
+        SELECT high_water_mark, processed, tagged, skipped, failed, failed_ids, finished_at
+        FROM tagging_runs
+        WHERE run_name = :run AND shard_index = :i AND shard_count = :n
+    """), {"run": run_name, "i": shard_index, "n": shard_count}).first()
+    session.commit()
+    return row
+
+
+def save_checkpoint(session, run_name, shard_index, shard_count, high_water_mark, totals, failed_ids=(),
+                    finished=False):
+    session.execute(text("""
+        INSERT INTO tagging_runs
+            (run_name, shard_index, shard_count, high_water_mark, processed, tagged, skipped, failed, failed_ids,
+             finished_at)
+        VALUES (:run, :i, :n, :hwm, :processed, :tagged, :skipped, :failed, :failed_ids,
+                CASE WHEN :finished THEN NOW() END)
+        ON CONFLICT (run_name, shard_index, shard_count) DO UPDATE SET
+            high_water_mark = EXCLUDED.high_water_mark,
+            processed = EXCLUDED.processed,
+            tagged = EXCLUDED.tagged,
+            skipped = EXCLUDED.skipped,
+            failed = EXCLUDED.failed,
+            failed_ids = EXCLUDED.failed_ids,
+            finished_at = EXCLUDED.finished_at,
+            updated_at = NOW()
+    """), {"run": run_name, "i": shard_index, "n": shard_count, "hwm": high_water_mark,
+           "failed_ids": sorted(failed_ids), "finished": finished, **totals})
+    session.commit()
+
+
+def checkpoint_state(checkpoint) -> tuple[int, dict, set]:
+    """tagging_runs 행 → (high-water mark, 누적 집계, 미완료 공고 id). 행이 없으면 처음 상태."""
+    if checkpoint is None:
+        return 0, {"processed": 0, "tagged": 0, "skipped": 0, "failed": 0}, set()
+    totals = {k: getattr(checkpoint, k) for k in ("processed", "tagged", "skipped", "failed")}
+    return checkpoint.high_water_mark, totals, set(checkpoint.failed_ids or [])
+
+
+def record_batch(totals: dict, failed_ids: set, batch: list[int], stats: dict, retry: bool = False):
+    """tag_recruit_batch 결과를 누적 집계와 미완료 공고 집합에 반영 (제자리 갱신).
+    retry=True(미완료 공고 재시도)면 처리 건수는 늘리지 않는다. failed는 아직 미완료인 공고 수.
+    """
+    totals["tagged"] += stats["tagged"]
+    totals["skipped"] += stats["skipped"]
+    if not retry:
+        totals["processed"] += len(batch)
+    failed_ids.difference_update(batch)
+    failed_ids.update(stats["failed_ids"])
+    totals["failed"] = len(failed_ids)
+
+
+class OutageGuard:
+    """배치 전 LLM 서킷 확인 — 열려 있으면 서킷이 닫힐(시험 호출 시점이 될) 때까지 대기.
+
+    서킷이 열린 채 배치를 보내면 전부 즉시 거절되어 high-water mark만 전진하고 공고가 failed_ids로 쌓인다.
+    장애는 서킷이 처음 열린 것을 본 때부터 서킷 거절 없이 배치가 끝날 때까지로 보고,
+    max_wait초를 넘기면 ready()가 False(중단)를 반환한다.
+    """
+
+    def __init__(self, max_wait: float, poll_seconds: float = 5.0):
+        self.max_wait = max_wait
+        self.poll_seconds = poll_seconds
+        self.since = None
+
+    def ready(self, last_stats: dict = None) -> bool:
+        rejected = bool(last_stats and last_stats.get("circuit_open_ids"))
+        if not rejected and llm_available():
+            self.since = None
+            return True
+        if self.since is None:
+            self.since = time.monotonic()
+            logging.warning(f"LLM 서킷 open — 최대 {self.max_wait:.0f}초 동안 배치를 멈추고 대기")
+        while not llm_available():
+            remaining = self.since + self.max_wait - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.poll_seconds, remaining))
+        return True
+
+
+def _format_eta(seconds: float) -> str:
+    return str(timedelta(seconds=int(seconds))) if seconds != float("inf") else "--:--:--"
+
+
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("--limit", type=int, default=None, help="처리할 최대 공고 수")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 공고 수")
     parser.add_argument("--batch-size", type=int, default=100, help="한 번에 처리할 건수 (기본 100)")
     parser.add_argument("--date", type=str, default=None, help="특정 수집일 필터 (예: 2026-03-14)")
+    parser.add_argument("--parallelism", type=int, default=None, help="동시 LLM 호출 수 (기본: TAGGER_PARALLELISM)")
+    parser.add_argument("--run", type=str, default=None,
+                        help="실행 이름 — 진행 상황 기록 키 (기본: backfill-<date|active>)")
+    parser.add_argument("--shard", type=parse_shard, default=(0, 1), help="i/n — recruit_id %% n == i 인 공고만 처리")
+    parser.add_argument("--resume", action="store_true", help="같은 실행 이름·샤드의 마지막 처리 id 다음부터 이어서 실행")
+    parser.add_argument("--max-wait", type=float, default=600, help="LLM 장애 시 기다릴 최대 초 (넘기면 중단, 기본 600)")
     args = parser.parse_args()
 
+    shard_index, shard_count = args.shard
+    run_name = args.run or f"backfill-{args.date or 'active'}"
+    ensure_tables()
+
     session = SessionLocal()
     try:
-        from sqlalchemy import func, cast
-        import sqlalchemy as sa
-        query = session.query(Recruit.id).order_by(Recruit.id.asc())
-        if args.date:
-            query = query.filter(func.date(Recruit.created_at) == args.date)
-        else:
-            query = query.filter(Recruit.deadline >= date.today())
-        if args.limit:
-            query = query.limit(args.limit)
-        recruit_ids = [row[0] for row in query.all()]
+        checkpoint = load_checkpoint(session, run_name, shard_index, shard_count)
+        high_water_mark, totals, failed_ids = checkpoint_state(checkpoint if args.resume else None)
+        if checkpoint and args.resume:
+            if checkpoint.finished_at:
+                print(f"[{run_name} {shard_index}/{shard_count}] 이미 완료된 실행입니다 ({checkpoint.finished_at}).")
+                return
+            print(f"--resume: 실패 {len(failed_ids)}건 재시도 후 id {high_water_mark} 이후부터 이어서 실행 "
+                  f"(기존 처리 {totals['processed']}건)")
+        elif checkpoint:
+            logging.warning(f"[{run_name} {shard_index}/{shard_count}] 기존 진행 기록을 덮어쓰고 처음부터 실행합니다.")
+
+        # 재시도 사이에 마감·필터 대상에서 빠진 공고는 더 이상 미완료로 두지 않는다
+        retry_ids = [
+            row[0] for row in
+            _target_query(session, args, shard_index, shard_count)
+            .filter(Recruit.id.in_(failed_ids)).order_by(Recruit.id.asc()).all()
+        ] if failed_ids else []
+        failed_ids = set(retry_ids)
+        totals["failed"] = len(failed_ids)
+        remaining = _target_query(session, args, shard_index, shard_count).filter(Recruit.id > high_water_mark).count()
+        session.commit()
     finally:
         session.close()
 
-    total = len(recruit_ids)
-    logging.info(f"소급 태깅 대상: {total}건 (배치 크기: {args.batch_size})")
-    print(f"소급 태깅 시작: {total}건")
+    guard = OutageGuard(args.max_wait)
+    stats = None
+    stopped = False
+    for start in range(0, len(retry_ids), args.batch_size):
+        if not guard.ready(stats):
+            stopped = True
+            break
+        batch = retry_ids[start:start + args.batch_size]
+        stats = tag_recruit_batch(batch, parallelism=args.parallelism)
+        record_batch(totals, failed_ids, batch, stats, retry=True)
+        session = SessionLocal()
+        try:
+            save_checkpoint(session, run_name, shard_index, shard_count, high_water_mark, totals, failed_ids)
+        finally:
+            session.close()
+    if retry_ids:
+        print(f"실패 공고 재시도: {len(retry_ids)}건 중 {len(retry_ids) - len(failed_ids)}건 완료")
 
-    tagged_total = skipped_total = failed_total = 0
+    total = min(remaining, args.limit) if args.limit else remaining
+    logging.info(
+        f"소급 태깅 대상: {total}건 (실행 {run_name}, 샤드 {shard_index}/{shard_count}, "
+        f"시작 id > {high_water_mark}, 배치 크기 {args.batch_size})"
+    )
+    print(f"소급 태깅 시작: {total}건 [{run_name} 샤드 {shard_index}/{shard_count}]")
 
-    for start in range(0, total, args.batch_size):
-        batch = recruit_ids[start:start + args.batch_size]
-        stats = tag_recruit_batch(batch)
+    done = 0
+    started = time.perf_counter()
+    live = "\r" if sys.stdout.isatty() else "\n"
+    while not stopped and done < total:
+        if not guard.ready(stats):
+            stopped = True
+            break
+        session = SessionLocal()
+        try:
+            batch = [
+                row[0] for row in
+                _target_query(session, args, shard_index, shard_count)
+                .filter(Recruit.id > high_water_mark)
+                .order_by(Recruit.id.asc())
+                .limit(min(args.batch_size, total - done))
+                .all()
+            ]
+            session.commit()
+            if not batch:
+                break
 
-        tagged_total += stats["tagged"]
-        skipped_total += stats["skipped"]
-        failed_total += stats["failed"]
+            stats = tag_recruit_batch(batch, parallelism=args.parallelism)
+            record_batch(totals, failed_ids, batch, stats)
+            done += len(batch)
+            # 실패한 공고는 failed_ids로 따로 남기므로 mark는 배치 끝까지 전진
+            high_water_mark = batch[-1]
+            save_checkpoint(session, run_name, shard_index, shard_count, high_water_mark, totals, failed_ids)
+        finally:
+            session.close()
 
-        done = start + len(batch)
+        elapsed = time.perf_counter() - started
+        rate = done / elapsed if elapsed > 0 else 0
+        eta = (total - done) / rate if rate > 0 else float("inf")
         logging.info(
-            f"[{done}/{total}] 태깅됨: {tagged_total} / 변화없음: {skipped_total} / 실패: {failed_total}"
+            f"[{done}/{total}] id≤{high_water_mark} 태깅됨: {totals['tagged']} / 변화없음: {totals['skipped']} / "
+            f"실패: {totals['failed']} ({rate:.2f}건/초, ETA {_format_eta(eta)})"
         )
         print(
-            f"[{done:>5}/{total}] 태깅됨: {tagged_total} | 변화없음: {skipped_total} | 실패: {failed_total}"
+            f"[{done:>6}/{total}] {done / total:6.1%} | {rate:6.2f}건/초 | ETA {_format_eta(eta)} | "
+            f"태깅됨 {totals['tagged']} · 변화없음 {totals['skipped']} · 실패 {totals['failed']} · "
+            f"캐시 적중 {stats['cache_hit_rate']:.0%}",
+            end=live, flush=True,
         )
 
-    print(f"\n완료 — 태깅됨: {tagged_total} / 변화없음: {skipped_total} / 실패: {failed_total}")
+    # limit으로 끊지 않고 대상을 모두 훑었고 미완료 공고도 없으면 완료 표시
+    swept = not stopped and (not args.limit or done < args.limit)
+    if swept and not failed_ids:
+        session = SessionLocal()
+        try:
+            save_checkpoint(session, run_name, shard_index, shard_count, high_water_mark, totals, finished=True)
+        finally:
+            session.close()
+
+    print(f"\n{'중단' if stopped else '완료'} — 태깅됨: {totals['tagged']} / 변화없음: {totals['skipped']} / 실패: {totals['failed']} "
+          f"(이번 실행 {done}건, {time.perf_counter() - started:.0f}초)")
+    if stopped:
+        print(f"LLM 서킷이 {args.max_wait:.0f}초 넘게 열려 있어 중단했습니다 (id {high_water_mark}까지 처리) — "
+              f"--run {run_name} --shard {shard_index}/{shard_count} --resume 으로 이어서 실행하세요.")
+    elif failed_ids:
+        print(f"태깅하지 못한 공고 {len(failed_ids)}건 — --run {run_name} --shard {shard_index}/{shard_count} "
+              f"--resume 으로 재시도하세요.")
+    get_client().log_summary()
 
 
 if __name__ == "__main__":
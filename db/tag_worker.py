@@ -0,0 +1,165 @@
+"""
+tagging_jobs 큐를 소비하는 LLM 태깅 워커.
+
+수집 경로(batch_to_db)는 신규 공고를 tagging_jobs에 등록만 하고, 이 워커가 가져가 태깅한다.
+작업은 FOR UPDATE SKIP LOCKED로 가져가므로 같은 서버의 여러 스레드·프로세스,
+여러 서버에서 동시에 실행해도 같은 공고를 중복 처리하지 않는다.
+실패한 작업은 지수 backoff 후 재시도하고, --max-attempts회 실패하면 dead로 옮긴다.
+LLM 서킷이 열려 있는 동안은 작업을 가져가지 않고, 서킷 open으로 못 한 작업은 시도 횟수 없이 되돌린다.
+
+Usage:
+    python db/tag_worker.py                     # 큐를 계속 감시 (Ctrl+C로 종료)
+    python db/tag_worker.py --threads 4         # 워커 스레드 4개
+    python db/tag_worker.py --once              # 지금 실행 가능한 작업만 처리하고 종료
+    python db/tag_worker.py --requeue-dead      # dead 작업을 pending으로 되돌리고 종료
+    python db/tag_worker.py --stats             # 상태별 작업 수 출력 후 종료
+"""
+import argparse
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import log_config
+from db.base import connect_postgres, ensure_schema, release_connection
+from db import tagging_queue
+from db.llm_client import get_client, llm_available
+from db.tagger import tag_recruit_batch
+
+
+def process_once(worker_id: str, batch_size: int, max_attempts: int, parallelism: int = None) -> int:
+    """작업을 최대 batch_size건 가져와 태깅. 처리한 작업 수 반환 (0이면 큐가 비었거나 LLM 서킷 open)."""
+    if not llm_available():
+        # 가져가도 전부 거절되어 시도 횟수만 소모하므로 서킷이 닫힐(시험 호출 시점이 될) 때까지 대기
+        logging.info(f"[{worker_id}] LLM 서킷 open — 작업을 가져가지 않고 대기")
+        return 0
+    conn = connect_postgres()
+    try:
+        jobs = tagging_queue.claim(conn, worker_id, batch_size)
+        if not jobs:
+            return 0
+
+        t0 = time.perf_counter()
+        try:
+            stats = tag_recruit_batch([recruit_id for _, recruit_id, _ in jobs], parallelism=parallelism)
+            circuit_open_ids = set(stats["circuit_open_ids"])
+            failed_ids = set(stats["failed_ids"]) - circuit_open_ids
+            error = "LLM 태깅 실패"
+        except Exception as e:
+            stats = {"tagged": 0, "skipped": 0, "failed": len(jobs)}
+            circuit_open_ids = set()
+            failed_ids = {recruit_id for _, recruit_id, _ in jobs}
+            error = f"{type(e).__name__}: {e}"
+
+        tagging_queue.complete(conn, [
+            job_id for job_id, recruit_id, _ in jobs if recruit_id not in failed_ids | circuit_open_ids
+        ])
+        tagging_queue.release(conn, [job_id for job_id, recruit_id, _ in jobs if recruit_id in circuit_open_ids],
+                              "LLM 서킷 open")
+        dead = tagging_queue.fail(conn, [job for job in jobs if job[1] in failed_ids], error, max_attempts)
+
+        elapsed = time.perf_counter() - t0
+        logging.info(
+            f"[{worker_id}] {len(jobs)}건 처리 ({elapsed:.1f}초, {len(jobs) / elapsed if elapsed > 0 else 0:.2f}건/초) — "
+            f"태깅됨: {stats['tagged']} / 변화없음: {stats['skipped']} / 실패: {stats['failed']} "
+            f"(서킷 open으로 반환 {len(circuit_open_ids)}, dead {dead})"
+        )
+        return len(jobs)
+    finally:
+        release_connection(conn)
+
+
+def run_worker(worker_id: str, batch_size: int, max_attempts: int, poll_seconds: float,
+               once: bool, stop_event: threading.Event, parallelism: int = None) -> int:
+    """큐가 빌 때까지(once) 또는 stop_event가 설정될 때까지 작업 처리. 처리 건수 반환."""
+    processed = 0
+    while not stop_event.is_set():
+        try:
+            count = process_once(worker_id, batch_size, max_attempts, parallelism)
+        except Exception as e:
+            logging.error(f"[{worker_id}] 작업 처리 오류: {e}")
+            count = 0
+        processed += count
+        if count == 0:
+            if once:
+                break
+            stop_event.wait(poll_seconds)
+    return processed
+
+
+def drain(threads: int = 1, batch_size: int = 20, max_attempts: int = tagging_queue.MAX_ATTEMPTS,
+          parallelism: int = None) -> int:
+    """지금 실행 가능한 작업을 모두 처리하고 반환 (main.py 크롤링 후 호출). 처리 건수 반환."""
+    return _run(threads, batch_size, max_attempts, poll_seconds=0, once=True, parallelism=parallelism)
+
+
+def _run(threads, batch_size, max_attempts, poll_seconds, once, parallelism=None) -> int:
+    conn = connect_postgres()
+    try:
+        ensure_schema(conn)
+    finally:
+        release_connection(conn)
+
+    host = f"{socket.gethostname()}:{os.getpid()}"
+    stop_event = threading.Event()
+    results = [0] * threads
+
+    def _target(i):
+        results[i] = run_worker(f"{host}:{i}", batch_size, max_attempts, poll_seconds, once, stop_event, parallelism)
+
+    workers = [threading.Thread(target=_target, args=(i,), name=f"tag-worker-{i}", daemon=True) for i in range(threads)]
+    t0 = time.perf_counter()
+    for w in workers:
+        w.start()
+    try:
+        for w in workers:
+            while w.is_alive():
+                w.join(timeout=1)
+    except KeyboardInterrupt:
+        logging.warning("종료 요청 — 진행 중인 배치를 마친 뒤 종료합니다.")
+        stop_event.set()
+        for w in workers:
+            w.join()
+
+    total = sum(results)
+    elapsed = time.perf_counter() - t0
+    logging.info(f"태깅 워커 종료: {total}건 처리, {elapsed:.1f}초 ({total / elapsed if elapsed > 0 else 0:.2f}건/초)")
+    get_client().log_summary()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=1, help="워커 스레드 수 (기본 1)")
+    parser.add_argument("--parallelism", type=int, default=None, help="스레드당 동시 LLM 호출 수 (기본: TAGGER_PARALLELISM)")
+    parser.add_argument("--batch-size", type=int, default=20, help="한 번에 가져갈 작업 수 (기본 20)")
+    parser.add_argument("--max-attempts", type=int, default=tagging_queue.MAX_ATTEMPTS, help="dead로 옮기기 전 최대 시도 횟수")
+    parser.add_argument("--poll", type=float, default=5.0, help="큐가 비었을 때 재확인 간격(초)")
+    parser.add_argument("--once", action="store_true", help="실행 가능한 작업만 처리하고 종료")
+    parser.add_argument("--requeue-dead", action="store_true", help="dead 작업을 pending으로 되돌리고 종료")
+    parser.add_argument("--stats", action="store_true", help="상태별 작업 수 출력 후 종료")
+    args = parser.parse_args()
+
+    if args.requeue_dead or args.stats:
+        conn = connect_postgres()
+        try:
+            ensure_schema(conn)
+            if args.requeue_dead:
+                print(f"dead → pending: {tagging_queue.requeue_dead(conn)}건")
+            print(tagging_queue.queue_stats(conn))
+        finally:
+            release_connection(conn)
+        return
+
+    total = _run(args.threads, args.batch_size, args.max_attempts, args.poll, args.once, args.parallelism)
+    print(f"완료 — {total}건 처리")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,30 @@
 EXAONE 기반 채용 공고 의미 태깅 모듈.
 
 - call_tagger(): 공고 1건 → 태그 리스트 반환
-- tag_recruit_batch(): recruit_id 리스트 일괄 태깅 후 DB 저장
+- call_tagger_batch(): 공고 N건을 한 번의 생성으로 태깅, 파싱 실패 항목만 call_tagger로 재시도
+- tag_recruit_batch(): recruit_id 리스트를 동시 LLM 호출로 태깅 후 묶음 단위로 DB 저장
+- 공고명 캐시: 같은 공고명·기존 태그는 LLM 없이 llm_tag_cache(+프로세스 LRU)에서 응답
 """
+import hashlib
+import os
 import re
 import logging
-import requests
+import time
+import unicodedata
 from typing import Optional
 
-OLLAMA_URL = "http://192.168.219.114:11434/api/generate"
+from db.cache import LRUCache
+from db.llm_client import first_line_complete, get_client, llm_available
+
 MODEL = "exaone3.5:7.8b"
 
+# 동시 LLM 호출 수 (Ollama 서버의 OLLAMA_NUM_PARALLEL 이하로 설정)
+TAGGER_PARALLELISM = int(os.getenv("TAGGER_PARALLELISM", "4"))
+# 완료된 태깅 결과를 몇 건씩 모아 한 트랜잭션으로 저장할지
+TAGGER_WRITE_BATCH = int(os.getenv("TAGGER_WRITE_BATCH", "25"))
+# 한 프롬프트에 묶을 공고 수 (1이면 공고별 단건 프롬프트). tests/compare_batch_tagging.py로 품질 확인 후 조정
+TAGGER_PROMPT_BATCH = int(os.getenv("TAGGER_PROMPT_BATCH", "1"))
+
 PROMPT_TEMPLATE = """채용 공고에서 직무·기술·산업 키워드 태그를 추출해줘.
 
 규칙:
@@ -27,17 +41,69 @@ PROMPT_TEMPLATE = """채용 공고에서 직무·기술·산업 키워드 태그
 태그:"""
 
 
-def _parse_tags(raw: str) -> list[str]:
-    """LLM 출력에서 태그 리스트를 파싱하고 정제."""
-    # 첫 줄만 사용 (부연 설명 제거)
-    first_line = raw.strip().splitlines()[0]
+# 여러 공고를 한 번에 태깅하는 프롬프트 — 규칙은 PROMPT_TEMPLATE과 같고 공고별로 번호를 붙여 한 줄씩 출력
+BATCH_PROMPT_TEMPLATE = """채용 공고들에서 직무·기술·산업 키워드 태그를 추출해줘.
+
+규칙:
+- 공백 없는 단어만 (예: 백엔드, Java, 데이터분석, UI디자인)
+- 직무/기술/산업 도메인만 포함 (지역·연봉·고용형태·기업명 제외)
+- 공고마다 5~8개, 쉼표 구분
+- 공고마다 한 줄씩 "번호. 태그" 형식으로만 출력
+
+예시 출력:
+1. 백엔드, Java, Spring, REST API, MySQL, 서버개발
+2. 회계, 세무, 재무제표, ERP, 결산
+
+{recruit_lines}
+
+태그:"""
+
+_BATCH_LINE_RE = re.compile(r"^\s*\[?(\d+)\s*[\].):]\s*(.*)$")
+
+
+def _clean_tags(line: str) -> list[str]:
+    """태그 한 줄을 쉼표로 나누고 정제."""
     # 쉼표 구분 분리
-    tags = [t.strip() for t in first_line.split(",") if t.strip()]
+    tags = [t.strip() for t in line.replace("，", ",").split(",") if t.strip()]
     # 길이 필터: 1~20자, 공백 2개 이상 포함 태그 제거
     tags = [t for t in tags if 1 <= len(t) <= 20 and t.count(" ") <= 1]
     return tags
 
 
+def _parse_tags(raw: str) -> list[str]:
+    """LLM 출력에서 태그 리스트를 파싱하고 정제."""
+    # 첫 줄만 사용 (부연 설명 제거)
+    first_line = raw.strip().splitlines()[0]
+    return _clean_tags(first_line)
+
+
+def _parse_batch_tags(raw: str, n: int) -> list[Optional[list[str]]]:
+    """배치 출력 "번호. 태그, ..." 줄들을 공고 순서대로 파싱.
+    번호가 없거나 범위를 벗어난 줄은 무시하고, 같은 번호가 여러 번 나오면 첫 줄을 쓴다.
+    태그를 얻지 못한 항목은 None.
+    """
+    results: list[Optional[list[str]]] = [None] * n
+    for line in raw.strip().splitlines():
+        m = _BATCH_LINE_RE.match(line)
+        if not m:
+            continue
+        idx = int(m.group(1)) - 1
+        if not 0 <= idx < n or results[idx] is not None:
+            continue
+        # 모델이 "공고명: ... | 태그: ..." 형태로 되풀이한 경우 마지막 구획만 사용
+        body = m.group(2).split("|")[-1]
+        body = body.split(":", 1)[1] if body.strip().startswith(("태그", "tags")) and ":" in body else body
+        tags = _clean_tags(body)
+        results[idx] = tags or None
+    return results
+
+
+def _batch_lines_complete(text: str, n: int) -> bool:
+    """번호 붙은 완결된 줄이 n개 이상 나왔는지 — 배치 태깅 스트리밍의 stop 조건."""
+    complete_lines = text.lstrip().split("\n")[:-1]  # 마지막 조각은 아직 생성 중인 줄
+    return sum(1 for line in complete_lines if _BATCH_LINE_RE.match(line)) >= n
+
+
 def call_tagger(announcement_name: str, existing_tags: list[str]) -> Optional[list[str]]:
     """공고 1건에 대해 EXAONE으로 태그를 생성하고 반환.
     실패 시 None 반환.
@@ -47,14 +113,10 @@ def call_tagger(announcement_name: str, existing_tags: list[str]) -> Optional[li
         existing_tags=", ".join(existing_tags) if existing_tags else "없음",
     )
     try:
-        resp = requests.post(OLLAMA_URL, json={
-            "model": MODEL,
-            "prompt": prompt,
-            "stream": False,
-            "options": {"temperature": 0.2, "num_predict": 60},
-        }, timeout=30)
-        resp.raise_for_status()
-        raw = resp.json()["response"]
+        raw = get_client().generate(
+            prompt, options={"temperature": 0.2, "num_predict": 60}, caller="tagger", model=MODEL,
+            stop=first_line_complete,
+        )
         tags = _parse_tags(raw)
         return tags if tags else None
     except Exception as e:
@@ -62,55 +124,240 @@ def call_tagger(announcement_name: str, existing_tags: list[str]) -> Optional[li
         return None
 
 
-def tag_recruit_batch(recruit_ids: list[int]) -> dict:
+def call_tagger_batch(items: list[tuple[str, list[str]]], fallback: bool = True) -> list[Optional[list[str]]]:
+    """(공고명, 기존태그) N건을 한 번의 생성으로 태깅. 입력 순서대로 태그 리스트(실패 시 None) 반환.
+    fallback=True 이면 파싱에 실패한 항목만 call_tagger로 단건 재시도한다.
+    """
+    if len(items) == 1:
+        return [call_tagger(*items[0])]
+
+    recruit_lines = "\n".join(
+        f"{i}. 공고명: {name} | 기존태그: {', '.join(existing) if existing else '없음'}"
+        for i, (name, existing) in enumerate(items, 1)
+    )
+    prompt = BATCH_PROMPT_TEMPLATE.format(recruit_lines=recruit_lines)
+    try:
+        raw = get_client().generate(
+            prompt,
+            # 단건 num_predict(60)를 항목 수만큼 + 번호 표기 여유
+            options={"temperature": 0.2, "num_predict": 70 * len(items)},
+            caller="tagger_batch", model=MODEL, timeout=30 + 10 * len(items),
+            stop=lambda text: _batch_lines_complete(text, len(items)),
+        )
+        results = _parse_batch_tags(raw, len(items))
+    except Exception as e:
+        logging.warning(f"[tagger] 배치 LLM 호출 실패 ({len(items)}건): {e}")
+        results = [None] * len(items)
+
+    if fallback:
+        missing = [i for i, tags in enumerate(results) if tags is None]
+        if missing:
+            logging.info(f"[tagger] 배치 {len(items)}건 중 {len(missing)}건 파싱 실패 → 단건 재시도")
+        for i in missing:
+            results[i] = call_tagger(*items[i])
+    return results
+
+
+def _ensure_tag_id(session, tag_name: str) -> int:
+    """tags에 tag_name을 보장하고 id 반환. 동시 삽입 시에도 ON CONFLICT 후 SELECT로 같은 id를 얻는다."""
+    from sqlalchemy import select
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from db.models import Tag
+
+    tag_id = session.execute(
+        pg_insert(Tag).values(name=tag_name)
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(Tag.id)
+    ).scalar()
+    if tag_id is None:
+        tag_id = session.execute(select(Tag.id).where(Tag.name == tag_name)).scalar_one()
+    return tag_id
+
+
+# ──────────────────────────────
+# 공고명 → 태그 캐시
+# ──────────────────────────────
+# 같은 공고명(재게시, 프랜차이즈 동일 공고)은 LLM 결과도 같으므로 캐시에서 바로 응답한다.
+# 키에 모델·프롬프트 버전이 들어가므로 MODEL이나 프롬프트가 바뀌면 기존 항목은 자연히 더 이상 조회되지 않는다.
+PROMPT_VERSION = hashlib.sha1(f"{MODEL}\x1f{PROMPT_TEMPLATE}\x1f{BATCH_PROMPT_TEMPLATE}".encode()).hexdigest()[:12]
+
+title_tag_cache = LRUCache("tag_titles", maxsize=int(os.getenv("TAGGER_TITLE_CACHE_SIZE", "50000")))
+
+
+def _normalize_title(title: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", title or "").split()).lower()
+
+
+def title_cache_key(announcement_name: str, existing_tags: list[str]) -> str:
+    """정규화한 공고명 + 기존 태그 집합 + 모델/프롬프트 버전으로 캐시 키 생성."""
+    raw = "\x1f".join([PROMPT_VERSION, _normalize_title(announcement_name), ",".join(sorted(set(existing_tags)))])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _lookup_cached_tags(session, keys) -> dict:
+    """키 → 태그. 프로세스 LRU에서 먼저 찾고 나머지는 llm_tag_cache에서 한 번에 조회."""
+    from sqlalchemy import text
+
+    found = {}
+    for key in keys:
+        tags = title_tag_cache.get(key)
+        if tags is not None:
+            found[key] = tags
+    missing = [key for key in keys if key not in found]
+    if missing:
+        rows = session.execute(
+            text("SELECT cache_key, tags FROM llm_tag_cache WHERE cache_key = ANY(:keys)"),
+            {"keys": missing},
+        ).all()
+        for key, tags in rows:
+            found[key] = list(tags)
+            title_tag_cache.put(key, list(tags))
+    return found
+
+
+def _write_tag_results(session, results, stats, finished, cache_entries=()):
+    """완료된 (recruit_id, existing_tag_names, new_tags) 묶음과 새 캐시 항목을 한 트랜잭션으로 저장."""
+    from sqlalchemy import text
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from db.models import recruit_tags
+    from db.cache import tag_cache
+    from db.io import sync_tag_names
+
+    links = []
+    outcome = {}
+    for recruit_id, existing_tag_names, new_tags in results:
+        added = 0
+        for tag_name in dict.fromkeys(new_tags):
+            if tag_name in existing_tag_names:
+                continue
+            tag_id = tag_cache.get_or_create(tag_name, lambda name: _ensure_tag_id(session, name))
+            links.append({"recruit_id": recruit_id, "tag_id": tag_id})
+            added += 1
+        outcome[recruit_id] = "tagged" if added > 0 else "skipped"
+
+    if links:
+        session.execute(pg_insert(recruit_tags).values(links).on_conflict_do_nothing())
+        sync_tag_names(session, sorted({link["recruit_id"] for link in links}))
+    if cache_entries:
+        session.execute(
+            text("""
+                INSERT INTO llm_tag_cache (cache_key, tags, model, prompt_version)
+                VALUES (:key, :tags, :model, :version)
+                ON CONFLICT (cache_key) DO NOTHING
+            """),
+            [{"key": key, "tags": tags, "model": MODEL, "version": PROMPT_VERSION} for key, tags in cache_entries],
+        )
+    session.commit()
+
+    for key, tags in cache_entries:
+        title_tag_cache.put(key, tags)
+    for recruit_id, result in outcome.items():
+        stats[result] += 1
+        finished.add(recruit_id)
+
+
+def tag_recruit_batch(recruit_ids: list[int], parallelism: int = None, write_batch_size: int = None,
+                      prompt_batch_size: int = None) -> dict:
     """recruit_id 리스트를 받아 태깅 후 DB에 저장.
-    반환: {'tagged': N, 'skipped': N, 'failed': N}
+    공고명 캐시(프로세스 LRU → llm_tag_cache)에 있는 공고는 LLM을 호출하지 않고,
+    같은 배치 안에서 캐시 키가 같은 공고는 한 번만 호출한다.
+    LLM 호출은 최대 parallelism개를 동시에 보내고 (Ollama OLLAMA_NUM_PARALLEL에 맞춤),
+    각 호출은 공고 prompt_batch_size건을 한 프롬프트로 묶는다 (1이면 단건 프롬프트).
+    완료된 결과는 write_batch_size건씩 모아 한 트랜잭션으로 저장한다.
+    반환: {'tagged': N, 'skipped': N, 'failed': N, 'failed_ids': [...], 'circuit_open_ids': [...],
+           'cache_hits': N, 'cache_misses': N, 'cache_hit_rate': float}
+    failed_ids는 태깅을 완료하지 못한 recruit_id (LLM 실패, 또는 배치 오류로 커밋되지 않은 공고).
+    circuit_open_ids는 그중 LLM 서킷이 열린 상태에서 실패한 공고 — 공고 탓이 아니므로 재시도 횟수를 세지 않는다.
     """
-    from sqlalchemy.orm import joinedload
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from db.io import SessionLocal
-    from db.models import Recruit, Tag, Region
+    from db.models import Recruit
+    from db.cache import warm_dimension_caches, clear_dimension_caches
+
+    parallelism = parallelism or TAGGER_PARALLELISM
+    write_batch_size = write_batch_size or TAGGER_WRITE_BATCH
+    prompt_batch_size = prompt_batch_size or TAGGER_PROMPT_BATCH
 
     session = SessionLocal()
-    stats = {"tagged": 0, "skipped": 0, "failed": 0}
+    stats = {"tagged": 0, "skipped": 0, "failed": 0, "failed_ids": [], "circuit_open_ids": [],
+             "cache_hits": 0, "cache_misses": 0, "cache_hit_rate": 0.0}
+    finished = set()
+    started = time.perf_counter()
 
     try:
-        recruits = (
-            session.query(Recruit)
-            .options(joinedload(Recruit.tags))
-            .filter(Recruit.id.in_(recruit_ids))
-            .all()
-        )
+        warm_dimension_caches(session.connection().connection.cursor())
+        recruits = session.query(Recruit).filter(Recruit.id.in_(recruit_ids)).all()
+        # LLM 호출 스레드에는 ORM 객체 대신 평범한 값만 넘긴다
+        items = [(r.id, r.announcement_name, list(r.tag_names)) for r in recruits]
+        keys = {recruit_id: title_cache_key(name, existing) for recruit_id, name, existing in items}
+        cached = _lookup_cached_tags(session, set(keys.values()))
+        session.commit()
 
-        for recruit in recruits:
-            existing_tag_names = [t.name for t in recruit.tags]
-            new_tags = call_tagger(recruit.announcement_name, existing_tag_names)
+        pending = []
+        # 캐시 키별로 LLM 호출 대상 1건(대표)만 남기고, 같은 키의 나머지는 대표 결과를 공유
+        to_call = {}       # key → (recruit_id, name, existing)
+        followers = {}     # key → [(recruit_id, existing), ...]
+        for recruit_id, name, existing in items:
+            key = keys[recruit_id]
+            if key in cached:
+                pending.append((recruit_id, existing, cached[key]))
+            elif key in to_call:
+                followers.setdefault(key, []).append((recruit_id, existing))
+            else:
+                to_call[key] = (recruit_id, name, existing)
+        stats["cache_misses"] = len(to_call)
+        stats["cache_hits"] = len(items) - len(to_call)
 
-            if new_tags is None:
-                stats["failed"] += 1
-                continue
+        cache_entries = []
+        if len(pending) >= write_batch_size:
+            _write_tag_results(session, pending, stats, finished)
+            pending = []
 
-            added = 0
-            for tag_name in new_tags:
-                if tag_name in existing_tag_names:
-                    continue
-                tag = session.query(Tag).filter_by(name=tag_name).first()
-                if not tag:
-                    tag = Tag(name=tag_name)
-                    session.add(tag)
-                    session.flush()
-                recruit.tags.append(tag)
-                added += 1
-
-            session.commit()
-            if added > 0:
-                stats["tagged"] += 1
-            else:
-                stats["skipped"] += 1
+        with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="tagger") as executor:
+            call_items = list(to_call.items())
+            groups = [call_items[i:i + prompt_batch_size] for i in range(0, len(call_items), prompt_batch_size)]
+            futures = {
+                executor.submit(call_tagger_batch, [(name, existing) for _, (_, name, existing) in group]): group
+                for group in groups
+            }
+            for future in as_completed(futures):
+                group = futures[future]
+                for (key, (recruit_id, _, existing)), new_tags in zip(group, future.result()):
+                    sharing = [(recruit_id, existing)] + followers.get(key, [])
+                    if new_tags is None:
+                        # 서킷이 열려 있으면 호출이 거절됐거나 서킷을 연 장애로 실패한 것
+                        circuit_open = not llm_available()
+                        for rid, _ in sharing:
+                            stats["failed"] += 1
+                            stats["failed_ids"].append(rid)
+                            if circuit_open:
+                                stats["circuit_open_ids"].append(rid)
+                            finished.add(rid)
+                        continue
+                    pending.extend((rid, ex, new_tags) for rid, ex in sharing)
+                    cache_entries.append((key, new_tags))
+                if len(pending) >= write_batch_size:
+                    _write_tag_results(session, pending, stats, finished, cache_entries)
+                    pending, cache_entries = [], []
+        if pending or cache_entries:
+            _write_tag_results(session, pending, stats, finished, cache_entries)
 
     except Exception as e:
         session.rollback()
+        clear_dimension_caches()
         logging.error(f"[tagger] 배치 처리 오류: {e}")
+        unfinished = [rid for rid in recruit_ids if rid not in finished]
+        stats["failed"] += len(unfinished)
+        stats["failed_ids"].extend(unfinished)
     finally:
         session.close()
 
+    lookups = stats["cache_hits"] + stats["cache_misses"]
+    stats["cache_hit_rate"] = round(stats["cache_hits"] / lookups, 3) if lookups else 0.0
+    elapsed = time.perf_counter() - started
+    logging.info(
+        f"[tagger] {len(recruit_ids)}건 태깅 {elapsed:.1f}초 "
+        f"({len(recruit_ids) / elapsed if elapsed > 0 else 0:.2f}건/초, 동시 호출 {parallelism}, 프롬프트당 {prompt_batch_size}건) — "
+        f"공고명 캐시 적중 {stats['cache_hits']}/{lookups} ({stats['cache_hit_rate']:.1%})"
+    )
     return stats
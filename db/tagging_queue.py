@@ -0,0 +1,141 @@
+"""
+LLM 태깅 작업 큐 (tagging_jobs 테이블).
+
+- enqueue():      수집 경로가 신규 recruit_id를 pending으로 등록
+- claim():        워커가 FOR UPDATE SKIP LOCKED로 작업을 가져가 running으로 표시 (즉시 커밋)
+- complete():     성공 → done
+- fail():         실패 → attempts < max_attempts 이면 지수 backoff 후 pending, 아니면 dead
+- requeue_dead(): dead 작업을 다시 pending으로
+
+claim은 running 표시를 바로 커밋하므로 LLM 호출 동안 행 잠금을 잡고 있지 않는다.
+워커가 죽어 running으로 남은 작업은 lease_seconds가 지나면 다른 워커가 다시 가져간다.
+여러 워커(같은 서버의 스레드·프로세스, 다른 서버)가 동시에 claim해도 SKIP LOCKED로 겹치지 않는다.
+"""
+import logging
+
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 30      # 1회 실패 30초, 2회 60초, 3회 120초 ...
+BACKOFF_MAX_SECONDS = 3600
+LEASE_SECONDS = 600            # running 상태가 이보다 오래되면 워커가 죽은 것으로 간주
+
+
+def backoff_seconds(attempts: int) -> int:
+    """attempts회 실패 후 다음 시도까지 대기 시간."""
+    return min(BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0), BACKOFF_MAX_SECONDS)
+
+
+def enqueue(cursor, recruit_ids) -> int:
+    """recruit_id들을 pending 작업으로 등록 (이미 있으면 무시). 커밋은 호출자가 한다. 등록 건수 반환."""
+    if not recruit_ids:
+        return 0
+    cursor.execute("""
+        INSERT INTO tagging_jobs (recruit_id)
+        SELECT unnest(%s::int[])
+        ON CONFLICT (recruit_id) DO NOTHING
+    """, (list(recruit_ids),))
+    return cursor.rowcount
+
+
+def claim(conn, worker_id: str, limit: int, lease_seconds: int = LEASE_SECONDS) -> list[tuple]:
+    """실행 가능한 작업을 최대 limit건 가져와 running으로 표시.
+    반환: [(job_id, recruit_id, attempts), ...] — attempts는 이번 시도를 포함한 횟수
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            WITH picked AS (
+                SELECT id FROM tagging_jobs
+                WHERE (status = 'pending' AND run_after <= NOW())
+                   OR (status = 'running' AND locked_at < NOW() - make_interval(secs => %s))
+                ORDER BY run_after, id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE tagging_jobs j
+            SET status = 'running', locked_by = %s, locked_at = NOW(),
+                attempts = j.attempts + 1, updated_at = NOW()
+            FROM picked
+            WHERE j.id = picked.id
+            RETURNING j.id, j.recruit_id, j.attempts
+        """, (lease_seconds, limit, worker_id))
+        jobs = cursor.fetchall()
+        conn.commit()
+        return jobs
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def complete(conn, job_ids) -> None:
+    if not job_ids:
+        return
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE tagging_jobs
+        SET status = 'done', locked_by = NULL, locked_at = NULL, last_error = NULL, updated_at = NOW()
+        WHERE id = ANY(%s)
+    """, (list(job_ids),))
+    conn.commit()
+
+
+def fail(conn, jobs, error: str, max_attempts: int = MAX_ATTEMPTS) -> int:
+    """jobs: claim()이 반환한 (job_id, recruit_id, attempts) 중 실패한 것.
+    재시도 횟수를 넘긴 작업은 dead로 옮긴다. dead 처리 건수 반환.
+    """
+    cursor = conn.cursor()
+    dead = 0
+    for job_id, recruit_id, attempts in jobs:
+        if attempts >= max_attempts:
+            cursor.execute("""
+                UPDATE tagging_jobs
+                SET status = 'dead', locked_by = NULL, locked_at = NULL, last_error = %s, updated_at = NOW()
+                WHERE id = %s
+            """, (error, job_id))
+            dead += 1
+            logging.warning(f"[tagging_queue] recruit_id={recruit_id} {attempts}회 실패 → dead: {error}")
+        else:
+            cursor.execute("""
+                UPDATE tagging_jobs
+                SET status = 'pending', locked_by = NULL, locked_at = NULL, last_error = %s,
+                    run_after = NOW() + make_interval(secs => %s), updated_at = NOW()
+                WHERE id = %s
+            """, (error, backoff_seconds(attempts), job_id))
+    conn.commit()
+    return dead
+
+
+def release(conn, job_ids, reason: str) -> None:
+    """작업을 시도 횟수에 넣지 않고 pending으로 되돌린다 (LLM 서킷 open처럼 공고와 무관한 이유로 못 한 작업)."""
+    if not job_ids:
+        return
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE tagging_jobs
+        SET status = 'pending', locked_by = NULL, locked_at = NULL, last_error = %s,
+            attempts = GREATEST(attempts - 1, 0), updated_at = NOW()
+        WHERE id = ANY(%s)
+    """, (reason, list(job_ids)))
+    conn.commit()
+
+
+def requeue_dead(conn) -> int:
+    """dead 작업을 시도 횟수를 초기화해 pending으로 되돌린다. 건수 반환."""
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE tagging_jobs
+        SET status = 'pending', attempts = 0, run_after = NOW(), updated_at = NOW()
+        WHERE status = 'dead'
+    """)
+    count = cursor.rowcount
+    conn.commit()
+    return count
+
+
+def queue_stats(conn) -> dict:
+    """{'pending': N, 'running': N, 'done': N, 'dead': N}"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT status, COUNT(*) FROM tagging_jobs GROUP BY status")
+    stats = {"pending": 0, "running": 0, "done": 0, "dead": 0}
+    stats.update(dict(cursor.fetchall()))
+    conn.commit()
+    return stats
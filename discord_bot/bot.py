@@ -7,6 +7,7 @@ from discord_bot.llm import sql_search, sql_search_baseline, extract_filters
 from discord_bot.notifier import notify_subscribers
 from discord_bot.views import SubscriptionView, _describe_profile
 from db.base import ensure_tables
+from db.llm_client import get_client
 from db.io import (
     save_subscription, delete_subscription, delete_all_subscriptions,
     get_subscriptions, get_user_profile, MAX_SUBSCRIPTIONS_PER_USER,
@@ -34,6 +35,7 @@ async def on_ready():
 async def notify_task():
     logging.info("정기 알림 태스크 실행")
     await notify_subscribers(client)
+    get_client().log_summary()
 
 
 @notify_task.before_loop
@@ -3,12 +3,21 @@ EXAONE 기반 구독 키워드 확장 모듈.
 
 - expand_keyword(): 구독 키워드 1개 → 관련 키워드 리스트 반환
 - 알림 발송 시 확장된 키워드로 OR 매칭하여 recall 향상
+- 확장 캐시: 정규화 키워드 + 모델/프롬프트 버전 기준으로 프로세스 LRU → keyword_expansions 테이블 순으로 조회.
+  TTL(KEYWORD_EXPANSION_TTL_HOURS)이 지난 항목은 그대로 응답하고 백그라운드에서 LLM으로 다시 확장한다.
 """
+import hashlib
 import logging
-import requests
+import os
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-OLLAMA_URL = "http://192.168.219.114:11434/api/generate"
+from db.cache import LRUCache
+from db.llm_client import first_line_complete, get_client, llm_available
+
 MODEL = "exaone3.5:7.8b"
 
 PROMPT_TEMPLATE = """채용 검색 쿼리: '{keyword}'
@@ -25,26 +34,123 @@ PROMPT_TEMPLATE = """채용 검색 쿼리: '{keyword}'
 
 키워드:"""
 
+# 모델이나 프롬프트가 바뀌면 이전 확장 결과를 쓰지 않도록 캐시 키에 포함
+PROMPT_VERSION = hashlib.sha1(f"{MODEL}\x1f{PROMPT_TEMPLATE}".encode("utf-8")).hexdigest()[:12]
+EXPANSION_TTL_SECONDS = float(os.getenv("KEYWORD_EXPANSION_TTL_HOURS", "168")) * 3600
 
-def expand_keyword(keyword: str) -> list[str]:
-    """키워드를 EXAONE으로 확장. 실패 시 원본 키워드만 반환."""
+# 정규화 키워드 → (확장 키워드 리스트, 갱신 시각 epoch)
+expansion_cache = LRUCache("keyword_expansions", maxsize=int(os.getenv("KEYWORD_EXPANSION_CACHE_SIZE", "5000")))
+
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="expansion-refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", keyword or "").split()).lower()
+
+
+def _with_keyword(keyword: str, tags: list[str]) -> list[str]:
+    # 원본 키워드는 반드시 포함
+    return tags if keyword in tags else [keyword] + [t for t in tags if t != keyword]
+
+
+def _expand_with_llm(keyword: str) -> list[str]:
+    """EXAONE 호출 → 확장 키워드 리스트. 실패 시 예외."""
     prompt = PROMPT_TEMPLATE.format(keyword=keyword)
+    raw = get_client().generate(
+        prompt, options={"temperature": 0.3, "num_predict": 80}, caller="expander", model=MODEL,
+        stop=first_line_complete,
+    ).strip().splitlines()[0]
+    tags = [t.strip() for t in raw.split(",") if t.strip()]
+    tags = [t for t in tags if 1 <= len(t) <= 20]
+    return _with_keyword(keyword, tags)
+
+
+def _store(norm: str, tags: list[str]):
+    from db.io import save_keyword_expansion
+
+    expansion_cache.put(norm, (tags, time.time()))
+    try:
+        save_keyword_expansion(norm, PROMPT_VERSION, MODEL, tags)
+    except Exception as e:
+        logging.warning(f"[expander] 확장 캐시 저장 실패 ({norm}): {e}")
+
+
+def _refresh(keyword: str, norm: str):
+    try:
+        if not llm_available():
+            return
+        tags = _expand_with_llm(keyword)
+        _store(norm, tags)
+        logging.info(f"[expander] 캐시 갱신 '{keyword}' → {tags}")
+    except Exception as e:
+        logging.warning(f"[expander] 캐시 갱신 실패 ({keyword}): {e}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(norm)
+
+
+def _schedule_refresh(keyword: str, norm: str):
+    """TTL이 지난 항목을 백그라운드에서 다시 확장 (같은 키워드는 동시에 1건만)."""
+    with _refreshing_lock:
+        if norm in _refreshing:
+            return
+        _refreshing.add(norm)
+    _refresh_executor.submit(_refresh, keyword, norm)
+
+
+def _lookup(norm: str) -> Optional[tuple]:
+    """LRU → keyword_expansions 순으로 (태그, 갱신 epoch) 조회. DB 오류는 캐시 미스로 취급."""
+    from db.io import get_keyword_expansion
+
+    entry = expansion_cache.get(norm)
+    if entry is not None:
+        return entry
+    try:
+        row = get_keyword_expansion(norm, PROMPT_VERSION)
+    except Exception as e:
+        logging.warning(f"[expander] 확장 캐시 조회 실패 ({norm}): {e}")
+        return None
+    if row is None:
+        return None
+    tags, age = row
+    entry = (tags, time.time() - age)
+    expansion_cache.put(norm, entry)
+    return entry
+
+
+def cached_expansion(keyword: str) -> Optional[list[str]]:
+    """프로세스 LRU에 있는 확장 결과만 반환 (DB·LLM 조회 없음). 없거나 확장어가 없으면 None."""
+    norm = normalize_keyword(keyword)
+    entry = expansion_cache.get(norm)
+    if entry is None:
+        return None
+    tags, refreshed_at = entry
+    if time.time() - refreshed_at > EXPANSION_TTL_SECONDS:
+        _schedule_refresh(keyword, norm)
+    expanded = _with_keyword(keyword, tags)
+    return expanded if len(expanded) > 1 else None
+
+
+def expand_keyword(keyword: str) -> list[str]:
+    """키워드를 EXAONE으로 확장. 캐시에 있으면 LLM 없이 응답. 실패 시 원본 키워드만 반환."""
+    norm = normalize_keyword(keyword)
+    entry = _lookup(norm)
+    if entry is not None:
+        tags, refreshed_at = entry
+        if time.time() - refreshed_at > EXPANSION_TTL_SECONDS:
+            _schedule_refresh(keyword, norm)
+        return _with_keyword(keyword, tags)
+
+    if not llm_available():
+        logging.info(f"[expander] LLM 서킷 open — '{keyword}' 확장 생략")
+        return [keyword]
     try:
-        resp = requests.post(OLLAMA_URL, json={
-            "model": MODEL,
-            "prompt": prompt,
-            "stream": False,
-            "options": {"temperature": 0.3, "num_predict": 80},
-        }, timeout=30)
-        resp.raise_for_status()
-        raw = resp.json()["response"].strip().splitlines()[0]
-        tags = [t.strip() for t in raw.split(",") if t.strip()]
-        tags = [t for t in tags if 1 <= len(t) <= 20]
-        # 원본 키워드는 반드시 포함
-        if keyword not in tags:
-            tags = [keyword] + tags
-        logging.info(f"[expander] '{keyword}' → {tags}")
-        return tags
+        tags = _expand_with_llm(keyword)
     except Exception as e:
         logging.warning(f"[expander] 키워드 확장 실패 ({keyword}): {e}")
         return [keyword]
+    _store(norm, tags)
+    logging.info(f"[expander] '{keyword}' → {tags}")
+    return tags
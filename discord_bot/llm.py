@@ -2,6 +2,7 @@ import re
 from datetime import date
 from db.io import search_recruits_by_filter
 from db.JobPreprocessor import JobPreprocessor
+from db.llm_client import llm_available
 from discord_bot.notifier import format_recruit
 
 REGIONS = [
@@ -179,29 +180,15 @@ def sql_search_baseline(query, limit=5):
 
 
 def sql_search(query, limit=5):
-    from discord_bot.keyword_expander import expand_keyword
+    from discord_bot.keyword_expander import cached_expansion, expand_keyword
     from discord_bot.reranker import rerank
 
     filters = extract_filters(query)
     keyword = filters.get('keyword')
     form_code = JobPreprocessor.parse_form(filters.get('form') or '')
 
-    # 1차: 일반 AND 매칭 (db/io.py 내부 OR fallback 포함)
-    recruits = search_recruits_by_filter(
-        keyword=keyword,
-        min_deadline=filters.get('min_deadline'),
-        min_annual_salary=filters.get('min_annual_salary'),
-        company_name=filters.get('company_name'),
-        max_experience=filters.get('max_experience'),
-        form=form_code,
-        region=filters.get('region'),
-        limit=max(limit * 5, 50),
-    )
-
-    # 2차: 결과 부족 시 LLM 쿼리 확장 → OR 매칭 (어휘 불일치 해소)
-    if len(recruits) < ADAPTIVE_THRESHOLD and keyword:
-        expanded = expand_keyword(keyword)
-        recruits = search_recruits_by_filter(
+    def _search(expanded_keywords=None, expand_below=0):
+        return search_recruits_by_filter(
             keyword=keyword,
             min_deadline=filters.get('min_deadline'),
             min_annual_salary=filters.get('min_annual_salary'),
@@ -210,14 +197,27 @@ def sql_search(query, limit=5):
             form=form_code,
             region=filters.get('region'),
             limit=max(limit * 5, 50),
-            expanded_keywords=expanded,
+            expanded_keywords=expanded_keywords,
+            expand_below=expand_below,
         )
 
+    # 1차: 일반 AND 매칭 (db/io.py 내부 OR fallback 포함)
+    # 확장 결과가 이미 캐시에 있으면 "결과 부족 시 확장 OR 매칭"까지 같은 호출에 맡긴다 (SEARCH_SCORED=1이면 쿼리 1회)
+    expanded = cached_expansion(keyword) if keyword else None
+    recruits = _search(expanded, expand_below=ADAPTIVE_THRESHOLD)
+
+    # 2차: 결과 부족 시 LLM 쿼리 확장 → OR 매칭 (어휘 불일치 해소)
+    # 확장 캐시에 없고 LLM 서킷도 열려 있으면 원본 키워드만 돌아오므로 재검색하지 않고 1차 결과를 사용
+    if expanded is None and len(recruits) < ADAPTIVE_THRESHOLD and keyword:
+        expanded = expand_keyword(keyword)
+        if len(expanded) > 1:
+            recruits = _search(expanded)
+
     if not recruits:
         return "조건에 맞는 채용 공고를 찾지 못했습니다."
 
     # 방안 2: 재순위 후 상위 limit건
-    if keyword and len(recruits) > 1:
+    if keyword and len(recruits) > 1 and llm_available():
         recruits = rerank(keyword, recruits)
 
     result_lines = [format_recruit(i, r, include_education=True) for i, r in enumerate(recruits[:limit], start=1)]
@@ -77,7 +77,8 @@ async def notify_subscribers(client, skip_dedup: bool = False):
     profiles = get_all_user_profiles()
     logging.info(f"알림 처리 시작: 신규 공고 {len(new_recruits)}건, 구독 {len(subscriptions)}개")
 
-    from discord_bot.keyword_expander import expand_keyword
+    from discord_bot.keyword_expander import expand_keyword, expansion_cache
+    from db.llm_client import llm_available
 
     user_keywords: dict = defaultdict(list)
     for sub in subscriptions:
@@ -89,8 +90,9 @@ async def notify_subscribers(client, skip_dedup: bool = False):
     all_keywords = list({kw for kws in user_keywords.values() for kw in kws if kw})
     expanded_map = {}
     for kw in all_keywords:
+        # 확장 캐시(keyword_expansions)에 있으면 LLM 없이 응답. 캐시 미스 + LLM 서킷 open이면 원본 키워드만 반환
         expanded_map[kw] = await loop.run_in_executor(None, expand_keyword, kw)
-    logging.info(f"키워드 확장 완료: {len(expanded_map)}개")
+    logging.info(f"키워드 확장 완료: {len(expanded_map)}개 (캐시 {expansion_cache.stats()})")
 
     for discord_user_id, keywords in user_keywords.items():
         profile = profiles.get(discord_user_id)
@@ -117,7 +119,7 @@ async def notify_subscribers(client, skip_dedup: bool = False):
                 continue
 
         # 방안 2: 발송 전 키워드별 관련도 재순위 — 스레드 풀에서 실행
-        if keywords:
+        if keywords and llm_available():
             from discord_bot.reranker import rerank
             to_notify = await loop.run_in_executor(None, rerank, keywords[0], to_notify)
 
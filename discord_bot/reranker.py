@@ -3,14 +3,53 @@ EXAONE 기반 구독 알림 공고 재순위 모듈 (방안 2).
 
 - rerank(): 매칭된 공고 리스트를 구독 키워드 관련도 순으로 재정렬
 - 한 번의 LLM 호출로 여러 공고를 배치 평가하여 속도 최적화
+- 점수 캐시: (정규화 키워드, 모델/프롬프트 버전, 공고)별 점수를 프로세스 LRU → rerank_scores 테이블 순으로 조회해
+  캐시에 없는 공고만 LLM에 보낸다. 마감이 지난 공고의 점수는 쓰지 않고, 공고가 삭제되면 테이블에서도 삭제된다.
+- 배치 병렬 평가: 배치들을 최대 RERANK_CONCURRENCY개까지 동시에 보내고, RERANK_DEADLINE_SECONDS 안에 끝난
+  배치 점수만으로 정렬한다. 점수를 받지 못한 공고는 점수를 받은 공고 뒤에 입력(SQL) 순서대로 둔다.
+- 점수 캐시 저장은 마감 안에 끝난 배치는 호출 스레드에서, 마감 뒤에 끝난 배치는 저장 전용 스레드 1개에서 한다
+  (LLM 동시 호출 슬롯을 DB 쓰기로 잡아두지 않는다).
 """
+import hashlib
 import logging
-import requests
+import math
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date
+from typing import Callable, Optional
+
+from db.cache import LRUCache
 from db.io import RecruitOut
+from db.llm_client import first_line_complete, get_client
+from discord_bot.keyword_expander import normalize_keyword
 
-OLLAMA_URL = "http://192.168.219.114:11434/api/generate"
 MODEL = "exaone3.5:7.8b"
 BATCH_SIZE = 10  # 한 번의 LLM 호출로 평가할 공고 수
+DEFAULT_SCORE = 5.0  # _parse_scores가 모자란 점수를 채우는 값 (캐시하지 않음, rerank 정렬에는 쓰지 않음)
+# 동시에 평가할 배치 수 (Ollama OLLAMA_NUM_PARALLEL 이하) / rerank 1회 전체 대기 한도(초)
+RERANK_CONCURRENCY = int(os.getenv("RERANK_CONCURRENCY", "4"))
+RERANK_DEADLINE_SECONDS = float(os.getenv("RERANK_DEADLINE_SECONDS", "10"))
+
+PROMPT_TEMPLATE = """구독 키워드: '{keyword}'
+
+아래 채용 공고들이 이 키워드와 얼마나 관련 있는지 0~10점으로 평가해줘.
+숫자만 쉼표로 출력. 다른 설명 없이.
+
+{recruit_text}
+
+점수:"""
+
+# 모델이나 프롬프트가 바뀌면 이전 점수를 쓰지 않도록 캐시 키에 포함
+PROMPT_VERSION = hashlib.sha1(f"{MODEL}\x1f{PROMPT_TEMPLATE}".encode("utf-8")).hexdigest()[:12]
+
+# (프롬프트 버전, 정규화 키워드, recruit_id) → (점수, 마감일)
+score_cache = LRUCache("rerank_scores", maxsize=int(os.getenv("RERANK_SCORE_CACHE_SIZE", "100000")))
+
+# 프로세스 전체가 공유 — 동시에 여러 rerank가 돌아도 LLM 동시 호출은 RERANK_CONCURRENCY개로 제한
+_executor = ThreadPoolExecutor(max_workers=RERANK_CONCURRENCY, thread_name_prefix="reranker")
+# 마감 뒤에 끝난 배치 점수 저장용 — 순서대로 하나씩 처리
+_store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reranker-store")
 
 
 def _build_prompt(keyword: str, recruits: list[RecruitOut]) -> str:
@@ -19,63 +58,161 @@ def _build_prompt(keyword: str, recruits: list[RecruitOut]) -> str:
         tags = ", ".join(r.tags[:5]) if r.tags else "없음"
         lines.append(f"{i}. {r.announcement_name} | 태그: {tags}")
 
-    recruit_text = "\n".join(lines)
-    return f"""구독 키워드: '{keyword}'
-
-아래 채용 공고들이 이 키워드와 얼마나 관련 있는지 0~10점으로 평가해줘.
-숫자만 쉼표로 출력. 다른 설명 없이.
+    return PROMPT_TEMPLATE.format(keyword=keyword, recruit_text="\n".join(lines))
 
-{recruit_text}
 
-점수:"""
+def _parse_score_list(raw: str, n: int) -> list[float]:
+    """LLM 출력 첫 줄에서 앞쪽부터 읽을 수 있는 점수만 최대 n개 반환 (모자라도 채우지 않음)."""
+    try:
+        first_line = raw.strip().splitlines()[0]
+    except IndexError:
+        return []
+    scores = []
+    for token in first_line.replace("，", ",").split(","):
+        token = token.strip()
+        try:
+            scores.append(float(token))
+        except ValueError:
+            # 숫자가 아닌 토큰 무시
+            continue
+    return scores[:n]
 
 
 def _parse_scores(raw: str, n: int) -> list[float]:
     """LLM 출력에서 점수 리스트 파싱. 파싱 실패 시 5.0으로 채움."""
+    scores = _parse_score_list(raw, n)
+    return scores + [DEFAULT_SCORE] * (n - len(scores))
+
+
+def _scores_complete(text: str, n: int) -> bool:
+    """첫 줄이 끝났거나 점수 n개가 모두 나왔는지 — 재순위 스트리밍의 stop 조건.
+    마지막 숫자는 뒤에 구분자가 와야 완결로 본다 ("1"이 "10"의 앞부분일 수 있으므로).
+    """
+    if first_line_complete(text):
+        return True
+    return text.replace("，", ",").count(",") >= n
+
+
+def _lookup_scores(norm: str, recruits: list[RecruitOut]) -> dict:
+    """{recruit_id: 점수}. 프로세스 LRU에서 먼저 찾고 나머지는 rerank_scores에서 한 번에 조회."""
+    from db.io import get_rerank_scores
+
+    today = date.today()
+    found = {}
+    for r in recruits:
+        entry = score_cache.get((PROMPT_VERSION, norm, r.id))
+        if entry is None:
+            continue
+        score, deadline = entry
+        if deadline < today:
+            score_cache.discard((PROMPT_VERSION, norm, r.id))
+            continue
+        found[r.id] = score
+
+    missing = [r for r in recruits if r.id not in found]
+    if missing:
+        try:
+            rows = get_rerank_scores(norm, PROMPT_VERSION, [r.id for r in missing])
+        except Exception as e:
+            logging.warning(f"[reranker] 점수 캐시 조회 실패: {e}")
+            rows = {}
+        for r in missing:
+            if r.id in rows:
+                found[r.id] = rows[r.id]
+                score_cache.put((PROMPT_VERSION, norm, r.id), (rows[r.id], r.deadline))
+    return found
+
+
+def _store_scores(norm: str, recruits: list[RecruitOut], scores: dict):
+    from db.io import save_rerank_scores
+
+    for r in recruits:
+        if r.id in scores:
+            score_cache.put((PROMPT_VERSION, norm, r.id), (scores[r.id], r.deadline))
     try:
-        first_line = raw.strip().splitlines()[0]
-        scores = []
-        for token in first_line.replace("，", ",").split(","):
-            token = token.strip()
-            try:
-                scores.append(float(token))
-            except ValueError:
-                # 숫자가 아닌 토큰 무시
-                continue
-        # 개수 맞추기
-        while len(scores) < n:
-            scores.append(5.0)
-        return scores[:n]
-    except Exception:
-        return [5.0] * n
+        save_rerank_scores(norm, PROMPT_VERSION, scores)
+    except Exception as e:
+        logging.warning(f"[reranker] 점수 캐시 저장 실패: {e}")
+
+
+def _score_batch(keyword: str, batch: list[RecruitOut]) -> dict:
+    """공고 묶음 1회 LLM 평가 → 파싱된 {recruit_id: 점수}. 실패 시 빈 dict."""
+    try:
+        raw = get_client().generate(
+            _build_prompt(keyword, batch), options={"temperature": 0.0, "num_predict": 40},
+            caller="reranker", model=MODEL,
+            stop=lambda text, n=len(batch): _scores_complete(text, n),
+        )
+    except Exception as e:
+        logging.warning(f"[reranker] LLM 호출 실패: {e}")
+        return {}
+    return {r.id: score for r, score in zip(batch, _parse_score_list(raw, len(batch)))}
+
+
+def _score_batches(keyword: str, recruits: list[RecruitOut], deadline: float = None,
+                   on_batch: Optional[Callable[[list[RecruitOut], dict], None]] = None) -> tuple[dict, int]:
+    """BATCH_SIZE씩 나눈 배치를 _executor로 동시에 평가 → ({recruit_id: 점수}, 마감 초과 배치 수).
+
+    deadline(초)이 지나면 그때까지 끝난 배치 점수만 돌려준다. 아직 시작하지 않은 배치는 취소한다.
+    on_batch(batch, scores)는 마감 안에 끝난 배치면 호출 스레드에서 바로, 이미 실행 중이던 배치면
+    끝나는 대로 _store_executor에서 호출해 다음 호출에서 쓸 수 있게 한다.
+    """
+    deadline = RERANK_DEADLINE_SECONDS if deadline is None else deadline
+    batches = [recruits[start:start + BATCH_SIZE] for start in range(0, len(recruits), BATCH_SIZE)]
+    futures = {_executor.submit(_score_batch, keyword, batch): batch for batch in batches}
+
+    scores = {}
+    pending = set(futures)
+    give_up_at = time.monotonic() + deadline
+    while pending:
+        remaining = give_up_at - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            batch_scores = future.result()
+            scores.update(batch_scores)
+            if on_batch is not None and batch_scores:
+                on_batch(futures[future], batch_scores)
+
+    def _store_late(future, batch):
+        if not future.cancelled() and future.result():
+            _store_executor.submit(on_batch, batch, future.result())
+
+    for future in pending:
+        if not future.cancel() and on_batch is not None:
+            future.add_done_callback(lambda f, b=futures[future]: _store_late(f, b))
+    return scores, len(pending)
 
 
 def rerank(keyword: str, recruits: list[RecruitOut]) -> list[RecruitOut]:
-    """공고 리스트를 keyword 관련도 순으로 재정렬. 실패 시 원본 순서 반환."""
+    """공고 리스트를 keyword 관련도 순으로 재정렬. 실패 시 원본 순서 반환.
+    캐시에 점수가 있는 공고는 LLM에 보내지 않는다. 점수가 없는 공고(LLM 실패·마감 초과)는 점수를 받은 공고와
+    섞지 않고 그 뒤에 입력(SQL) 순서대로 붙인다 — 기본 점수로 끼워 넣으면 점수 4·6 공고 사이 위치가 임의로 정해진다.
+    """
     if not recruits:
         return recruits
 
-    scored = []
-    for start in range(0, len(recruits), BATCH_SIZE):
-        batch = recruits[start:start + BATCH_SIZE]
-        prompt = _build_prompt(keyword, batch)
-        try:
-            resp = requests.post(OLLAMA_URL, json={
-                "model": MODEL,
-                "prompt": prompt,
-                "stream": False,
-                "options": {"temperature": 0.0, "num_predict": 40},
-            }, timeout=30)
-            resp.raise_for_status()
-            raw = resp.json()["response"]
-            scores = _parse_scores(raw, len(batch))
-        except Exception as e:
-            logging.warning(f"[reranker] LLM 호출 실패: {e}")
-            scores = [5.0] * len(batch)
+    norm = normalize_keyword(keyword)
+    scores = _lookup_scores(norm, recruits)
+    uncached = [r for r in recruits if r.id not in scores]
 
-        for recruit, score in zip(batch, scores):
-            scored.append((recruit, score))
+    t0 = time.perf_counter()
+    new_scores, timed_out = _score_batches(
+        keyword, uncached, on_batch=lambda batch, batch_scores: _store_scores(norm, batch, batch_scores),
+    )
+    scores.update(new_scores)
 
-    scored.sort(key=lambda x: x[1], reverse=True)
-    logging.info(f"[reranker] '{keyword}' 재순위 완료: {len(scored)}건")
-    return [r for r, _ in scored]
+    # 정렬은 안정 정렬이므로 같은 점수는 입력(SQL) 순서 유지
+    ordered = sorted((r for r in recruits if r.id in scores), key=lambda r: scores[r.id], reverse=True)
+    ordered += [r for r in recruits if r.id not in scores]
+    hits = len(recruits) - len(uncached)
+    calls_needed = math.ceil(len(recruits) / BATCH_SIZE)
+    calls_made = math.ceil(len(uncached) / BATCH_SIZE)
+    logging.info(
+        f"[reranker] '{keyword}' 재순위 완료: {len(recruits)}건 — 캐시 적중 {hits}/{len(recruits)} "
+        f"({hits / len(recruits):.0%}), LLM 호출 {calls_made}회 (절약 {calls_needed - calls_made}회), "
+        f"{time.perf_counter() - t0:.2f}초"
+        + (f", 마감 초과 {timed_out}배치는 SQL 순서 유지" if timed_out else "")
+    )
+    return ordered
@@ -1,25 +1,88 @@
 """
 data/ 디렉토리의 CSV 파일들을 DB에 일괄 적재하는 스크립트.
 
+1. 파일별 파싱을 프로세스 풀에서 병렬 실행 (today는 파일명에서 추출, 파일 내에서는 컬럼 단위 배치 파싱)
+2. 전체 파일에 걸쳐 (기업명, 공고명, 마감일) 기준 중복 제거 — 파일명 순서상 먼저 나온 행 유지
+3. 파일 순서대로 COPY 기반 bulk 적재(db.base.bulk_write), 파일 단위로 진행 상황 기록
+
+중단 후 --resume 으로 재실행하면 진행 파일에 완료로 기록된 CSV는 건너뛴다.
+파싱·적재에 실패한 파일이 있으면 일부만 적재된 상태를 보고하고 종료 코드 1로 끝난다. 적재 실패 시에는
+뒤 파일도 적재하지 않는다 — 뒤 파일의 중복 제거가 앞 파일을 전제로 하므로 --resume으로 실패한 파일부터 이어서 적재한다.
+
 Usage:
     python load_csv_data.py              # data/ 전체 CSV
     python load_csv_data.py --file data/jobkorea_data_2025-07-15.csv  # 특정 파일
+    python load_csv_data.py --workers 4 --resume
 """
 import argparse
 import glob
+import json
 import logging
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
 from dotenv import load_dotenv
 
 import log_config
-from db.base import csv_to_db, init_connection_pool
+from db.base import (
+    bulk_write, parse_csv_frame, csv_date_from_path,
+    connect_postgres, ensure_schema, init_connection_pool, release_connection,
+)
 
 load_dotenv(override=True)
 
+DEFAULT_PROGRESS_PATH = os.path.join('data', '.load_csv_progress.json')
+CHUNK_SIZE = 5000  # bulk_write 1회(=1 트랜잭션)당 행 수
+
+
+def parse_csv_file(path):
+    """CSV 1개 파싱 (프로세스 풀 워커). (path, 파싱된 행 리스트, 실패 행 수, 소요 초) 반환."""
+    t0 = time.perf_counter()
+    today = csv_date_from_path(path)  # today는 파일명에서 자동 추출
+    # csv.DictReader와 같게 모든 값을 문자열로, 빈 칸은 ''로 읽는다
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    rows, failed = parse_csv_frame(df, today)
+    return path, rows, failed, time.perf_counter() - t0
+
+
+def load_progress(progress_path):
+    if not os.path.exists(progress_path):
+        return {}
+    with open(progress_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_progress(progress_path, progress):
+    tmp_path = progress_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(progress, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, progress_path)  # 중단 시에도 진행 파일이 깨지지 않도록 원자적 교체
+
+
+def dedupe_across_files(files, parsed):
+    """파일 순서대로 (기업명, 공고명, 마감일) 중복을 제거. {path: rows} 반환."""
+    seen = set()
+    result = {}
+    for path in files:
+        unique = []
+        for row in parsed[path]:
+            key = (row['company_name'], row['announcement_name'], row['deadline'])
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(row)
+        result[path] = unique
+    return result
+
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--file', type=str, default=None, help='특정 CSV 파일 경로 (미지정 시 data/ 전체)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='파싱 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--resume', action='store_true', help='진행 파일에 완료로 기록된 CSV는 건너뜀')
+    parser.add_argument('--progress', type=str, default=DEFAULT_PROGRESS_PATH, help='진행 상황 기록 파일 경로')
     args = parser.parse_args()
 
     init_connection_pool()
@@ -29,17 +92,88 @@ def main():
     else:
         files = sorted(glob.glob(os.path.join('data', 'jobkorea_data*.csv')))
 
-    logging.info(f"총 {len(files)}개 파일 적재 시작")
+    progress = load_progress(args.progress) if args.resume else {}
+    done = [f for f in files if f in progress]
+    files = [f for f in files if f not in progress]
+    if done:
+        logging.info(f"--resume: 완료된 {len(done)}개 파일 건너뜀")
+        print(f"--resume: 완료된 {len(done)}개 파일 건너뜀")
+
+    logging.info(f"총 {len(files)}개 파일 적재 시작 (파싱 프로세스 {args.workers}개)")
+    print(f"총 {len(files)}개 파일 적재 시작 (파싱 프로세스 {args.workers}개)")
+    if not files:
+        return
+
+    # ── 1. 병렬 파싱 ─────────────────────────────────────────
+    t0 = time.perf_counter()
+    parsed = {}
+    parse_failed = []
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(parse_csv_file, path): path for path in files}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                _, rows, failed, elapsed = future.result()
+            except Exception as e:
+                logging.error(f"{path} 파싱 실패: {e}")
+                print(f"  [파싱 실패] {path}: {e}")
+                parse_failed.append(path)
+                continue
+            parsed[path] = rows
+            rate = len(rows) / elapsed if elapsed > 0 else 0
+            print(f"  [파싱] {path}: {len(rows):,}건 (실패 {failed}건) {elapsed:.1f}초, {rate:,.0f} rows/sec")
+    files = [f for f in files if f in parsed]
+    total_parsed = sum(len(rows) for rows in parsed.values())
+    print(f"파싱 완료: {total_parsed:,}건, {time.perf_counter() - t0:.1f}초")
+
+    # ── 2. 파일 간 중복 제거 ──────────────────────────────────
+    unique = dedupe_across_files(files, parsed)
+    total_unique = sum(len(rows) for rows in unique.values())
+    print(f"중복 제거: {total_parsed:,}건 → {total_unique:,}건")
+
+    # ── 3. 파일 순서대로 COPY 적재 ─────────────────────────────
+    loaded = 0
+    load_failed = None
+    conn = connect_postgres()
+    try:
+        ensure_schema(conn)
+        cursor = conn.cursor()
+        for i, path in enumerate(files, 1):
+            rows = unique[path]
+            t1 = time.perf_counter()
+            inserted = 0
+            try:
+                for start in range(0, len(rows), CHUNK_SIZE):
+                    inserted += len(bulk_write(conn, cursor, rows[start:start + CHUNK_SIZE]))
+            except Exception as e:
+                conn.rollback()
+                logging.error(f"[{i}/{len(files)}] {path} 적재 실패: {e}")
+                print(f"  [적재 실패] {path}: {e}")
+                load_failed = path
+                break
+            elapsed = time.perf_counter() - t1
+            rate = len(rows) / elapsed if elapsed > 0 else 0
+            progress[path] = {"rows": len(rows), "inserted": inserted}
+            save_progress(args.progress, progress)
+            loaded += 1
+            logging.info(f"[{i}/{len(files)}] {path} 완료: {len(rows):,}건 중 신규 {inserted:,}건 ({rate:,.0f} rows/sec)")
+            print(f"  [적재 {i}/{len(files)}] {path}: {len(rows):,}건 중 신규 {inserted:,}건, {elapsed:.1f}초, {rate:,.0f} rows/sec")
+    finally:
+        release_connection(conn)
 
-    for i, path in enumerate(files, 1):
-        logging.info(f"[{i}/{len(files)}] {path} 처리 중...")
-        try:
-            csv_to_db(path)  # today는 파일명에서 자동 추출
-            logging.info(f"[{i}/{len(files)}] {path} 완료")
-        except Exception as e:
-            logging.error(f"[{i}/{len(files)}] {path} 실패: {e}")
+    if parse_failed or load_failed:
+        skipped = len(files) - loaded - (1 if load_failed else 0)
+        message = (
+            f"CSV 일부만 적재됨: {loaded}/{len(files) + len(parse_failed)}개 파일 완료 "
+            f"(파싱 실패 {len(parse_failed)}개, 적재 실패 {1 if load_failed else 0}개, 미적재 {skipped}개) — "
+            f"--resume 으로 재실행하면 완료된 파일은 건너뛰고 나머지를 적재합니다."
+        )
+        logging.error(message)
+        print(message)
+        sys.exit(1)
 
     logging.info("전체 CSV 적재 완료")
+    print(f"전체 CSV 적재 완료 ({time.perf_counter() - t0:.1f}초)")
 
 
 if __name__ == "__main__":
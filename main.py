@@ -11,6 +11,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('--days', type=int, default=1, help='크롤링할 날짜 범위 (기본: 1일)')
     parser.add_argument('--fresh', action='store_true', help='크롤링 전 기존 공고 데이터 전체 삭제')
+    parser.add_argument('--skip-tagging', action='store_true',
+                        help='크롤링 후 LLM 태깅 큐를 처리하지 않음 (db/tag_worker.py를 별도로 운영할 때)')
+    parser.add_argument('--tag-threads', type=int, default=1, help='크롤링 후 태깅 큐 처리 스레드 수 (기본 1)')
     args = parser.parse_args()
 
     logging.info("프로그램 시작됨")
@@ -27,6 +30,13 @@ if __name__ == "__main__":
     except Exception as e:
         logging.error(f"예기치 못한 오류 발생: {e}")
 
+    if not args.skip_tagging:
+        try:
+            from db.tag_worker import drain
+            drain(threads=args.tag_threads)
+        except Exception as e:
+            logging.warning(f"LLM 태깅 큐 처리 실패 (미처리 작업은 큐에 남음): {e}")
+
     try:
         from analytics.snapshot import save_snapshot
         save_snapshot()
@@ -0,0 +1,103 @@
+"""
+batch_to_db 적재 모드별 처리량(rows/sec) 벤치마크.
+
+동일한 합성 배치를 각 모드로 적재해 소요 시간을 비교하고,
+측정이 끝나면 합성 데이터(기업명 접두어 기준)를 삭제합니다.
+
+Usage:
+    python tests/benchmark_ingest.py                 # 250건 × 8태그 (5페이지 flush 규모)
+    python tests/benchmark_ingest.py --rows 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.base import batch_to_db, connect_postgres, release_connection
+
+MODES = ["row", "savepoint", "bulk"]
+COMPANY_PREFIX = "__bench_ingest__"
+
+TAG_POOL = [
+    "백엔드", "Java", "Spring", "Python", "Django", "React", "데이터분석", "SQL",
+    "AWS", "Docker", "Kubernetes", "마케팅", "영업", "회계", "물류", "고객응대",
+]
+REGIONS = ["서울 강남구", "서울 마포구", "경기 성남시", "부산 해운대구", "인천 남동구"]
+
+
+def make_batch(n_rows: int, n_tags: int, run_tag: str) -> list[list]:
+    """크롤러 data_batch 형식의 합성 행 생성."""
+    rows = []
+    for i in range(n_rows):
+        tags = random.sample(TAG_POOL, n_tags)
+        rows.append([
+            f"{COMPANY_PREFIX}{run_tag}_{i % 40}",       # company
+            f"벤치마크 공고 {run_tag} #{i}",              # title
+            random.choice(["신입", "경력 3년↑", "경력무관"]),
+            random.choice(["학력무관", "대졸↑", "초대졸↑"]),
+            random.choice(["정규직", "계약직"]),
+            random.choice(REGIONS),
+            random.choice(["월 250만원", "3500만원", "회사내규"]),
+            "~12/31(수)",
+            ", ".join(tags[: n_tags // 2]),               # description
+            "·".join(tags[n_tags // 2:]),                 # position
+            f"https://www.jobkorea.co.kr/Recruit/GI_Read/{run_tag}{i}",
+        ])
+    return rows
+
+
+def cleanup(run_tag: str):
+    conn = connect_postgres()
+    try:
+        cur = conn.cursor()
+        cur.execute("""
+            DELETE FROM recruits WHERE company_id IN (
+                SELECT id FROM companies WHERE company_name LIKE %s
+            )
+        """, (f"{COMPANY_PREFIX}{run_tag}%",))
+        cur.execute("DELETE FROM companies WHERE company_name LIKE %s", (f"{COMPANY_PREFIX}{run_tag}%",))
+        conn.commit()
+    finally:
+        release_connection(conn)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=250, help="배치 행 수 (기본 250)")
+    parser.add_argument("--tags", type=int, default=8, help="행당 태그 수 (기본 8)")
+    args = parser.parse_args()
+
+    random.seed(42)
+    print("=" * 60)
+    print(f"  batch_to_db 적재 벤치마크 — {args.rows}건 × 태그 {args.tags}개")
+    print("=" * 60)
+
+    results = {}
+    for mode in MODES:
+        run_tag = f"{mode}_{uuid.uuid4().hex[:8]}"
+        batch = make_batch(args.rows, args.tags, run_tag)
+        try:
+            t0 = time.perf_counter()
+            new_ids = batch_to_db(batch, mode=mode)
+            elapsed = time.perf_counter() - t0
+        finally:
+            cleanup(run_tag)
+        results[mode] = elapsed
+        print(f"  [{mode:>9}] {elapsed:7.2f}초  {args.rows / elapsed:8.0f} rows/sec  (신규 {len(new_ids)}건)")
+
+    base = results["row"]
+    print("-" * 60)
+    for mode in MODES[1:]:
+        print(f"  {mode} vs row: {base / results[mode]:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
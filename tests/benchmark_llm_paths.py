@@ -0,0 +1,153 @@
+"""
+LLM 호출 경로(태깅·키워드 확장·재순위) 벤치마크 — tests/fake_ollama.py 대역 서버 사용, DB 불필요.
+
+실제 호출 함수(call_tagger, call_tagger_batch, 키워드 확장, 재순위 점수 평가)를 --concurrency개 스레드로
+대역 서버에 보내 경로별 처리 시간, 처리량, 지연 p50/p95, 오류·서킷 거절 수를 비교합니다.
+--error-rate / --latency 로 장애·과부하 상황에서 서킷 브레이커 동작도 확인할 수 있습니다.
+--modes 로 스트리밍 조기 종료(stream)와 응답 전체 대기(buffered)를 비교합니다 — 실제 모델처럼
+첫 줄 뒤에 부연 설명을 붙이는 응답 비율은 --ramble-rate, 토큰당 생성 시간은 --token-seconds.
+
+Usage:
+    python tests/benchmark_llm_paths.py                                    # 경로별 40회, 동시 4
+    python tests/benchmark_llm_paths.py --latency lognormal:0.8:0.6 --concurrency 8 --server-parallel 4
+    python tests/benchmark_llm_paths.py --error-rate 1.0 --paths expander  # Ollama 장애 시 fail-fast 확인
+    python tests/benchmark_llm_paths.py --token-seconds 0.02 --ramble-rate 0.5   # 스트리밍 조기 종료 효과
+    python tests/benchmark_llm_paths.py --url http://127.0.0.1:11435       # 별도로 띄운 대역 서버 사용
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import llm_client
+from db.models import RecruitOut
+from db.tagger import call_tagger, call_tagger_batch
+from discord_bot.keyword_expander import _expand_with_llm
+from discord_bot.reranker import _score_batches
+from tests.fake_ollama import start_fake_ollama
+
+TITLES = [
+    "백엔드 개발자 (Java/Spring)", "프론트엔드 React 개발자", "데이터 분석가 신입", "물류센터 관리자",
+    "회계·세무 담당자", "UI/UX 디자이너", "DevOps 엔지니어", "영업관리 경력직",
+]
+KEYWORDS = ["백엔드", "데이터 분석", "프론트엔드 개발자", "회계", "디자이너", "물류"]
+PATHS = ["tagger", "tagger_batch", "expander", "reranker"]
+MODES = ["buffered", "stream"]
+
+
+def _fake_recruits(n: int) -> list[RecruitOut]:
+    return [
+        RecruitOut(
+            id=i, company_name=f"회사{i}", announcement_name=TITLES[i % len(TITLES)], link=f"https://example.com/{i}",
+            deadline=date.today(), annual_salary=None, experience=None, education=None, form=None,
+            region_name="서울", tags=["Java", "Spring"] if i % 2 else [],
+        )
+        for i in range(n)
+    ]
+
+
+def make_tasks(path: str, calls: int, prompt_batch: int, rerank_size: int):
+    """경로별 호출 함수 리스트 (각 항목이 LLM 호출 1회)."""
+    if path == "tagger":
+        return [lambda i=i: call_tagger(TITLES[i % len(TITLES)], []) for i in range(calls)]
+    if path == "tagger_batch":
+        items = [(TITLES[j % len(TITLES)], []) for j in range(prompt_batch)]
+        return [lambda: call_tagger_batch(items) for _ in range(calls)]
+    if path == "expander":
+        # expand_keyword는 확장 캐시에서 응답하므로 LLM 경로만 측정
+        return [lambda i=i: _expand_with_llm(KEYWORDS[i % len(KEYWORDS)]) for i in range(calls)]
+    if path == "reranker":
+        # rerank는 점수 캐시에서 응답하므로 LLM 경로만 측정 — BATCH_SIZE(10)건마다 1회 호출, 배치는 동시 평가
+        recruits = _fake_recruits(rerank_size)
+        return [lambda i=i: _score_batches(KEYWORDS[i % len(KEYWORDS)], recruits) for i in range(calls)]
+    raise ValueError(path)
+
+
+def run_path(path: str, mode: str, base_url: str, args) -> dict:
+    client = llm_client.configure(base_url=base_url, stream=(mode == "stream"))
+    tasks = make_tasks(path, args.calls, args.prompt_batch, args.rerank_size)
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(lambda task: task(), tasks))
+    elapsed = time.perf_counter() - t0
+
+    calls = sum(s["calls"] for s in client.metrics.snapshot().values())
+    errors = sum(s["errors"] for s in client.metrics.snapshot().values())
+    latency = client.metrics.snapshot().get(path, {"p50_ms": 0.0, "p95_ms": 0.0, "ttft_p50_ms": 0.0})
+    saved = sum(s["tokens_saved"] for s in client.metrics.snapshot().values())
+    breaker = client.breaker.snapshot()
+    return {
+        "elapsed": elapsed,
+        "per_sec": len(tasks) / elapsed if elapsed else 0.0,
+        "llm_calls": calls,
+        "errors": errors,
+        "p50_ms": latency["p50_ms"],
+        "p95_ms": latency["p95_ms"],
+        "ttft_ms": latency["ttft_p50_ms"],
+        "tokens_saved": saved,
+        "rejected": breaker["rejected"],
+        "breaker": breaker["state"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paths", nargs="+", default=PATHS, choices=PATHS, help="측정할 경로")
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES, help="응답 수신 방식 (기본: 둘 다 비교)")
+    parser.add_argument("--calls", type=int, default=40, help="경로별 호출 수 (기본 40)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 호출 스레드 수 (기본 4)")
+    parser.add_argument("--prompt-batch", type=int, default=5, help="tagger_batch 프롬프트당 공고 수 (기본 5)")
+    parser.add_argument("--rerank-size", type=int, default=20, help="rerank 1회당 공고 수 (기본 20 → LLM 2회)")
+    parser.add_argument("--url", default=None, help="이미 실행 중인 대역/실제 Ollama 주소 (지정 시 내장 서버 미사용)")
+    parser.add_argument("--latency", default="fixed:0.2", help="내장 대역 서버 지연 분포 (기본 fixed:0.2)")
+    parser.add_argument("--token-seconds", type=float, default=0.0, help="내장 대역 서버 출력 토큰당 시간(초)")
+    parser.add_argument("--server-parallel", type=int, default=4, help="내장 대역 서버 동시 처리 슬롯 (기본 4)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="내장 대역 서버 500 응답 비율")
+    parser.add_argument("--garbage-rate", type=float, default=0.0, help="내장 대역 서버 파싱 불가 응답 비율")
+    parser.add_argument("--ramble-rate", type=float, default=0.0, help="내장 대역 서버 부연 설명 응답 비율")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        base_url = args.url
+    else:
+        server = start_fake_ollama(
+            latency=args.latency, parallel=args.server_parallel, token_seconds=args.token_seconds,
+            error_rate=args.error_rate, garbage_rate=args.garbage_rate, ramble_rate=args.ramble_rate, seed=42,
+        )
+        base_url = server.url
+
+    print("=" * 110)
+    print(f"  LLM 경로 벤치마크 — {base_url}, 경로별 {args.calls}회, 동시 {args.concurrency}")
+    if server:
+        print(f"  대역 서버: 지연 {args.latency} + 토큰당 {args.token_seconds}초, 슬롯 {args.server_parallel}, "
+              f"오류율 {args.error_rate}, 파싱 불가 {args.garbage_rate}, 부연 설명 {args.ramble_rate}")
+    print("=" * 110)
+    print(f"  {'경로':<14}{'모드':<10}{'소요(초)':>9}{'회/초':>8}{'LLM호출':>8}{'오류':>6}{'p50(ms)':>9}"
+          f"{'p95(ms)':>9}{'TTFT(ms)':>10}{'절약토큰':>9}{'서킷거절':>8}{'서킷':>10}")
+    try:
+        for path in args.paths:
+            for mode in args.modes:
+                r = run_path(path, mode, base_url, args)
+                print(
+                    f"  {path:<14}{mode:<10}{r['elapsed']:>9.2f}{r['per_sec']:>8.2f}{r['llm_calls']:>8}"
+                    f"{r['errors']:>6}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['ttft_ms']:>10.1f}"
+                    f"{r['tokens_saved']:>9}{r['rejected']:>8}{r['breaker']:>10}"
+                )
+    finally:
+        if server:
+            server.shutdown()
+            print("-" * 110)
+            print(f"  대역 서버 통계: {server.stats}")
+    print("=" * 110)
+
+
+if __name__ == "__main__":
+    main()
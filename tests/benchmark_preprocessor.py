@@ -0,0 +1,86 @@
+"""
+JobPreprocessor 스칼라 vs 배치(컬럼 단위) 파싱 처리량 벤치마크. DB 연결 불필요.
+
+컬럼별로 동일한 합성 원시 문자열을 스칼라 메서드(행 단위 루프)와 *_array 메서드로 파싱해
+소요 시간과 속도 향상 배율을 출력합니다.
+
+Usage:
+    python tests/benchmark_preprocessor.py              # 100만 행
+    python tests/benchmark_preprocessor.py --n 200000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.JobPreprocessor import JobPreprocessor as P
+
+TODAY = date(2025, 7, 15)
+
+RAW_POOLS = {
+    "경력": ["신입", "경력 3년↑", "경력무관", "신입·경력 2년↑", "경력 10년↑", ""],
+    "학력": ["학력무관", "고졸↑", "초대졸↑", "대졸↑", "석사↑", ""],
+    "형태": ["정규직", "계약직", "정규직·계약직", "인턴", "아르바이트", "3500만원", ""],
+    "지역": ["서울 강남구", "서울 마포구 외", "경기 성남시 분당구", "부산", "정규직", ""],
+    "연봉": ["월 250만원", "3,500만원", "회사내규", "일급 10만원", "월 300만원", ""],
+    "마감일": ["~12/31(수)", "~01/10(금)", "오늘마감", "내일마감", "상시채용", "~08/01(금)"],
+}
+
+CASES = [
+    # (이름, 원시 컬럼, 스칼라 함수, 배치 함수)
+    ("experience", "경력", P.parse_experience, P.parse_experience_array),
+    ("education", "학력", P.parse_education, P.parse_education_array),
+    ("form", "형태", P.parse_form, P.parse_form_array),
+    ("region", "지역", P.parse_region, P.parse_region_array),
+    ("salary", "연봉", P.parse_salary, P.parse_salary_array),
+    ("deadline", "마감일",
+     lambda v: P.parse_deadline(v, today=TODAY),
+     lambda values: P.parse_deadline_array(values, today=TODAY)),
+]
+
+
+def make_columns(n: int, seed: int = 42) -> dict:
+    rng = np.random.default_rng(seed)
+    return {col: np.array(pool, dtype=object)[rng.integers(0, len(pool), n)] for col, pool in RAW_POOLS.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=1_000_000, help="합성 행 수 (기본 1,000,000)")
+    args = parser.parse_args()
+
+    columns = make_columns(args.n)
+    print("=" * 60)
+    print(f"  JobPreprocessor 파싱 벤치마크 — {args.n:,}행")
+    print("=" * 60)
+    print(f"  {'컬럼':<12}{'스칼라(초)':>12}{'배치(초)':>12}{'배율':>10}")
+
+    total_scalar = total_array = 0.0
+    for name, col, scalar_fn, array_fn in CASES:
+        values = columns[col]
+
+        t0 = time.perf_counter()
+        [scalar_fn(v) for v in values]
+        scalar = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        array_fn(values)
+        array = time.perf_counter() - t0
+
+        total_scalar += scalar
+        total_array += array
+        print(f"  {name:<12}{scalar:>12.2f}{array:>12.2f}{scalar / array:>9.1f}x")
+
+    print("-" * 60)
+    print(f"  {'합계':<12}{total_scalar:>12.2f}{total_array:>12.2f}{total_scalar / total_array:>9.1f}x")
+    print(f"  배치 처리량: {args.n * len(CASES) / total_array:,.0f} values/sec")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+검색 실행 방식 벤치마크 — 인메모리 인덱스(db/search_index.py) vs SQL 1단계(ORM joinedload) vs SQL 2단계(id → 채우기)
+vs SQL 점수 검색(AND→OR 폴백→확장 재검색을 쿼리 1회로).
+
+tests/judge_queries.json 쿼리를 extract_filters()로 필터로 바꿔 sql_search와 같은 조건(limit 50, AND→OR 폴백,
+확장 키워드 OR, 결과 부족 시 확장 재검색)으로 각 방식을 실행하고 지연 p50/p95, 검색 1회당 SQL 실행 수,
+결과 일치(id·태그)를 비교합니다. 점수 검색(*_scored)은 같은 방식의 인덱스 결과와 순서까지, 기존 경로와는
+공고 집합을 비교합니다.
+--synthetic N 이면 DB 없이 합성 공고 N건으로 인덱스만 측정합니다.
+
+Usage:
+    python tests/benchmark_search_index.py                  # DB 유효 공고로 인덱스 구축, SQL 두 방식과 비교
+    python tests/benchmark_search_index.py --rtt-ms 2              # SQL 실행마다 2ms 왕복 지연 추가
+    python tests/benchmark_search_index.py --synthetic 50000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.JobPreprocessor import JobPreprocessor
+from db.search_index import SearchIndex, load_index
+from discord_bot.llm import extract_filters
+from tests.synthetic_recruits import EXPANSIONS, make_recruits
+
+QUERIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "judge_queries.json")
+
+
+def load_filter_sets() -> list[dict]:
+    """judge_queries.json → search_recruits_by_filter 인자 목록 (키워드 쿼리는 확장 키워드 OR 변형도 포함)."""
+    with open(QUERIES_PATH, encoding="utf-8") as f:
+        queries = json.load(f)
+    filter_sets = []
+    for i, q in enumerate(queries):
+        filters = extract_filters(q["query"])
+        kwargs = dict(
+            keyword=filters.get("keyword"), min_deadline=filters.get("min_deadline"),
+            min_annual_salary=filters.get("min_annual_salary"), company_name=filters.get("company_name"),
+            max_experience=filters.get("max_experience"), form=JobPreprocessor.parse_form(filters.get("form") or ""),
+            region=filters.get("region"), limit=50,
+        )
+        filter_sets.append(kwargs)
+        if kwargs["keyword"]:
+            expanded = [kwargs["keyword"]] + EXPANSIONS[i % len(EXPANSIONS)]
+            filter_sets.append({**kwargs, "expanded_keywords": expanded})
+            # sql_search: 확장 결과가 캐시에 있으면 결과 3건 미만일 때만 확장 OR 매칭
+            filter_sets.append({**kwargs, "expanded_keywords": expanded, "expand_below": 3})
+    return filter_sets
+
+
+def _timed(fn, kwargs: dict, repeat: int) -> tuple[list, list[float]]:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = fn(**kwargs)
+        times.append((time.perf_counter() - t0) * 1000)
+    return results, times
+
+
+def _pct(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic", type=int, default=0, help="DB 대신 합성 공고 N건으로 인덱스 구축 (SQL 비교 생략)")
+    parser.add_argument("--repeat", type=int, default=5, help="쿼리별 반복 횟수 (기본 5)")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="SQL 실행마다 더할 DB 왕복 지연(ms) — 원격 DB 모사")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    index = SearchIndex(make_recruits(args.synthetic)) if args.synthetic else load_index()
+    build_seconds = time.perf_counter() - t0
+
+    filter_sets = load_filter_sets()
+    from db.io import _search_recruits_sql, engine
+    modes = {
+        "index": lambda **kw: index.search(scored=False, **kw),
+        "index_scored": lambda **kw: index.search(scored=True, **kw),
+    }
+    if not args.synthetic:
+        modes["sql_orm"] = lambda **kw: _search_recruits_sql(two_phase=False, scored=False, **kw)
+        modes["sql_two_phase"] = lambda **kw: _search_recruits_sql(two_phase=True, scored=False, **kw)
+        modes["sql_scored"] = lambda **kw: _search_recruits_sql(scored=True, **kw)
+
+    statements = []
+    if not args.synthetic:
+        from sqlalchemy import event
+
+        def _on_execute(*_):
+            statements.append(1)
+            if args.rtt_ms:
+                time.sleep(args.rtt_ms / 1000)
+
+        event.listen(engine, "before_cursor_execute", _on_execute)
+
+    times = {mode: [] for mode in modes}
+    queries = {mode: 0 for mode in modes}
+    mismatches = []
+    for kwargs in filter_sets:
+        outputs = {}
+        for mode, search in modes.items():
+            before = len(statements)
+            results, samples = _timed(search, kwargs, args.repeat)
+            queries[mode] += len(statements) - before
+            times[mode].extend(samples)
+            outputs[mode] = [(r.id, sorted(r.tags)) for r in results]
+        for mode, output in outputs.items():
+            reference = outputs["index_scored" if mode.endswith("_scored") else "index"]
+            if output != reference or sorted(output) != sorted(outputs["index"]):
+                mismatches.append((mode, kwargs))
+
+    print("=" * 72)
+    print(f"  검색 인덱스 벤치마크 — 공고 {index.size}건, 쿼리 {len(filter_sets)}개 × {args.repeat}회")
+    print(f"  인덱스 구축 {build_seconds:.2f}초, {index.stats()}, DB 왕복 지연 +{args.rtt_ms}ms")
+    print("=" * 72)
+    print(f"  {'방식':<16}{'p50(ms)':>10}{'p95(ms)':>10}{'평균(ms)':>10}{'SQL/검색':>10}")
+    for mode, samples in times.items():
+        per_search = queries[mode] / len(samples)
+        print(f"  {mode:<16}{_pct(samples, 0.5):>10.3f}{_pct(samples, 0.95):>10.3f}"
+              f"{statistics.mean(samples):>10.3f}{per_search:>10.2f}")
+    print("-" * 72)
+    checks = len(filter_sets) * len(modes)
+    print(f"  결과 일치: {checks - len(mismatches)}/{checks}")
+    for mode, kwargs in mismatches:
+        print(f"  불일치 [{mode}]: {kwargs}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+tag_recruit_batch 동시 호출 수(parallelism)별 처리량 벤치마크.
+
+실제 Ollama 대신 로컬 대역 서버(tests/fake_ollama.py, 고정 지연 + 고정 태그 응답)를 띄우고
+합성 공고를 적재한 뒤 parallelism을 바꿔가며 태깅 시간을 측정합니다.
+대역 서버의 --server-parallel은 Ollama의 OLLAMA_NUM_PARALLEL에 해당합니다.
+측정이 끝나면 합성 데이터를 삭제합니다. (실 DB 필요)
+
+Usage:
+    python tests/benchmark_tagger.py                          # 60건, 지연 0.5초, 1/2/4/8
+    python tests/benchmark_tagger.py --rows 100 --latency 1.0 --levels 1 4 16
+    python tests/benchmark_tagger.py --prompt-batch 5       # 프롬프트당 5건 묶음
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import llm_client, tagger
+from db.base import batch_to_db
+from tests.benchmark_ingest import make_batch, cleanup
+from tests.fake_ollama import start_fake_ollama
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=60, help="태깅할 합성 공고 수 (기본 60)")
+    parser.add_argument("--latency", type=float, default=0.5, help="대역 서버 요청당 지연(초, 기본 0.5)")
+    parser.add_argument("--server-parallel", type=int, default=8, help="대역 서버 동시 처리 슬롯 (기본 8)")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8], help="비교할 parallelism 값")
+    parser.add_argument("--prompt-batch", type=int, default=1, help="프롬프트당 공고 수 (기본 1)")
+    args = parser.parse_args()
+
+    server = start_fake_ollama(latency=f"fixed:{args.latency}", parallel=args.server_parallel)
+    llm_client.configure(base_url=server.url)
+
+    print("=" * 60)
+    print(f"  tag_recruit_batch 벤치마크 — {args.rows}건, 지연 {args.latency}초, 서버 슬롯 {args.server_parallel}, "
+          f"프롬프트당 {args.prompt_batch}건")
+    print("=" * 60)
+
+    results = {}
+    try:
+        for level in args.levels:
+            run_tag = f"tag{level}_{uuid.uuid4().hex[:8]}"
+            try:
+                ids = batch_to_db(make_batch(args.rows, 2, run_tag), mode="bulk")
+                t0 = time.perf_counter()
+                stats = tagger.tag_recruit_batch(ids, parallelism=level, prompt_batch_size=args.prompt_batch)
+                elapsed = time.perf_counter() - t0
+            finally:
+                cleanup(run_tag)
+            results[level] = elapsed
+            print(
+                f"  parallelism={level:>3}  {elapsed:7.2f}초  {len(ids) / elapsed:7.2f}건/초  "
+                f"(태깅 {stats['tagged']} / 변화없음 {stats['skipped']} / 실패 {stats['failed']})"
+            )
+    finally:
+        server.shutdown()
+
+    for caller, s in llm_client.get_client().metrics.snapshot().items():
+        print(f"  [llm] {caller}: {s['calls']}회, p50 {s['p50_ms']}ms / p95 {s['p95_ms']}ms")
+    base = results[args.levels[0]]
+    print("-" * 60)
+    for level in args.levels[1:]:
+        print(f"  parallelism={level} vs {args.levels[0]}: {base / results[level]:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
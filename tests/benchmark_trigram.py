@@ -1,8 +1,15 @@
 """
-trigram GIN 인덱스 성능 벤치마크
+키워드 검색 전략 성능 벤치마크
 
-인덱스 활성화 vs 비활성화(강제 seqscan) 상태에서
+같은 키워드 목록으로 공고명·태그 부분 일치 검색을 세 가지 방식으로 실행해
 EXPLAIN ANALYZE 실행 시간을 비교합니다.
+
+- seqscan:    ILIKE '%kw%' + 인덱스 스캔 비활성화 (강제 seqscan)
+- trigram:    ILIKE '%kw%' + pg_trgm GIN 인덱스 (3글자 미만 검색어에는 인덱스를 쓰지 못함)
+- short_gram: short_grams 배열 GIN 인덱스 (migration v10) — 검색어의 1~2글자 gram을 모두 포함하는 행을 찾고,
+              3글자 이상이면 ILIKE로 재확인. search_recruits_by_filter는 1~2글자 토큰에 이 방식을 쓴다.
+
+태그는 검색 경로(tags_contain)와 같은 recruits.tag_names(tag_search_text trigram 인덱스)·tag_grams를 측정한다.
 """
 
 import os
@@ -75,70 +82,73 @@ def run_explain(cur, sql: str, params: tuple) -> tuple[float, list[str]]:
     return ms, rows
 
 
-def benchmark_query(conn, keyword: str, use_index: bool) -> list[float]:
-    """
-    announcement_name ILIKE 검색을 REPEAT 회 실행해 실행시간 목록 반환.
-    use_index=False 이면 bitmapscan/indexscan 비활성화로 seqscan 강제.
-    """
-    sql = """
-        SELECT r.id, r.announcement_name
-        FROM recruits r
-        WHERE r.announcement_name ILIKE %s
-        LIMIT 50
-    """
-    pattern = f"%{keyword}%"
-    times = []
+STRATEGIES = ["seqscan", "trigram", "short_gram"]
+
 
+def query_grams(keyword: str) -> list[str]:
+    """short_grams()와 같은 규칙의 검색어 gram — 1~2글자면 검색어 자체, 그 이상이면 공백 없는 2글자 gram."""
+    kw = keyword.lower()
+    if len(kw) <= 2:
+        return [kw]
+    return sorted({kw[i:i + 2] for i in range(len(kw) - 1) if not any(c.isspace() for c in kw[i:i + 2])})
+
+
+def _where(column: str, grams_column: str, keyword: str, strategy: str) -> tuple[str, tuple]:
+    if strategy != "short_gram":
+        return f"{column} ILIKE %s", (f"%{keyword}%",)
+    if len(keyword) <= 2:
+        return f"{grams_column} @> %s::text[]", (query_grams(keyword),)
+    return f"{grams_column} @> %s::text[] AND {column} ILIKE %s", (query_grams(keyword), f"%{keyword}%")
+
+
+def _set_strategy(cur, strategy: str):
+    enabled = "off" if strategy == "seqscan" else "on"
+    cur.execute(f"SET enable_bitmapscan = {enabled}")
+    cur.execute(f"SET enable_indexscan = {enabled}")
+
+
+def _measure(conn, sql: str, params: tuple, strategy: str) -> list[float]:
+    times = []
     with conn.cursor() as cur:
-        if not use_index:
-            cur.execute("SET enable_bitmapscan = off")
-            cur.execute("SET enable_indexscan = off")
-        else:
-            cur.execute("SET enable_bitmapscan = on")
-            cur.execute("SET enable_indexscan = on")
+        _set_strategy(cur, strategy)
 
         # 캐시 워밍업 1회 (측정 제외)
-        cur.execute(sql, (pattern,))
+        cur.execute(sql, params)
         cur.fetchall()
 
         for _ in range(REPEAT):
-            ms, _ = run_explain(cur, sql, (pattern,))
+            ms, _ = run_explain(cur, sql, params)
             times.append(ms)
 
     return times
 
 
-def benchmark_tag_query(conn, keyword: str, use_index: bool) -> list[float]:
+def benchmark_query(conn, keyword: str, strategy: str) -> list[float]:
     """
-    tag name ILIKE 검색 (JOIN) 성능 측정
+    announcement_name 부분 일치 검색을 REPEAT 회 실행해 실행시간 목록 반환.
     """
-    sql = """
-        SELECT DISTINCT r.id, r.announcement_name
+    where, params = _where("r.announcement_name", "r.title_grams", keyword, strategy)
+    sql = f"""
+        SELECT r.id, r.announcement_name
         FROM recruits r
-        JOIN recruit_tags rt ON rt.recruit_id = r.id
-        JOIN tags t ON t.id = rt.tag_id
-        WHERE t.name ILIKE %s
+        WHERE {where}
         LIMIT 50
     """
-    pattern = f"%{keyword}%"
-    times = []
-
-    with conn.cursor() as cur:
-        if not use_index:
-            cur.execute("SET enable_bitmapscan = off")
-            cur.execute("SET enable_indexscan = off")
-        else:
-            cur.execute("SET enable_bitmapscan = on")
-            cur.execute("SET enable_indexscan = on")
-
-        cur.execute(sql, (pattern,))
-        cur.fetchall()
+    return _measure(conn, sql, params, strategy)
 
-        for _ in range(REPEAT):
-            ms, _ = run_explain(cur, sql, (pattern,))
-            times.append(ms)
 
-    return times
+def benchmark_tag_query(conn, keyword: str, strategy: str) -> list[float]:
+    """
+    태그 부분 일치 검색 성능 측정 — tags_contain()처럼 recruits.tag_names·tag_grams만 본다 (JOIN 없음).
+    """
+    where, params = _where("tag_search_text(r.tag_names)", "r.tag_grams", keyword, strategy)
+    sql = f"""
+        SELECT r.id, r.announcement_name
+        FROM recruits r
+        WHERE {where}
+        LIMIT 50
+    """
+    return _measure(conn, sql, params, strategy)
 
 
 def get_table_stats(conn) -> dict:
@@ -163,39 +173,50 @@ def get_table_stats(conn) -> dict:
         cur.execute("""
             SELECT indexname, indexdef
             FROM pg_indexes
-            WHERE tablename IN ('recruits', 'tags')
-              AND indexdef ILIKE '%trgm%'
+            WHERE tablename = 'recruits'
+              AND (indexdef ILIKE '%trgm%' OR indexdef ILIKE '%grams%')
         """)
         stats["trigram_indexes"] = cur.fetchall()
 
     return stats
 
 
-def print_result(label: str, times_with: list[float], times_without: list[float]):
-    avg_with = statistics.mean(times_with)
-    avg_without = statistics.mean(times_without)
-    speedup = avg_without / avg_with if avg_with > 0 else float("inf")
-    reduction_pct = (1 - avg_with / avg_without) * 100 if avg_without > 0 else 0
+def print_result(label: str, times: dict[str, list[float]]) -> dict:
+    avgs = {strategy: statistics.mean(samples) for strategy, samples in times.items()}
+    best = min(avgs, key=avgs.get)
+    cells = "".join(f"{avgs[strategy]:>12.2f}" for strategy in STRATEGIES)
+    print(f"  {label:<24}{cells}   → {best}")
+    return {"label": label, "short": len(label.strip('"')) <= 2, "best": best,
+            **{f"{strategy}_ms": round(avgs[strategy], 2) for strategy in STRATEGIES}}
+
+
+def print_summary(title: str, results: list[dict]):
+    print(f"\n  [{title}]")
+    for group, rows in (("1~2글자", [r for r in results if r["short"]]),
+                        ("3글자 이상", [r for r in results if not r["short"]])):
+        if not rows:
+            continue
+        avgs = "  ".join(f"{strategy}={statistics.mean(r[f'{strategy}_ms'] for r in rows):.2f}ms"
+                         for strategy in STRATEGIES)
+        wins = ", ".join(f"{strategy} {sum(r['best'] == strategy for r in rows)}" for strategy in STRATEGIES)
+        print(f"    {group} ({len(rows)}개): 평균 {avgs}")
+        print(f"      가장 빠른 횟수: {wins}")
 
-    print(f"\n  [{label}]")
-    print(f"    seqscan (인덱스 없음): avg={avg_without:.2f}ms  "
-          f"(samples={[f'{t:.1f}' for t in times_without]})")
-    print(f"    trigram GIN (인덱스): avg={avg_with:.2f}ms  "
-          f"(samples={[f'{t:.1f}' for t in times_with]})")
-    print(f"    → 속도 향상: {speedup:.1f}x  /  응답시간 {reduction_pct:.0f}% 감소")
-    return {
-        "label": label,
-        "avg_without_ms": round(avg_without, 2),
-        "avg_with_ms": round(avg_with, 2),
-        "speedup_x": round(speedup, 1),
-        "reduction_pct": round(reduction_pct, 1),
-    }
+
+def run_section(conn, title: str, bench) -> list[dict]:
+    print(f"\n[{title}] — 각 키워드 {REPEAT}회 반복, 평균 실행시간(ms)")
+    print(f"  {'키워드':<24}" + "".join(f"{strategy:>12}" for strategy in STRATEGIES))
+    results = []
+    for kw in TEST_KEYWORDS:
+        times = {strategy: bench(conn, kw, strategy) for strategy in STRATEGIES}
+        results.append(print_result(f'"{kw}"', times))
+    return results
 
 
 def main():
-    print("=" * 60)
-    print("trigram GIN 인덱스 성능 벤치마크")
-    print("=" * 60)
+    print("=" * 72)
+    print("키워드 검색 전략 벤치마크 (seqscan / trigram / short_gram)")
+    print("=" * 72)
 
     conn = get_conn()
     conn.autocommit = True
@@ -206,7 +227,7 @@ def main():
     print(f"  recruits 행 수: {stats['recruits_count']:,}건")
     print(f"  tags 행 수:     {stats['tags_count']:,}건")
     print(f"  recruits 테이블 크기: {stats['recruits_total_size']}")
-    print(f"\n  trigram 인덱스 목록:")
+    print(f"\n  검색 인덱스 목록 (trigram / short_grams):")
     if stats["trigram_indexes"]:
         for name, defn in stats["trigram_indexes"]:
             print(f"    - {name}")
@@ -214,36 +235,16 @@ def main():
     else:
         print("    (없음)")
 
-    results = []
-
-    print(f"\n[announcement_name ILIKE 검색] — 각 키워드 {REPEAT}회 반복")
-    for kw in TEST_KEYWORDS:
-        times_with = benchmark_query(conn, kw, use_index=True)
-        times_without = benchmark_query(conn, kw, use_index=False)
-        r = print_result(f'"{kw}"', times_with, times_without)
-        results.append(r)
-
-    # 종합 요약
-    speedups = [r["speedup_x"] for r in results]
-    helped = [r for r in results if r["speedup_x"] >= 2.0]   # 실질적으로 도움된 케이스
-    neutral = [r for r in results if r["speedup_x"] < 2.0]   # 효과 없거나 미미한 케이스
+    title_results = run_section(conn, "announcement_name 검색", benchmark_query)
+    tag_results = run_section(conn, "tag_names 검색", benchmark_tag_query)
 
-    print("\n" + "=" * 60)
+    print("\n" + "=" * 72)
     print(f"[종합 요약] — {len(TEST_KEYWORDS)}개 키워드")
-    print(f"  전체 평균 속도 향상: {statistics.mean(speedups):.1f}x")
-    print(f"  중앙값:              {statistics.median(speedups):.1f}x")
-    print(f"  최대:                {max(speedups):.1f}x  ({results[speedups.index(max(speedups))]['label']})")
-    print(f"  최소:                {min(speedups):.1f}x  ({results[speedups.index(min(speedups))]['label']})")
-    print(f"\n  인덱스 실효 케이스 (2x 이상, {len(helped)}개):")
-    print(f"    평균 {statistics.mean(r['speedup_x'] for r in helped):.1f}x  "
-          f"/ 최대 {max(r['speedup_x'] for r in helped):.1f}x")
-    print(f"\n  효과 미미 케이스 (<2x, {len(neutral)}개):")
-    for r in sorted(neutral, key=lambda x: x["speedup_x"]):
-        print(f"    {r['label']}: {r['speedup_x']}x "
-              f"({r['avg_without_ms']}ms → {r['avg_with_ms']}ms)")
+    print_summary("announcement_name", title_results)
+    print_summary("tag_names", tag_results)
 
     conn.close()
-    print("=" * 60)
+    print("=" * 72)
 
 
 if __name__ == "__main__":
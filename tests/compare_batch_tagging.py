@@ -0,0 +1,121 @@
+"""
+태깅 프롬프트 배치 크기별 속도·품질 비교 스크립트.
+
+같은 샘플 공고를 단건 프롬프트(call_tagger)와 N건 묶음 프롬프트(call_tagger_batch)로 태깅해
+tags/sec, 공고/sec, 파싱 실패(단건 재시도) 비율, 단건 결과 대비 태그 일치도(Jaccard)를 비교합니다.
+
+Usage:
+    python tests/compare_batch_tagging.py
+    python tests/compare_batch_tagging.py --samples 40 --sizes 5 10
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.io import read_recruitOut
+from db.tagger import call_tagger, call_tagger_batch
+
+
+def jaccard(a: list[str], b: list[str]) -> float:
+    sa, sb = {t.lower() for t in a}, {t.lower() for t in b}
+    if not sa and not sb:
+        return 1.0
+    return len(sa & sb) / len(sa | sb)
+
+
+def run_single(items):
+    outputs = []
+    t0 = time.perf_counter()
+    for name, existing in items:
+        outputs.append(call_tagger(name, existing))
+    return outputs, time.perf_counter() - t0, 0
+
+
+def run_batched(items, size):
+    outputs = []
+    fallbacks = 0
+    t0 = time.perf_counter()
+    for start in range(0, len(items), size):
+        group = items[start:start + size]
+        results = call_tagger_batch(group, fallback=False)
+        for i, tags in enumerate(results):
+            if tags is None:
+                fallbacks += 1
+                results[i] = call_tagger(*group[i])
+        outputs.extend(results)
+    return outputs, time.perf_counter() - t0, fallbacks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=30, help="샘플 공고 수 (기본 30)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10], help="비교할 묶음 크기")
+    args = parser.parse_args()
+
+    print("DB에서 샘플 로딩 중...")
+    recruits = read_recruitOut(limit=5000, order_desc=True)
+    random.seed(42)
+    samples = random.sample(recruits, min(args.samples, len(recruits)))
+    items = [(r.announcement_name, r.tags or []) for r in samples]
+    print(f"{len(samples)}개 샘플 선택 완료\n")
+
+    modes = {"single": run_single(items)}
+    for size in args.sizes:
+        modes[f"batch{size}"] = run_batched(items, size)
+
+    single_outputs = modes["single"][0]
+
+    print("=" * 70)
+    print(f"  {'모드':<10}{'소요(초)':>10}{'공고/초':>10}{'tags/초':>10}{'평균태그':>10}{'재시도':>8}{'단건 일치':>10}")
+    print("=" * 70)
+    summary = {}
+    for mode, (outputs, elapsed, fallbacks) in modes.items():
+        n_tags = sum(len(o) for o in outputs if o)
+        succeeded = [o for o in outputs if o]
+        overlap = [
+            jaccard(o, s) for o, s in zip(outputs, single_outputs) if o and s
+        ]
+        summary[mode] = {
+            "elapsed_sec": round(elapsed, 2),
+            "postings_per_sec": round(len(items) / elapsed, 3) if elapsed else None,
+            "tags_per_sec": round(n_tags / elapsed, 2) if elapsed else None,
+            "avg_tags": round(n_tags / len(succeeded), 2) if succeeded else 0,
+            "failed": len(outputs) - len(succeeded),
+            "fallbacks": fallbacks,
+            "jaccard_vs_single": round(sum(overlap) / len(overlap), 3) if overlap else None,
+        }
+        m = summary[mode]
+        print(
+            f"  {mode:<10}{m['elapsed_sec']:>10.1f}{m['postings_per_sec']:>10.2f}{m['tags_per_sec']:>10.1f}"
+            f"{m['avg_tags']:>10.1f}{fallbacks:>8d}{(m['jaccard_vs_single'] or 0):>10.2f}"
+        )
+    print("=" * 70)
+    print("  단건 일치 = 단건 모드 결과와의 태그 Jaccard 평균 (단건 모드 자체의 샘플링 편차 포함)")
+
+    # JSON 저장
+    out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compare_batch_tagging_result.json")
+    output = {
+        "summary": summary,
+        "samples": [
+            {
+                "title": name,
+                "existing_tags": existing,
+                "results": {mode: modes[mode][0][i] for mode in modes},
+            }
+            for i, (name, existing) in enumerate(items)
+        ],
+    }
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,6 @@ import json
 import time
 import sys
 import os
-import requests
 from dotenv import load_dotenv
 
 load_dotenv(override=True)
@@ -16,8 +15,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from db.io import read_recruitOut
 from db.JobPreprocessor import JobPreprocessor
+from db.llm_client import get_client
 
-OLLAMA_URL = "http://192.168.219.114:11434/api/generate"
 MODELS = ["gemma3:4b", "qwen2.5:7b", "exaone3.5:7.8b"]
 N_SAMPLES = 10
 
@@ -42,15 +41,11 @@ def build_prompt(recruit) -> str:
 
 def call_llm(model: str, prompt: str) -> tuple[str, float]:
     t0 = time.perf_counter()
-    resp = requests.post(OLLAMA_URL, json={
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "options": {"temperature": 0.2, "num_predict": 80},
-    }, timeout=60)
-    resp.raise_for_status()
+    raw = get_client().generate(
+        prompt, options={"temperature": 0.2, "num_predict": 80}, caller=model, model=model, timeout=60,
+    )
     elapsed = time.perf_counter() - t0
-    return resp.json()["response"].strip(), elapsed
+    return raw.strip(), elapsed
 
 
 def main():
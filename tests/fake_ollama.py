@@ -0,0 +1,257 @@
+"""
+로컬 Ollama /api/generate 대역 서버.
+
+GPU 호스트 없이 태깅·키워드 확장·재순위 경로의 동시성·배치·서킷 브레이커 동작을 측정하기 위한 서버.
+프롬프트 종류를 판별해 각 파서가 기대하는 형식으로 응답한다.
+
+- 태깅 단건 (tagger.PROMPT_TEMPLATE)        → "백엔드, Java, Spring, ..."        (_parse_tags)
+- 태깅 묶음 (tagger.BATCH_PROMPT_TEMPLATE)  → "1. ...\\n2. ..." 항목 수만큼      (_parse_batch_tags)
+- 재순위 (reranker._build_prompt)           → "7, 3, 9, ..." 공고 수만큼        (_parse_scores)
+- 키워드 확장 (keyword_expander)             → "백엔드,Java,서버개발자,..."       (expand_keyword)
+- 그 외 (generate_testset 등)               → 자연어 검색어 1줄
+
+지연은 분포에서 샘플링한 처리 시간(첫 토큰까지) + 출력 토큰 수 × --token-seconds.
+동시 처리 슬롯(--parallel, Ollama의 OLLAMA_NUM_PARALLEL)을 넘는 요청은 슬롯이 빌 때까지 대기한다.
+--ramble-rate 비율의 응답은 실제 모델처럼 첫 줄 뒤에 부연 설명을 붙여 num_predict 토큰까지 생성한다.
+"stream": true 요청에는 토큰(약 2자)마다 줄 단위 JSON을 chunked로 보내고, 클라이언트가 연결을 끊으면 생성을 멈춘다.
+
+Usage:
+    python tests/fake_ollama.py --port 11435                                  # 단독 실행
+    python tests/fake_ollama.py --latency lognormal:0.8:0.5 --parallel 4 --error-rate 0.05
+    OLLAMA_URL=http://127.0.0.1:11435 python db/tag_recruits.py --limit 100  # 실제 스크립트를 대역 서버로
+
+    from tests.fake_ollama import start_fake_ollama                           # 테스트·벤치마크에서
+    server = start_fake_ollama(latency="fixed:0.2", parallel=8)
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CANNED_TAGS = "백엔드, Java, Spring, MySQL, 서버개발"
+CANNED_EXPANSION = "백엔드,Java,Spring,서버개발자,API서버,Kotlin,백엔드개발자"
+CANNED_QUERY = "서울 백엔드 신입 공고"
+RAMBLE = "\n\n위 결과는 공고명과 기존 태그를 바탕으로 직무와 기술 스택을 중심으로 정리한 것입니다. "
+
+_BATCH_ITEM_RE = re.compile(r"^\d+\. 공고명:", re.M)
+_RERANK_ITEM_RE = re.compile(r"^\d+\. .* \| 태그:", re.M)
+_EXPAND_RE = re.compile(r"채용 검색 쿼리: '(.+?)'")
+
+
+def parse_latency(spec: str):
+    """지연 분포 문자열 → 샘플링 함수(초).
+
+    fixed:S           항상 S초
+    uniform:A:B       A~B초 균등분포
+    lognormal:M:SIG   중앙값 M초, 로그 표준편차 SIG (긴 꼬리 — 실제 LLM 응답 분포에 가까움)
+    """
+    kind, *params = spec.split(":")
+    values = [float(p) for p in params]
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal" and len(values) == 2:
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1])
+    raise ValueError(f"지연 분포 형식 오류: {spec} (fixed:S | uniform:A:B | lognormal:M:SIG)")
+
+
+def _scores(prompt: str, n: int) -> str:
+    # 같은 프롬프트에는 같은 점수 — 재순위 결과를 실행 간 비교할 수 있게
+    seed = int.from_bytes(hashlib.blake2b(prompt.encode(), digest_size=4).digest(), "big")
+    rng = random.Random(seed)
+    return ", ".join(str(rng.randint(0, 10)) for _ in range(n))
+
+
+def canned_response(prompt: str) -> str:
+    """프롬프트 종류에 맞는 응답 본문."""
+    if "구독 키워드:" in prompt and "점수:" in prompt:
+        return _scores(prompt, len(_RERANK_ITEM_RE.findall(prompt)))
+    if m := _EXPAND_RE.search(prompt):
+        return f"{m.group(1).replace(' ', '')},{CANNED_EXPANSION}"
+    n_items = len(_BATCH_ITEM_RE.findall(prompt))
+    if n_items:
+        return "\n".join(f"{i}. {CANNED_TAGS}" for i in range(1, n_items + 1))
+    if "공고명:" in prompt:
+        return CANNED_TAGS
+    return CANNED_QUERY
+
+
+def _approx_tokens(text: str) -> int:
+    # 한국어 위주 텍스트 기준 대략 2자당 1토큰
+    return max(1, len(text) // 2)
+
+
+def _tokenize(text: str) -> list[str]:
+    return [text[i:i + 2] for i in range(0, len(text), 2)]
+
+
+def _ramble(response: str, num_predict: int) -> str:
+    """첫 줄 뒤에 부연 설명을 붙여 num_predict 토큰 분량까지 늘린다."""
+    extra = max(0, num_predict * 2 - len(response))
+    return response + (RAMBLE * (extra // len(RAMBLE) + 1))[:extra]
+
+
+class FakeOllamaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency: str = "fixed:0.5", parallel: int = 4, token_seconds: float = 0.0,
+                 error_rate: float = 0.0, garbage_rate: float = 0.0, ramble_rate: float = 0.0, seed: int = None):
+        super().__init__(address, _Handler)
+        self.sample_latency = parse_latency(latency)
+        self.slots = threading.Semaphore(parallel)
+        self.token_seconds = token_seconds
+        self.error_rate = error_rate
+        self.garbage_rate = garbage_rate
+        self.ramble_rate = ramble_rate
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "garbage": 0, "waiting": 0, "max_waiting": 0,
+                      "tokens_generated": 0, "cancelled": 0}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, key, delta=1):
+        with self.stats_lock:
+            self.stats[key] += delta
+            if key == "waiting":
+                self.stats["max_waiting"] = max(self.stats["max_waiting"], self.stats["waiting"])
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive — 클라이언트 커넥션 풀 재사용 확인용
+    disable_nagle_algorithm = True  # 헤더·본문 분할 전송 시 delayed ACK(~40ms) 방지
+    server: FakeOllamaServer
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._reply(404, {"error": "not found"})
+            return
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        prompt = payload.get("prompt", "")
+        server = self.server
+        server._count("requests")
+
+        with server.rng_lock:
+            latency = server.sample_latency(server.rng)
+            fail = server.rng.random() < server.error_rate
+            garbage = server.rng.random() < server.garbage_rate
+            ramble = server.rng.random() < server.ramble_rate
+
+        response = "죄송합니다, 요청을 이해하지 못했습니다." if garbage else canned_response(prompt)
+        if ramble:
+            response = _ramble(response, payload.get("options", {}).get("num_predict", 128))
+        tokens = _tokenize(response)
+
+        server._count("waiting")
+        with server.slots:
+            server._count("waiting", -1)
+            time.sleep(latency)
+            if fail:
+                server._count("errors")
+                self._reply(500, {"error": "fake ollama: injected error"})
+                return
+            if garbage:
+                server._count("garbage")
+            if payload.get("stream"):
+                self._stream(payload, prompt, tokens)
+                return
+            time.sleep(len(tokens) * server.token_seconds)
+            server._count("tokens_generated", len(tokens))
+
+        self._reply(200, {
+            "model": payload.get("model"),
+            "response": response,
+            "done": True,
+            "prompt_eval_count": _approx_tokens(prompt),
+            "eval_count": len(tokens),
+        })
+
+    def _stream(self, payload: dict, prompt: str, tokens: list[str]):
+        """토큰마다 줄 단위 JSON 청크 전송. 클라이언트가 끊으면 남은 토큰은 생성하지 않는다."""
+        server = self.server
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        sent = 0
+        try:
+            for token in tokens:
+                if sent:
+                    time.sleep(server.token_seconds)
+                self._write_chunk({"model": payload.get("model"), "response": token, "done": False})
+                sent += 1
+            self._write_chunk({
+                "model": payload.get("model"), "response": "", "done": True,
+                "prompt_eval_count": _approx_tokens(prompt), "eval_count": sent,
+            })
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            server._count("cancelled")
+            self.close_connection = True
+        finally:
+            server._count("tokens_generated", sent)
+
+    def _write_chunk(self, body: dict):
+        data = json.dumps(body, ensure_ascii=False).encode() + b"\n"
+        self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _reply(self, status: int, body: dict):
+        data = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fake_ollama(host: str = "127.0.0.1", port: int = 0, **kwargs) -> FakeOllamaServer:
+    """백그라운드 스레드에서 대역 서버 시작. 인자는 FakeOllamaServer와 같고, 종료는 server.shutdown()."""
+    server = FakeOllamaServer((host, port), **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True, name="fake-ollama").start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency", default="fixed:0.5", help="지연 분포 (fixed:S | uniform:A:B | lognormal:M:SIG)")
+    parser.add_argument("--token-seconds", type=float, default=0.0, help="출력 토큰당 생성 시간(초)")
+    parser.add_argument("--parallel", type=int, default=4, help="동시 처리 슬롯 (OLLAMA_NUM_PARALLEL)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--garbage-rate", type=float, default=0.0, help="파싱 불가 응답 비율 (0~1)")
+    parser.add_argument("--ramble-rate", type=float, default=0.0, help="첫 줄 뒤 부연 설명을 num_predict까지 붙이는 비율")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeOllamaServer(
+        (args.host, args.port), latency=args.latency, parallel=args.parallel, token_seconds=args.token_seconds,
+        error_rate=args.error_rate, garbage_rate=args.garbage_rate, ramble_rate=args.ramble_rate, seed=args.seed,
+    )
+    print(f"fake ollama: {server.url}/api/generate (지연 {args.latency}, 슬롯 {args.parallel}, "
+          f"오류율 {args.error_rate}) — Ctrl+C로 종료")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\n{server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,6 @@ import random
 import sys
 import time
 
-import requests
 from dotenv import load_dotenv
 
 load_dotenv(override=True)
@@ -21,8 +20,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from db.io import read_recruitOut, get_employment_type_name
 from db.JobPreprocessor import JobPreprocessor
+from db.llm_client import first_line_complete, get_client
 
-OLLAMA_URL = "http://192.168.219.114:11434/api/generate"
 MODEL = "exaone3.5:7.8b"
 DEFAULT_OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "testset.json")
 
@@ -51,14 +50,11 @@ def build_prompt(recruit) -> str:
 
 
 def call_llm(prompt: str) -> str:
-    resp = requests.post(OLLAMA_URL, json={
-        "model": MODEL,
-        "prompt": prompt,
-        "stream": False,
-        "options": {"temperature": 0.7, "num_predict": 60},
-    }, timeout=30)
-    resp.raise_for_status()
-    return resp.json()["response"].strip().strip('"').strip()
+    raw = get_client().generate(
+        prompt, options={"temperature": 0.7, "num_predict": 60}, caller="testset", model=MODEL,
+        stop=first_line_complete,
+    )
+    return raw.strip().strip('"').strip()
 
 
 def sample_diverse(recruits, n: int):
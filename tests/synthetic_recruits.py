@@ -0,0 +1,36 @@
+"""
+검색 테스트·벤치마크용 합성 공고 — tests/test_search_index.py와 tests/benchmark_search_index.py가 같이 쓴다.
+"""
+import random
+from datetime import date, timedelta
+
+from db.models import RecruitOut
+
+TITLE_WORDS = [
+    "백엔드", "프론트엔드", "데이터", "분석가", "엔지니어", "개발자", "신입", "경력", "채용", "모집",
+    "물류센터", "관리자", "회계", "세무", "디자이너", "UI/UX", "DevOps", "AI", "QA", "보안", "영업",
+    "마케팅", "Java", "Spring", "React", "Python", "간호사", "생산직", "CS", "상담원", "정규직",
+]
+TAG_POOL = [
+    "백엔드", "Java", "Spring", "Python", "Django", "React", "데이터분석", "SQL", "AWS", "Docker",
+    "Kubernetes", "마케팅", "영업", "회계", "물류", "고객응대", "AI", "머신러닝", "보안", "QA",
+]
+REGIONS = ["서울 강남구", "서울 마포구", "경기 성남시", "부산 해운대구", "인천 남동구", None]
+EXPANSIONS = [["백엔드", "서버개발자", "Java", "Spring"], ["데이터 분석", "SQL", "데이터분석"], ["물류", "창고", "입출고"]]
+
+
+def make_recruits(n: int, seed: int = 0) -> list[RecruitOut]:
+    """합성 유효 공고 n건 (id 1..n)."""
+    rng = random.Random(seed)
+    today = date.today()
+    return [
+        RecruitOut(
+            id=i, company_name=f"회사{rng.randrange(max(1, n // 5))}",
+            announcement_name=" ".join(rng.sample(TITLE_WORDS, rng.randint(2, 5))),
+            link=f"https://example.com/{i}", deadline=today + timedelta(days=rng.randint(-3, 30)),
+            annual_salary=rng.choice([None, 2800, 3500, 4200, 6000]), experience=rng.choice([None, 0, 1, 3, 5]),
+            education=None, form=rng.choice([None, 1, 2, 3]), region_name=rng.choice(REGIONS),
+            tags=rng.sample(TAG_POOL, rng.randint(0, 6)),
+        )
+        for i in range(1, n + 1)
+    ]
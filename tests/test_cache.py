@@ -0,0 +1,63 @@
+"""
+db/cache.py 단위 테스트 — DB 연결 불필요
+"""
+from db.cache import LRUCache, DimensionCache
+
+
+class TestLRUCache:
+    def test_hit_and_miss_counted(self):
+        c = LRUCache("t", maxsize=2)
+        c.put("a", 1)
+        assert c.get("a") == 1
+        assert c.get("b") is None
+        assert c.stats() == {"size": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_evicts_least_recently_used(self):
+        c = LRUCache("t", maxsize=2)
+        c.put("a", 1)
+        c.put("b", 2)
+        c.get("a")          # a를 최근 사용으로 갱신
+        c.put("c", 3)       # b가 제거되어야 함
+        assert "a" in c and "c" in c
+        assert "b" not in c
+
+    def test_clear(self):
+        c = LRUCache("t", maxsize=2)
+        c.put("a", 1)
+        c.clear()
+        assert len(c) == 0
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+
+class TestDimensionCache:
+    def test_loader_called_only_on_miss(self):
+        calls = []
+        c = DimensionCache("tags", maxsize=10, warm_sql="SELECT")
+
+        def loader(name):
+            calls.append(name)
+            return 42
+
+        assert c.get_or_create("Java", loader) == 42
+        assert c.get_or_create("Java", loader) == 42
+        assert calls == ["Java"]
+
+    def test_warm_prefers_first_rows_on_eviction(self):
+        # 워밍업 쿼리는 인기순 정렬 → 첫 행이 LRU에서 가장 늦게 제거되어야 함
+        c = DimensionCache("tags", maxsize=2, warm_sql="SELECT")
+        loaded = c.warm(FakeCursor([("hot", 1), ("cold", 2)]))
+        assert loaded == 2 and c.warmed
+        c.put("new", 3)
+        assert "hot" in c
+        assert "cold" not in c
@@ -0,0 +1,73 @@
+"""
+tests/fake_ollama.py 응답 형식 테스트 — 대역 서버 응답을 실제 파서가 해석하는지 확인 (DB 연결 불필요)
+"""
+import pytest
+
+from db.llm_client import LLMClient, LLMError, first_line_complete
+from db.tagger import BATCH_PROMPT_TEMPLATE, PROMPT_TEMPLATE, _parse_batch_tags, _parse_tags
+from discord_bot.keyword_expander import PROMPT_TEMPLATE as EXPAND_TEMPLATE
+from discord_bot.reranker import _build_prompt, _parse_scores
+from tests.benchmark_llm_paths import _fake_recruits
+from tests.fake_ollama import canned_response, parse_latency, start_fake_ollama
+
+
+class TestCannedResponse:
+    def test_single_tag_prompt(self):
+        prompt = PROMPT_TEMPLATE.format(announcement_name="백엔드 개발자", existing_tags="없음")
+        assert _parse_tags(canned_response(prompt)) == ["백엔드", "Java", "Spring", "MySQL", "서버개발"]
+
+    def test_batch_tag_prompt(self):
+        lines = "\n".join(f"{i}. 공고명: 공고{i} | 기존태그: 없음" for i in range(1, 4))
+        raw = canned_response(BATCH_PROMPT_TEMPLATE.format(recruit_lines=lines))
+        assert all(tags for tags in _parse_batch_tags(raw, 3))
+
+    def test_rerank_prompt_has_one_score_per_recruit(self):
+        raw = canned_response(_build_prompt("백엔드", _fake_recruits(7)))
+        assert len(raw.split(",")) == 7
+        assert all(0 <= s <= 10 for s in _parse_scores(raw, 7))
+
+    def test_expansion_prompt_starts_with_keyword(self):
+        raw = canned_response(EXPAND_TEMPLATE.format(keyword="데이터 분석"))
+        assert raw.splitlines()[0].split(",")[0] == "데이터분석"
+
+
+class TestLatency:
+    def test_distributions(self):
+        import random
+        rng = random.Random(0)
+        assert parse_latency("fixed:0.3")(rng) == 0.3
+        assert 0.1 <= parse_latency("uniform:0.1:0.2")(rng) <= 0.2
+        assert parse_latency("lognormal:0.5:0.4")(rng) > 0
+        with pytest.raises(ValueError):
+            parse_latency("normal:1")
+
+
+class TestServer:
+    def test_round_trip_and_injected_errors(self):
+        server = start_fake_ollama(latency="fixed:0", parallel=2, error_rate=1.0)
+        try:
+            client = LLMClient(base_url=server.url, max_retries=0)
+            with pytest.raises(LLMError):
+                client.generate("공고명: 테스트")
+            server.error_rate = 0.0
+            assert client.generate("공고명: 테스트") == "백엔드, Java, Spring, MySQL, 서버개발"
+            assert server.stats["requests"] == 2 and server.stats["errors"] == 1
+        finally:
+            server.shutdown()
+
+    def test_streaming_stops_after_first_line(self):
+        server = start_fake_ollama(latency="fixed:0", parallel=2, token_seconds=0.002, ramble_rate=1.0)
+        try:
+            client = LLMClient(base_url=server.url)
+            options = {"num_predict": 60}
+            raw = client.generate("공고명: 테스트", options=options, caller="s", stop=first_line_complete)
+            assert _parse_tags(raw) == ["백엔드", "Java", "Spring", "MySQL", "서버개발"]
+            full = client.generate("공고명: 테스트", options=options, caller="b")
+            assert len(full) > len(raw)
+
+            s = client.metrics.snapshot()
+            assert s["s"]["early_stops"] == 1 and s["s"]["tokens_saved"] > 0
+            assert s["s"]["ttft_p50_ms"] <= s["s"]["p50_ms"]
+            assert s["b"]["early_stops"] == 0
+        finally:
+            server.shutdown()
@@ -0,0 +1,70 @@
+"""
+discord_bot/keyword_expander.py 확장 캐시 테스트 — DB·LLM 연결 불필요 (조회·저장·LLM 호출을 대역으로 교체)
+"""
+import time
+
+import pytest
+
+import db.io
+from discord_bot import keyword_expander as ke
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """DB 행 dict와 LLM 호출 기록을 돌려주고, 백그라운드 갱신은 즉시 실행."""
+    rows, llm_calls = {}, []
+
+    def llm(keyword):
+        llm_calls.append(keyword)
+        return ke._with_keyword(keyword, ["백엔드", "Java"])
+
+    monkeypatch.setattr(db.io, "get_keyword_expansion", lambda norm, version: rows.get((norm, version)))
+    monkeypatch.setattr(db.io, "save_keyword_expansion",
+                        lambda norm, version, model, tags: rows.__setitem__((norm, version), (tags, 0.0)))
+    monkeypatch.setattr(ke, "_expand_with_llm", llm)
+    monkeypatch.setattr(ke, "llm_available", lambda: True)
+    monkeypatch.setattr(ke._refresh_executor, "submit", lambda fn, *args: fn(*args))
+    ke.expansion_cache.clear()
+    yield rows, llm_calls
+    ke.expansion_cache.clear()
+
+
+class TestExpansionCache:
+    def test_llm_called_once_per_normalized_keyword(self, fake_backend):
+        rows, llm_calls = fake_backend
+        assert ke.expand_keyword("서버 개발") == ["서버 개발", "백엔드", "Java"]
+        # 공백·대소문자만 다른 키워드는 같은 캐시 항목 — 원본 키워드만 바꿔 끼움
+        assert ke.expand_keyword("  서버   개발 ") == ["  서버   개발 ", "서버 개발", "백엔드", "Java"]
+        assert llm_calls == ["서버 개발"]
+        assert ("서버 개발", ke.PROMPT_VERSION) in rows
+
+    def test_db_hit_fills_lru(self, fake_backend):
+        rows, llm_calls = fake_backend
+        rows[("회계", ke.PROMPT_VERSION)] = (["회계", "세무"], 10.0)
+        assert ke.expand_keyword("회계") == ["회계", "세무"]
+        assert ke.expansion_cache.get("회계")[0] == ["회계", "세무"]
+        assert llm_calls == []
+
+    def test_stale_entry_is_served_then_refreshed(self, fake_backend, monkeypatch):
+        rows, llm_calls = fake_backend
+        ke.expansion_cache.put("회계", (["회계", "세무"], time.time() - ke.EXPANSION_TTL_SECONDS - 1))
+        assert ke.expand_keyword("회계") == ["회계", "세무"]
+        assert llm_calls == ["회계"]
+        assert ke.expansion_cache.get("회계")[0] == ["회계", "백엔드", "Java"]
+
+    def test_failures_are_not_cached(self, fake_backend, monkeypatch):
+        rows, llm_calls = fake_backend
+        monkeypatch.setattr(ke, "llm_available", lambda: False)
+        assert ke.expand_keyword("물류") == ["물류"]
+        assert "물류" not in ke.expansion_cache and not rows
+
+    def test_cached_expansion_reads_lru_only(self, fake_backend):
+        rows, llm_calls = fake_backend
+        rows[("회계", ke.PROMPT_VERSION)] = (["회계", "세무"], 10.0)
+        # DB에만 있으면 아직 None — sql_search가 기존 2단계 경로로 간다
+        assert ke.cached_expansion("회계") is None
+        ke.expand_keyword("회계")
+        assert ke.cached_expansion("회계") == ["회계", "세무"]
+        ke.expansion_cache.put("물류", (["물류"], time.time()))
+        assert ke.cached_expansion("물류") is None
+        assert llm_calls == []
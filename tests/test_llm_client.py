@@ -0,0 +1,156 @@
+"""
+db/llm_client.py 단위 테스트 — Ollama 연결 불필요 (Session.post를 대역으로 교체)
+"""
+import pytest
+import requests
+
+from db.llm_client import CircuitBreaker, CircuitOpenError, LLMClient, LLMError
+
+
+class FakeResp:
+    def __init__(self, status=200, body=None):
+        self.status_code = status
+        self._body = body or {"response": "백엔드, Java", "prompt_eval_count": 12, "eval_count": 5}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+    def json(self):
+        return self._body
+
+    def close(self):
+        pass
+
+
+def make_client(monkeypatch, responses, **kwargs):
+    client = LLMClient(base_url="http://llm.test:11434/", backoff_base=0, **kwargs)
+    calls = []
+
+    def post(url, json=None, timeout=None, stream=False):
+        calls.append((url, json, timeout))
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(client.session, "post", post)
+    return client, calls
+
+
+class TestGenerate:
+    def test_success_records_tokens(self, monkeypatch):
+        client, calls = make_client(monkeypatch, [FakeResp()])
+        assert client.generate("p", options={"num_predict": 10}, caller="tagger", model="m") == "백엔드, Java"
+        url, payload, timeout = calls[0]
+        assert url == "http://llm.test:11434/api/generate"
+        assert payload == {"model": "m", "prompt": "p", "stream": False, "options": {"num_predict": 10}}
+        s = client.metrics.snapshot()["tagger"]
+        assert (s["calls"], s["errors"], s["prompt_tokens"], s["completion_tokens"]) == (1, 0, 12, 5)
+
+    def test_retries_connection_error_and_5xx(self, monkeypatch):
+        client, calls = make_client(
+            monkeypatch, [requests.ConnectionError("refused"), FakeResp(503), FakeResp()], max_retries=2
+        )
+        assert client.generate("p", caller="x") == "백엔드, Java"
+        assert len(calls) == 3
+        assert client.metrics.snapshot()["x"]["retries"] == 2
+
+    def test_gives_up_after_max_retries(self, monkeypatch):
+        client, calls = make_client(monkeypatch, [FakeResp(503), FakeResp(503)], max_retries=1)
+        with pytest.raises(LLMError):
+            client.generate("p", caller="x")
+        assert len(calls) == 2
+        assert client.metrics.snapshot()["x"]["errors"] == 1
+
+    def test_no_retry_on_client_error_or_read_timeout(self, monkeypatch):
+        client, calls = make_client(monkeypatch, [FakeResp(400), requests.ReadTimeout("slow")], max_retries=3)
+        with pytest.raises(LLMError):
+            client.generate("p")
+        with pytest.raises(LLMError):
+            client.generate("p")
+        assert len(calls) == 2
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    def make(self, **kwargs):
+        clock = FakeClock()
+        return CircuitBreaker(failure_threshold=2, slow_seconds=5, reset_seconds=30, clock=clock, **kwargs), clock
+
+    def test_opens_after_consecutive_failures(self):
+        breaker, _ = self.make()
+        breaker.record_failure()
+        breaker.record_success(0.1)  # 성공하면 연속 실패 수 초기화
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open" and breaker.is_open
+        assert not breaker.allow_request()
+
+    def test_slow_success_counts_as_failure(self):
+        breaker, _ = self.make()
+        breaker.record_success(6)
+        breaker.record_success(6)
+        assert breaker.state == "open"
+
+    def test_half_open_allows_single_probe(self):
+        breaker, clock = self.make()
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 31
+        assert not breaker.is_open  # 시험 호출 시점 → 호출자가 LLM 경로로 진입
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # 시험 호출 진행 중에는 나머지 거절
+        breaker.record_failure()
+        assert breaker.state == "open"
+        clock.now = 62
+        assert breaker.allow_request()
+        breaker.record_success(0.1)
+        assert breaker.state == "closed" and breaker.allow_request()
+
+    def test_slow_threshold_scales_with_call_timeout(self, monkeypatch):
+        import db.llm_client
+
+        class FakeTime:
+            now = 0.0
+
+            def perf_counter(self):
+                return self.now
+
+        fake_time = FakeTime()
+        monkeypatch.setattr(db.llm_client, "time", fake_time)
+        breaker = CircuitBreaker(failure_threshold=2, slow_seconds=15)
+        client, _ = make_client(monkeypatch, [], breaker=breaker, timeout=30)
+
+        def post(url, json=None, timeout=None, stream=False):
+            fake_time.now += 25  # 배치 태깅 정상 응답 시간
+            return FakeResp()
+
+        monkeypatch.setattr(client.session, "post", post)
+        # call_tagger_batch(5건)와 같은 timeout=80 → 지연 기준 40초: 25초 응답은 정상
+        for _ in range(3):
+            client.generate("p", caller="tagger_batch", timeout=30 + 10 * 5)
+        assert breaker.state == "closed"
+        # 기본 타임아웃 호출에서 25초는 여전히 지연 응답
+        client.generate("p")
+        client.generate("p")
+        assert breaker.state == "open"
+
+    def test_client_fails_fast_while_open(self, monkeypatch):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30, clock=clock)
+        client, calls = make_client(monkeypatch, [requests.ReadTimeout("slow")], breaker=breaker)
+        with pytest.raises(LLMError):
+            client.generate("p")
+        with pytest.raises(CircuitOpenError):
+            client.generate("p")
+        assert len(calls) == 1
+        assert breaker.snapshot()["rejected"] == 1
@@ -0,0 +1,44 @@
+"""
+load_csv_data.py 파일 간 중복 제거·진행 파일 단위 테스트 — DB 연결 불필요
+"""
+import json
+
+from load_csv_data import dedupe_across_files, load_progress, save_progress
+
+
+def _row(company, title, deadline="2025-07-31", **extra):
+    return {"company_name": company, "announcement_name": title, "deadline": deadline, **extra}
+
+
+class TestDedupeAcrossFiles:
+    def test_first_file_in_order_wins(self):
+        files = ["a.csv", "b.csv"]
+        parsed = {
+            "b.csv": [_row("회사", "백엔드", link="b"), _row("회사", "프론트", link="b")],
+            "a.csv": [_row("회사", "백엔드", link="a")],
+        }
+        result = dedupe_across_files(files, parsed)
+        assert [r["link"] for r in result["a.csv"]] == ["a"]
+        assert [r["announcement_name"] for r in result["b.csv"]] == ["프론트"]
+
+    def test_key_includes_deadline_and_dedupes_within_file(self):
+        parsed = {"a.csv": [
+            _row("회사", "백엔드"), _row("회사", "백엔드", deadline="2025-08-31"), _row("회사", "백엔드"),
+        ]}
+        assert len(dedupe_across_files(["a.csv"], parsed)["a.csv"]) == 2
+
+
+class TestProgress:
+    def test_missing_file_is_empty(self, tmp_path):
+        assert load_progress(str(tmp_path / "none.json")) == {}
+
+    def test_round_trip_replaces_atomically(self, tmp_path):
+        path = str(tmp_path / "progress.json")
+        save_progress(path, {"data/a.csv": {"rows": 10, "inserted": 7}})
+        save_progress(path, {"data/a.csv": {"rows": 10, "inserted": 7}, "data/b.csv": {"rows": 3, "inserted": 3}})
+        assert load_progress(path) == {
+            "data/a.csv": {"rows": 10, "inserted": 7}, "data/b.csv": {"rows": 3, "inserted": 3},
+        }
+        assert not (tmp_path / "progress.json.tmp").exists()
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)["data/b.csv"]["rows"] == 3
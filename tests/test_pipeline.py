@@ -0,0 +1,104 @@
+"""
+crawling/pipeline.py 단위 테스트 — DB·브라우저 불필요
+"""
+import threading
+import time
+
+import pytest
+
+from crawling.pipeline import IngestPipeline
+
+
+class FakeWriter:
+    def __init__(self, delay=0.0):
+        self.batches = []
+        self.delay = delay
+
+    def __call__(self, rows):
+        time.sleep(self.delay)
+        self.batches.append(list(rows))
+        return [r for r in rows if r % 2 == 0]   # 짝수만 신규 삽입됐다고 가정
+
+
+class TestIngestPipeline:
+    def test_flush_by_row_count_and_on_close(self):
+        writer = FakeWriter()
+        with IngestPipeline(writer, flush_rows=3, flush_seconds=60) as p:
+            for i in range(7):
+                p.put(i)
+        assert [len(b) for b in writer.batches] == [3, 3, 1]
+        assert sum(writer.batches, []) == list(range(7))
+        assert p.flushes == 3 and p.write_stats.items == 7
+
+    def test_flush_by_elapsed_time(self):
+        writer = FakeWriter()
+        p = IngestPipeline(writer, flush_rows=100, flush_seconds=0.05).start()
+        p.put(1)
+        time.sleep(0.3)
+        assert writer.batches == [[1]]
+        p.close()
+
+    def test_new_ids_handed_to_tagger(self):
+        tagged = []
+
+        def tag_fn(ids):
+            tagged.extend(ids)
+            return {"tagged": len(ids), "skipped": 0, "failed": 0}
+
+        with IngestPipeline(FakeWriter(), tag_fn=tag_fn, flush_rows=2) as p:
+            for i in range(5):
+                p.put(i)
+        assert tagged == [0, 2, 4]
+        assert p.tag_stats.items == 3
+
+    def test_backpressure_blocks_producer(self):
+        release = threading.Event()
+
+        def slow_writer(rows):
+            release.wait(2)
+            return []
+
+        p = IngestPipeline(slow_writer, flush_rows=1, max_queue=1).start()
+        p.put(0)          # writer가 가져가 적재 중(블로킹)
+        p.put(1)          # 큐 1칸 채움
+        t = threading.Thread(target=p.put, args=(2,))
+        t.start()
+        t.join(0.2)
+        assert t.is_alive()   # 큐가 가득 차 대기 중
+        release.set()
+        t.join(2)
+        p.close()
+        assert p.put_wait_seconds > 0.1
+
+    def test_write_failure_is_retried(self):
+        calls = []
+
+        def flaky(rows):
+            calls.append(list(rows))
+            if len(calls) == 1:
+                raise RuntimeError("db down")
+            return []
+
+        with IngestPipeline(flaky, flush_rows=1, retry_delay=0) as p:
+            p.put(0)
+            p.put(1)
+        assert calls == [[0], [0], [1]]
+        assert p.write_stats.errors == 1 and p.write_stats.items == 2 and p.failed_rows == 0
+
+    def test_persistent_write_failure_raised_from_close(self):
+        calls = []
+
+        def broken(rows):
+            calls.append(list(rows))
+            if rows == [0]:
+                raise ValueError("db down")
+            return []
+
+        p = IngestPipeline(broken, flush_rows=1, write_retries=2, retry_delay=0).start()
+        p.put(0)
+        p.put(1)   # 실패한 배치 뒤의 행은 계속 적재된다
+        with pytest.raises(RuntimeError, match="1건 적재 실패") as exc:
+            p.close()
+        assert isinstance(exc.value.__cause__, ValueError)
+        assert calls == [[0], [0], [0], [1]]
+        assert p.failed_rows == 1 and p.write_stats.errors == 3 and p.write_stats.items == 1
@@ -0,0 +1,37 @@
+"""
+db/prefilter.py 단위 테스트 — DB 연결 불필요
+"""
+from datetime import date
+
+from db.JobPreprocessor import JobPreprocessor
+from db.prefilter import KnownPostings, link_key, posting_key
+
+LINK = "https://www.jobkorea.co.kr/Recruit/GI_Read/1"
+
+
+class TestKnownPostings:
+    def test_loaded_link_is_skipped(self):
+        known = KnownPostings([link_key(LINK)])
+        assert known.seen("A", "공고", "~12/31(수)", LINK)
+        assert known.stats()["skipped_link"] == 1
+
+    def test_loaded_posting_key_matches_parsed_deadline(self):
+        # DB에는 파싱된 마감일(date)이 저장되므로 원시 문자열을 같은 방식으로 파싱해 비교해야 함
+        deadline = JobPreprocessor.parse_deadline("~12/31(수)")
+        known = KnownPostings([posting_key("A", "공고", deadline)])
+        assert known.seen("A", "공고", "~12/31(수)", "https://other")
+        assert not known.seen("A", "공고", "상시채용", "https://other")
+        assert known.stats() == {
+            "checked": 2, "skipped": 1, "skipped_link": 0, "skipped_posting": 1, "skip_rate": 0.5,
+        }
+
+    def test_added_rows_are_skipped_within_run(self):
+        known = KnownPostings()
+        assert not known.seen("A", "공고", "오늘마감", LINK)
+        known.add("A", "공고", "오늘마감", LINK)
+        assert known.seen("A", "공고", "오늘마감", LINK)
+        assert len(known) == 2
+
+    def test_unknown_is_not_skipped(self):
+        known = KnownPostings([link_key(LINK), posting_key("A", "공고", date(9999, 12, 31))])
+        assert not known.seen("B", "다른 공고", "상시채용", "https://other")
@@ -0,0 +1,90 @@
+"""
+JobPreprocessor 배치(컬럼 단위) 파싱 단위 테스트 — DB 연결 불필요
+
+각 *_array 결과가 같은 입력에 대한 스칼라 메서드 결과와 행 단위로 일치하는지 확인한다.
+"""
+from datetime import date
+
+import pandas as pd
+
+from db.JobPreprocessor import JobPreprocessor as P
+
+TODAY = date(2025, 7, 15)
+
+
+def _scalar(fn, values, **kwargs):
+    return [fn(v, **kwargs) for v in values]
+
+
+class TestArrayParity:
+    def test_experience(self):
+        values = ["신입", "경력 3년↑", "경력무관", "신입·경력 2년", "10년", "abc", "", ",", None, 5]
+        assert P.to_python_list(P.parse_experience_array(values)) == _scalar(P.parse_experience, values)
+
+    def test_education(self):
+        values = ["학력무관", "대졸↑", " 석사↑ ", "중졸", "", None]
+        assert P.to_python_list(P.parse_education_array(values)) == _scalar(P.parse_education, values)
+
+    def test_form(self):
+        values = ["정규직", "계약직·인턴", "개인사업자", "교육생", "3500", "무엇", "", None]
+        assert P.to_python_list(P.parse_form_array(values)) == _scalar(P.parse_form, values)
+
+    def test_region(self):
+        values = ["서울 강남구", "서울", "서울 외", "경기 성남시 분당구", "정규직", "  ", "", None]
+        region, subregion = P.parse_region_array(values)
+        expected = [r if r else (None, None) for r in _scalar(P.parse_region, values)]
+        assert list(zip(region, subregion)) == expected
+
+    def test_salary(self):
+        values = ["월 250만원", "3500만원", "1,200만원", "일급 10만원", "월 0만원", "월", "회사내규", "", None]
+        assert P.to_python_list(P.parse_salary_array(values)) == _scalar(P.parse_salary, values)
+
+    def test_deadline(self):
+        values = ["~12/31(수)", "~01/10(금)", "~07/15(화)", "오늘마감", "내일마감", "모레마감",
+                  "상시채용", "xx", "", None]
+        assert P.to_python_list(P.parse_deadline_array(values, today=TODAY)) == \
+            _scalar(P.parse_deadline, values, today=TODAY)
+
+    def test_invalid_deadline_is_nat(self):
+        # 스칼라는 ValueError, 배치는 해당 행만 NaT(None)
+        assert P.to_python_list(P.parse_deadline_array(["~02/30(x)", "~12/31(수)"], today=TODAY)) == \
+            [None, date(2025, 12, 31)]
+
+    def test_fullwidth_digits(self):
+        # \d는 전각 숫자도 잡으므로 스칼라와 같은 값이 나와야 한다
+        exp = ["３년", "경력 ５년↑", "１０년"]
+        assert P.to_python_list(P.parse_experience_array(exp)) == _scalar(P.parse_experience, exp) == [3, 5, 10]
+        sal = ["５,０００만원", "월 ２５０만원", "５，０００만원"]
+        assert P.to_python_list(P.parse_salary_array(sal)) == _scalar(P.parse_salary, sal)
+        assert P.to_python_list(P.parse_salary_array(sal[:2])) == [5000, 3000]
+
+    def test_accepts_series_with_index(self):
+        s = pd.Series(["신입", "경력 5년↑"], index=[10, 20])
+        assert P.to_python_list(P.parse_experience_array(s)) == [0, 5]
+
+
+class TestArrayValidation:
+    def test_validate_salary(self):
+        values = [100, 3000, None, 60000]
+        validated, rules = P.validate_salary_array(values)
+        expected = [P.validate_salary(v) for v in values]
+        assert P.to_python_list(validated) == [v for v, _ in expected]
+        assert rules.tolist() == [r for _, r in expected]
+
+    def test_validate_experience(self):
+        values = [-1, 3, None, 40]
+        validated, rules = P.validate_experience_array(values)
+        expected = [P.validate_experience(v) for v in values]
+        assert P.to_python_list(validated) == [v for v, _ in expected]
+        assert rules.tolist() == [r for _, r in expected]
+
+    def test_quality_log_rows(self):
+        _, rules = P.validate_salary_array([100, 3000])
+        rows = P.quality_log_rows("b1", ["A", "B"], ["t1", "t2"], "annual_salary", rules, ["월 8만원", "3000만원"], [100, 3000])
+        assert rows == [("b1", "A", "t1", "annual_salary", "below_minimum(600)", "월 8만원", "100")]
+
+    def test_quality_log_missing_value_matches_scalar(self):
+        # 배치의 pd.NA가 "<NA>"로, 스칼라의 None이 "None"으로 갈라지지 않고 둘 다 NULL
+        parsed = pd.Series([None, 3000], dtype="Int64")
+        rows = P.quality_log_rows("b1", ["A", "B"], ["t1", "t2"], "annual_salary", ["r", "r"], ["x", "y"], parsed)
+        assert [row[-1] for row in rows] == [P.quality_log_value(None), "3000"] == [None, "3000"]
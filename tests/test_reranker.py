@@ -0,0 +1,154 @@
+"""
+discord_bot/reranker.py 점수 캐시 테스트 — DB·LLM 연결 불필요 (조회·저장·LLM 호출을 대역으로 교체)
+"""
+from datetime import date, timedelta
+
+import threading
+import time
+
+import pytest
+
+import db.io
+from discord_bot import reranker
+from tests.benchmark_llm_paths import _fake_recruits
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """DB 행 dict와 LLM에 보낸 공고 id 묶음 기록을 돌려줌. LLM은 id를 점수로 돌려준다."""
+    rows, llm_batches = {}, []
+
+    def score_batch(keyword, batch):
+        llm_batches.append([r.id for r in batch])
+        return {r.id: float(r.id) for r in batch}
+
+    monkeypatch.setattr(db.io, "get_rerank_scores",
+                        lambda norm, version, ids: {i: rows[(norm, i)] for i in ids if (norm, i) in rows})
+    monkeypatch.setattr(db.io, "save_rerank_scores",
+                        lambda norm, version, scores: rows.update({(norm, i): s for i, s in scores.items()}))
+    monkeypatch.setattr(reranker, "_score_batch", score_batch)
+    reranker.score_cache.clear()
+    yield rows, llm_batches
+    reranker.score_cache.clear()
+
+
+class TestParseScores:
+    def test_partial_scores_are_not_padded(self):
+        assert reranker._parse_score_list("7, 3, x\n설명", 4) == [7.0, 3.0]
+        assert reranker._parse_scores("7, 3", 4) == [7.0, 3.0, 5.0, 5.0]
+        assert reranker._parse_score_list("", 3) == []
+
+
+class TestScoreCache:
+    def test_only_uncached_pairs_go_to_llm(self, fake_backend):
+        rows, llm_batches = fake_backend
+        recruits = _fake_recruits(12)
+        assert [r.id for r in reranker.rerank("백엔드", recruits)][:3] == [11, 10, 9]
+        assert sorted(llm_batches) == [list(range(10)), [10, 11]]
+
+        llm_batches.clear()
+        more = recruits + _fake_recruits(15)[12:]
+        reranker.rerank(" 백엔드 ", more)  # 정규화 키워드가 같으면 같은 캐시
+        assert llm_batches == [[12, 13, 14]]
+
+    def test_db_hit_without_lru(self, fake_backend):
+        rows, llm_batches = fake_backend
+        rows.update({("회계", i): 10.0 - i for i in range(5)})
+        assert [r.id for r in reranker.rerank("회계", _fake_recruits(5))] == [0, 1, 2, 3, 4]
+        assert llm_batches == []
+
+    def test_expired_posting_score_is_evicted(self, fake_backend):
+        rows, llm_batches = fake_backend
+        recruit = _fake_recruits(1)[0]
+        reranker.score_cache.put((reranker.PROMPT_VERSION, "물류", recruit.id), (9.0, date.today() - timedelta(days=1)))
+        reranker.rerank("물류", [recruit])
+        assert llm_batches == [[recruit.id]]
+
+    def test_failed_batch_keeps_sql_order_and_is_not_cached(self, fake_backend, monkeypatch):
+        rows, llm_batches = fake_backend
+        monkeypatch.setattr(reranker, "_score_batch", lambda keyword, batch: {})
+        recruits = _fake_recruits(3)
+        assert reranker.rerank("디자이너", recruits) == recruits
+        assert not rows and len(reranker.score_cache) == 0
+
+
+class TestParallelBatches:
+    def test_slow_batch_past_deadline_keeps_sql_order(self, fake_backend, monkeypatch):
+        rows, llm_batches = fake_backend
+        release = threading.Event()
+
+        def score_batch(keyword, batch):
+            if batch[0].id == 0:
+                release.wait(5)  # 첫 배치만 마감 이후에 끝남
+            return {r.id: float(r.id) for r in batch}
+
+        monkeypatch.setattr(reranker, "_score_batch", score_batch)
+        monkeypatch.setattr(reranker, "RERANK_DEADLINE_SECONDS", 0.2)
+        recruits = _fake_recruits(15)
+        ordered = [r.id for r in reranker.rerank("백엔드", recruits)]
+        # 둘째 배치(10~14)만 점수를 받고, 점수 없는 첫 배치는 그 뒤에 SQL 순서 유지
+        assert ordered == [14, 13, 12, 11, 10, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+        # 마감 뒤에 끝난 배치도 캐시에 저장돼 다음 호출에서 쓰인다
+        release.set()
+        for _ in range(100):
+            if len(rows) == 15:
+                break
+            time.sleep(0.01)
+        assert len(rows) == 15
+
+    def test_unscored_go_after_all_scored(self, fake_backend, monkeypatch):
+        rows, llm_batches = fake_backend
+        release = threading.Event()
+
+        def score_batch(keyword, batch):
+            if batch[0].id == 10:
+                release.wait(5)
+            # 첫 배치는 기본 점수(5.0) 양쪽에 걸친 점수
+            return {r.id: float(r.id % 3) * 4 for r in batch}
+
+        monkeypatch.setattr(reranker, "_score_batch", score_batch)
+        monkeypatch.setattr(reranker, "RERANK_DEADLINE_SECONDS", 0.2)
+        try:
+            ordered = [r.id for r in reranker.rerank("백엔드", _fake_recruits(15))]
+        finally:
+            release.set()
+        assert ordered == [2, 5, 8, 1, 4, 7, 0, 3, 6, 9, 10, 11, 12, 13, 14]
+
+    def test_cache_writes_leave_llm_workers(self, fake_backend, monkeypatch):
+        rows, llm_batches = fake_backend
+        release = threading.Event()
+        writers = {}
+
+        def score_batch(keyword, batch):
+            if batch[0].id == 0:
+                release.wait(5)
+            return {r.id: 1.0 for r in batch}
+
+        def save(norm, version, scores):
+            writers[min(scores)] = threading.current_thread().name
+
+        monkeypatch.setattr(reranker, "_score_batch", score_batch)
+        monkeypatch.setattr(db.io, "save_rerank_scores", save)
+        monkeypatch.setattr(reranker, "RERANK_DEADLINE_SECONDS", 0.2)
+        reranker.rerank("백엔드", _fake_recruits(15))
+        # 마감 안에 끝난 배치는 호출 스레드에서 저장
+        assert writers == {10: threading.current_thread().name}
+        release.set()
+        for _ in range(100):
+            if 0 in writers:
+                break
+            time.sleep(0.01)
+        assert writers[0].startswith("reranker-store")
+
+    def test_batches_run_concurrently(self, fake_backend, monkeypatch):
+        rows, llm_batches = fake_backend
+        barrier = threading.Barrier(2, timeout=2)
+
+        def score_batch(keyword, batch):
+            barrier.wait()  # 두 배치가 동시에 실행되지 않으면 BrokenBarrierError
+            return {r.id: 1.0 for r in batch}
+
+        monkeypatch.setattr(reranker, "_score_batch", score_batch)
+        scores, timed_out = reranker._score_batches("회계", _fake_recruits(20), deadline=3)
+        assert len(scores) == 20 and timed_out == 0
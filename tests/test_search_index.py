@@ -0,0 +1,251 @@
+"""
+db/search_index.py 테스트 — DB 연결 불필요 (합성 공고로 인덱스 구축).
+
+SQL 경로(ILIKE 부분 일치 + 필터 + AND→OR 폴백)를 그대로 옮긴 단순 구현과 결과를 비교한다.
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from db.search_index import SearchIndex
+from tests.synthetic_recruits import EXPANSIONS, make_recruits
+
+TODAY = date.today()
+
+
+def _reference(recruits, keyword=None, min_deadline=None, min_annual_salary=None, company_name=None,
+               max_experience=None, form=None, region=None, limit=5, expanded_keywords=None, use_tags=True,
+               expand_below=0, scored=False):
+    """search_recruits_by_filter의 SQL 조건을 파이썬으로 옮긴 기준 구현 (AND → OR 폴백 → 확장 키워드 재검색을 차례로 실행)."""
+    def has(r, term, tags):
+        term = term.lower()
+        return term in r.announcement_name.lower() or (tags and any(term in t.lower() for t in r.tags))
+
+    def run(mode, expanded_keywords=expanded_keywords):
+        out = []
+        for r in sorted(recruits, key=lambda r: r.id, reverse=True):
+            if r.deadline < TODAY or (min_deadline and r.deadline < min_deadline):
+                continue
+            if min_annual_salary and (r.annual_salary is None or r.annual_salary < min_annual_salary):
+                continue
+            if company_name and company_name.lower() not in r.company_name.lower():
+                continue
+            if max_experience is not None and r.experience is not None and r.experience > max_experience:
+                continue
+            if form is not None and r.form != form:
+                continue
+            if region and (r.region_name is None or region.lower() not in r.region_name.lower()):
+                continue
+            if expanded_keywords:
+                if not any(has(r, kw, True) for kw in expanded_keywords):
+                    continue
+            elif keyword:
+                matches = [has(r, token, use_tags) for token in keyword.split()]
+                if not (all(matches) if mode == "and" else any(matches)):
+                    continue
+            out.append(r)
+        return out[:limit]
+
+    if expanded_keywords and not expand_below:
+        results = run("and")
+    else:
+        results = run("and", None)
+        if len(results) < (3 if use_tags else 1) and keyword and len(keyword.split()) > 1:
+            results = run("or", None)
+        if expanded_keywords and len(results) < expand_below:
+            results = run("and")
+    if scored:
+        terms = list(dict.fromkeys(t.lower() for t in (keyword or "").split() + list(expanded_keywords or [])))
+        weight = lambda r, t: 2 if t in r.announcement_name.lower() else 1 if any(t in g.lower() for g in r.tags) else 0
+        results = sorted(results, key=lambda r: (-sum(weight(r, t) for t in terms), -r.id))
+    return [r.id for r in results]
+
+
+@pytest.fixture(scope="module")
+def recruits():
+    return make_recruits(3000, seed=7)
+
+
+@pytest.fixture(scope="module")
+def index(recruits):
+    return SearchIndex(recruits)
+
+
+def _ids(results):
+    return [r.id for r in results]
+
+
+class TestMatchesSql:
+    @pytest.mark.parametrize("keyword", [
+        "AI", "qa", "보", "보안", "백엔드", "데이터 분석가", "spring", "Java 백엔드", "머신러닝",
+        "DevOps 엔지니어", "물류센터 관리자", "UI/UX", "없는키워드", "자 데",
+    ])
+    @pytest.mark.parametrize("use_tags", [True, False])
+    def test_keyword(self, recruits, index, keyword, use_tags):
+        kwargs = dict(keyword=keyword, limit=50, use_tags=use_tags)
+        assert _ids(index.search(**kwargs)) == _reference(recruits, **kwargs)
+
+    @pytest.mark.parametrize("kwargs", [
+        dict(region="서울"), dict(region="해운대"), dict(company_name="회사1"), dict(form=2),
+        dict(max_experience=1), dict(min_annual_salary=4000), dict(min_deadline=TODAY + timedelta(days=20)),
+        dict(keyword="개발자", region="경기", max_experience=3, form=1, min_annual_salary=3000),
+        dict(keyword="신입 간호사 생산직", region="서울"),
+    ])
+    def test_filters(self, recruits, index, kwargs):
+        kwargs = dict(kwargs, limit=50)
+        assert _ids(index.search(**kwargs)) == _reference(recruits, **kwargs)
+
+    @pytest.mark.parametrize("expanded", EXPANSIONS)
+    def test_expanded_keywords_ignore_use_tags(self, recruits, index, expanded):
+        kwargs = dict(keyword=expanded[0], expanded_keywords=expanded, limit=50, use_tags=False)
+        assert _ids(index.search(**kwargs)) == _reference(recruits, **kwargs)
+
+
+class TestScored:
+    """scored=True는 AND→OR 폴백→확장 재검색과 같은 공고를 점수(공고명 2, 태그 1)순으로 돌려준다."""
+
+    @pytest.mark.parametrize("keyword", ["백엔드", "Java 백엔드", "데이터 분석가", "간호사 Kubernetes", "없는키워드 QA"])
+    @pytest.mark.parametrize("expand_below", [0, 3, 60])
+    def test_matches_reference(self, recruits, index, keyword, expand_below):
+        kwargs = dict(keyword=keyword, expanded_keywords=[keyword] + EXPANSIONS[0], expand_below=expand_below, limit=50)
+        results = index.search(scored=True, **kwargs)
+        assert _ids(results) == _reference(recruits, scored=True, **kwargs)
+        # 순서만 다르고 공고 집합은 기존 경로와 같다
+        assert sorted(_ids(results)) == sorted(_ids(index.search(**kwargs)))
+
+    def test_title_match_ranks_above_tag_match(self):
+        base = make_recruits(2)
+        title_hit = base[0].model_copy(update={"id": 1, "announcement_name": "보안 관제", "tags": [], "deadline": TODAY})
+        tag_hit = base[1].model_copy(update={"id": 2, "announcement_name": "관제", "tags": ["보안"], "deadline": TODAY})
+        index = SearchIndex([title_hit, tag_hit])
+        assert _ids(index.search(keyword="보안")) == [2, 1]
+        assert _ids(index.search(keyword="보안", scored=True)) == [1, 2]
+
+
+class TestSemantics:
+    def test_expired_postings_excluded_and_id_desc(self, recruits, index):
+        results = index.search(limit=10_000)
+        assert all(r.deadline >= TODAY for r in results)
+        assert _ids(results) == sorted(_ids(results), reverse=True)
+
+    def test_tag_match_does_not_span_tags(self):
+        r = make_recruits(1)[0].model_copy(update={"announcement_name": "공고", "tags": ["데이터", "분석"], "deadline": TODAY})
+        index = SearchIndex([r])
+        assert index.search(keyword="데이터분석") == []
+        assert index.search(keyword="이터") == [r]
+
+    def test_or_fallback_for_sparse_and(self, recruits, index):
+        # AND로는 결과가 없는 조합 → OR 폴백으로 각 토큰 결과가 나온다
+        results = index.search(keyword="간호사 Kubernetes", limit=50)
+        assert results and _ids(results) == _reference(recruits, keyword="간호사 Kubernetes", limit=50)
+
+
+class TestDispatch:
+    def test_falls_back_to_sql_when_index_fails(self, monkeypatch):
+        import db.io
+        import db.search_index
+
+        def broken_index():
+            raise RuntimeError("DB 연결 실패")
+
+        monkeypatch.setattr(db.search_index, "SEARCH_INDEX_ENABLED", True)
+        monkeypatch.setattr(db.search_index, "get_index", broken_index)
+        monkeypatch.setattr(db.io, "_search_recruits_sql", lambda **kwargs: ["sql", kwargs["keyword"]])
+        assert db.io.search_recruits_by_filter(keyword="백엔드") == ["sql", "백엔드"]
+
+
+class TestShortTokenSql:
+    """1~2글자 토큰은 SQL 경로에서도 pg_trgm 대신 short_grams 배열(GIN)로 찾는다."""
+
+    @staticmethod
+    def _sql(clause) -> str:
+        from sqlalchemy.dialects import postgresql
+        return str(clause.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.parametrize("token", ["AI", "보안", "신"])
+    def test_short_tokens_use_gram_array(self, token):
+        from db.io import tags_contain, title_contains
+        assert "title_grams @>" in self._sql(title_contains(token))
+        assert "tag_grams @>" in self._sql(tags_contain(token))
+
+    @pytest.mark.parametrize("token", ["백엔드", "C%", "a_", "a b"])
+    def test_other_tokens_keep_ilike(self, token):
+        from db.io import tags_contain, title_contains
+        assert "ILIKE" in self._sql(title_contains(token)).upper()
+        assert "tag_search_text(recruits.tag_names) ILIKE" in self._sql(tags_contain(token))
+
+
+class TestScoredSql:
+    """점수 검색(_scored_recruits)의 한 문장 SQL — 단계 선택은 CTE 결과 수를 센 스칼라 서브쿼리로 한다."""
+
+    class _Session:
+        def execute(self, statement):
+            from sqlalchemy.dialects import postgresql
+            self.compiled = statement.compile(dialect=postgresql.dialect())
+            return self
+
+        def mappings(self):
+            return self
+
+        def all(self):
+            return []
+
+    def _compile(self, tokens, expanded, expand_below):
+        from sqlalchemy.orm import Query
+        from db.io import _scored_recruits
+        from db.models import Recruit
+        session = self._Session()
+        assert _scored_recruits(Query(Recruit.id, session=session), tokens, expanded, use_tags=True,
+                                limit=10, fallback_threshold=7, expand_below=expand_below) == []
+        return str(session.compiled), list(session.compiled.params.values())
+
+    def test_multi_token_picks_stage_by_counts(self):
+        sql, params = self._compile(["백엔드", "AI"], ["서버"], expand_below=4)
+        assert "WITH and_ids AS" in sql and "keyword_ids AS" in sql
+        # AND 결과 수 ≥ fallback_threshold → OR 폴백, 키워드 결과 수 ≥ expand_below → 확장 키워드
+        assert "FROM and_ids) >=" in sql and "FROM and_ids) <" in sql
+        assert "FROM keyword_ids) >=" in sql and "FROM keyword_ids) <" in sql
+        assert 7 in params and 4 in params
+
+    def test_single_token_skips_or_fallback(self):
+        sql, _ = self._compile(["백엔드"], ["서버"], expand_below=4)
+        assert "and_ids" in sql and "keyword_ids" not in sql
+        assert "FROM and_ids) >=" in sql
+
+    def test_expand_below_zero_uses_expanded_subquery_only(self):
+        sql, _ = self._compile(["백엔드", "AI"], ["서버"], expand_below=0)
+        assert "and_ids" not in sql and "keyword_ids" not in sql
+        assert "count(*)" not in sql
+        assert "UNION ALL" not in sql
+
+
+class TestHydrate:
+    """2단계 SQL 검색의 채우기 단계 — 고른 id 순서(id DESC LIMIT 결과)를 그대로 유지해야 한다."""
+
+    class _Session:
+        def __init__(self, rows):
+            self.rows, self.calls = rows, 0
+
+        def execute(self, statement, params):
+            self.calls += 1
+            return self
+
+        def mappings(self):
+            return self
+
+        def all(self):
+            return self.rows
+
+    def test_keeps_input_order_and_skips_missing(self):
+        from db.io import _hydrate_recruits
+        recruits = make_recruits(3)
+        # DB는 id 순서를 보장하지 않는다 — 역순으로 돌려줘도 입력 순서로 맞춰야 함
+        session = self._Session([r.model_dump() for r in reversed(recruits)])
+        assert _ids(_hydrate_recruits(session, [3, 99, 1, 2])) == [3, 1, 2]
+        assert session.calls == 1
+
+    def test_empty_ids_skip_query(self):
+        from db.io import _hydrate_recruits
+        session = self._Session([])
+        assert _hydrate_recruits(session, []) == []
+        assert session.calls == 0
@@ -0,0 +1,111 @@
+"""
+db/tag_recruits.py 샤드 인자 파싱·진행 기록(checkpoint)·재개 테스트 — DB 연결 불필요
+"""
+import argparse
+from types import SimpleNamespace
+
+import pytest
+
+import db.tag_recruits
+from db.tag_recruits import OutageGuard, checkpoint_state, parse_shard, record_batch, save_checkpoint
+
+
+class TestParseShard:
+    def test_valid(self):
+        assert parse_shard("0/1") == (0, 1)
+        assert parse_shard("3/4") == (3, 4)
+
+    @pytest.mark.parametrize("value", ["4/4", "-1/4", "0/0", "1", "a/b", "1/2/3"])
+    def test_invalid(self, value):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(value)
+
+
+def _stats(tagged=0, skipped=0, failed_ids=()):
+    return {"tagged": tagged, "skipped": skipped, "failed": len(failed_ids), "failed_ids": list(failed_ids)}
+
+
+class TestRecordBatch:
+    def test_failed_ids_are_kept_past_high_water_mark(self):
+        totals, failed = checkpoint_state(None)[1:]
+        record_batch(totals, failed, [1, 2, 3], _stats(tagged=2, failed_ids=[2]))
+        record_batch(totals, failed, [4, 5], _stats(skipped=1, failed_ids=[5]))
+        assert failed == {2, 5}
+        assert totals == {"processed": 5, "tagged": 2, "skipped": 1, "failed": 2}
+
+    def test_retry_clears_recovered_ids_without_recounting(self):
+        totals = {"processed": 5, "tagged": 2, "skipped": 1, "failed": 2}
+        failed = {2, 5}
+        record_batch(totals, failed, [2, 5], _stats(tagged=1, failed_ids=[5]), retry=True)
+        assert failed == {5}
+        assert totals == {"processed": 5, "tagged": 3, "skipped": 1, "failed": 1}
+
+
+class TestCheckpoint:
+    def test_state_restores_failed_ids(self):
+        row = SimpleNamespace(high_water_mark=40, processed=40, tagged=30, skipped=8, failed=2,
+                              failed_ids=[7, 31], finished_at=None)
+        assert checkpoint_state(row) == (40, {"processed": 40, "tagged": 30, "skipped": 8, "failed": 2}, {7, 31})
+
+    def test_save_writes_sorted_failed_ids(self):
+        executed = []
+        session = SimpleNamespace(execute=lambda sql, params: executed.append(params), commit=lambda: None)
+        totals = {"processed": 5, "tagged": 3, "skipped": 0, "failed": 2}
+        save_checkpoint(session, "run", 0, 1, 5, totals, {5, 2})
+        (params,) = executed
+        assert params["failed_ids"] == [2, 5] and params["hwm"] == 5 and params["finished"] is False
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestOutageGuard:
+    """서킷이 열린 동안 배치를 보내지 않는다 — 보내면 전부 거절되어 mark만 전진한다."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(db.tag_recruits, "time", clock)
+        return clock
+
+    def _available_after(self, monkeypatch, clock, seconds):
+        monkeypatch.setattr(db.tag_recruits, "llm_available", lambda: clock.now >= seconds)
+
+    def test_closed_circuit_passes_immediately(self, monkeypatch, clock):
+        self._available_after(monkeypatch, clock, 0)
+        assert OutageGuard(max_wait=60).ready(_stats(tagged=1))
+        assert clock.now == 0
+
+    def test_waits_until_circuit_closes(self, monkeypatch, clock):
+        self._available_after(monkeypatch, clock, 30)
+        guard = OutageGuard(max_wait=60, poll_seconds=5)
+        assert guard.ready()
+        assert clock.now == 30
+
+    def test_stops_when_outage_exceeds_max_wait(self, monkeypatch, clock):
+        self._available_after(monkeypatch, clock, 1000)
+        assert not OutageGuard(max_wait=60, poll_seconds=5).ready()
+        assert clock.now == 60
+
+    def test_outage_spans_rejected_half_open_batches(self, monkeypatch, clock):
+        # 시험 호출 시점마다 배치가 다시 거절되어도 장애 시간은 처음 열린 때부터 누적
+        guard = OutageGuard(max_wait=60, poll_seconds=5)
+        rejected = {**_stats(failed_ids=[1]), "circuit_open_ids": [1]}
+        self._available_after(monkeypatch, clock, 30)
+        assert guard.ready(rejected) and clock.now == 30
+        self._available_after(monkeypatch, clock, 90)
+        assert not guard.ready(rejected) and clock.now == 60
+
+    def test_clean_batch_resets_outage(self, monkeypatch, clock):
+        guard = OutageGuard(max_wait=60, poll_seconds=5)
+        self._available_after(monkeypatch, clock, 50)
+        assert guard.ready()
+        assert guard.ready(_stats(tagged=3)) and guard.since is None
@@ -0,0 +1,63 @@
+"""
+db/tagger.py 파싱 단위 테스트 — DB·LLM 불필요
+"""
+from db import tagger
+from db.tagger import _parse_batch_tags, _parse_tags
+
+
+class TestParseTags:
+    def test_first_line_only_and_length_filter(self):
+        raw = "백엔드, Java, 아주 긴 설명 문장 태그\n부연 설명"
+        assert _parse_tags(raw) == ["백엔드", "Java"]
+
+
+class TestParseBatchTags:
+    def test_numbered_lines_in_order(self):
+        raw = "1. 백엔드, Java\n2) 회계, 세무\n[3] 물류, 유통"
+        assert _parse_batch_tags(raw, 3) == [["백엔드", "Java"], ["회계", "세무"], ["물류", "유통"]]
+
+    def test_missing_and_out_of_range_items_are_none(self):
+        raw = "2. 회계\n7. 범위밖\n설명 문장"
+        assert _parse_batch_tags(raw, 3) == [None, ["회계"], None]
+
+    def test_first_occurrence_wins(self):
+        assert _parse_batch_tags("1. A\n1. B", 1) == [["A"]]
+
+    def test_echoed_prompt_fields_are_stripped(self):
+        raw = "1. 공고명: 자바 개발자 | 태그: 백엔드, Java"
+        assert _parse_batch_tags(raw, 1) == [["백엔드", "Java"]]
+
+
+class TestCallTaggerBatchFallback:
+    def test_unparsed_items_fall_back_to_single_calls(self, monkeypatch):
+        class FakeClient:
+            def generate(self, prompt, **kwargs):
+                return "1. 백엔드, Java\n3. 물류"
+
+        single_calls = []
+        monkeypatch.setattr(tagger, "get_client", lambda: FakeClient())
+        monkeypatch.setattr(tagger, "call_tagger", lambda name, existing: single_calls.append(name) or ["재시도"])
+
+        items = [("a", []), ("b", []), ("c", ["기존"])]
+        assert tagger.call_tagger_batch(items) == [["백엔드", "Java"], ["재시도"], ["물류"]]
+        assert single_calls == ["b"]
+
+
+class TestTitleCacheKey:
+    def test_normalizes_title_and_tag_order(self):
+        a = tagger.title_cache_key("  백엔드  개발자 (Java) ", ["Spring", "Java"])
+        b = tagger.title_cache_key("백엔드 개발자 (JAVA)", ["Java", "Spring", "Java"])
+        assert a == b
+
+    def test_existing_tags_and_prompt_version_are_part_of_key(self, monkeypatch):
+        base = tagger.title_cache_key("백엔드 개발자", [])
+        assert tagger.title_cache_key("백엔드 개발자", ["Java"]) != base
+        monkeypatch.setattr(tagger, "PROMPT_VERSION", "changed")
+        assert tagger.title_cache_key("백엔드 개발자", []) != base
+
+
+class TestStreamStopConditions:
+    def test_batch_lines_complete(self):
+        assert not tagger._batch_lines_complete("1. 백엔드, Java\n2. 물", 2)
+        assert tagger._batch_lines_complete("1. 백엔드, Java\n2. 물류\n", 2)
+        assert not tagger._batch_lines_complete("\n1. 백엔드\n설명\n", 2)
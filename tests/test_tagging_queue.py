@@ -0,0 +1,94 @@
+"""
+db/tagging_queue.py 단위 테스트 — DB 연결 불필요
+"""
+from db import tagging_queue
+from db.tagging_queue import backoff_seconds
+
+
+class FakeCursor:
+    def __init__(self):
+        self.executed = []
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self.executed.append((" ".join(sql.split()), params))
+
+
+class FakeConn:
+    def __init__(self):
+        self.cur = FakeCursor()
+        self.commits = 0
+
+    def cursor(self):
+        return self.cur
+
+    def commit(self):
+        self.commits += 1
+
+
+class TestBackoff:
+    def test_exponential_and_capped(self):
+        assert [backoff_seconds(n) for n in (1, 2, 3)] == [30, 60, 120]
+        assert backoff_seconds(50) == tagging_queue.BACKOFF_MAX_SECONDS
+
+
+class TestFail:
+    def test_retry_then_dead(self):
+        conn = FakeConn()
+        dead = tagging_queue.fail(conn, [(1, 10, 1), (2, 20, 5)], "LLM 태깅 실패", max_attempts=5)
+        assert dead == 1
+        (retry_sql, retry_params), (dead_sql, dead_params) = conn.cur.executed
+        assert "status = 'pending'" in retry_sql and retry_params == ("LLM 태깅 실패", 30, 1)
+        assert "status = 'dead'" in dead_sql and dead_params == ("LLM 태깅 실패", 2)
+        assert conn.commits == 1
+
+    def test_enqueue_empty_is_noop(self):
+        cur = FakeCursor()
+        assert tagging_queue.enqueue(cur, []) == 0
+        assert cur.executed == []
+
+
+class TestRelease:
+    def test_returns_to_pending_without_counting_attempt(self):
+        conn = FakeConn()
+        tagging_queue.release(conn, [1, 2], "LLM 서킷 open")
+        (sql, params), = conn.cur.executed
+        assert "status = 'pending'" in sql and "attempts = GREATEST(attempts - 1, 0)" in sql
+        assert params == ("LLM 서킷 open", [1, 2])
+
+    def test_empty_is_noop(self):
+        conn = FakeConn()
+        tagging_queue.release(conn, [], "LLM 서킷 open")
+        assert conn.cur.executed == [] and conn.commits == 0
+
+
+class TestWorkerCircuitOpen:
+    def _patch(self, monkeypatch, available, stats=None):
+        from db import tag_worker
+        calls = {"claim": 0, "complete": [], "release": [], "fail": []}
+
+        def claim(conn, worker_id, limit):
+            calls["claim"] += 1
+            return [(1, 10, 1), (2, 20, 1), (3, 30, 1)]
+
+        monkeypatch.setattr(tag_worker, "llm_available", lambda: available)
+        monkeypatch.setattr(tag_worker, "connect_postgres", lambda: FakeConn())
+        monkeypatch.setattr(tag_worker, "release_connection", lambda conn: None)
+        monkeypatch.setattr(tag_worker.tagging_queue, "claim", claim)
+        monkeypatch.setattr(tag_worker.tagging_queue, "complete", lambda conn, ids: calls["complete"].extend(ids))
+        monkeypatch.setattr(tag_worker.tagging_queue, "release", lambda conn, ids, reason: calls["release"].extend(ids))
+        monkeypatch.setattr(tag_worker.tagging_queue, "fail",
+                            lambda conn, jobs, error, max_attempts: calls["fail"].extend(j[0] for j in jobs) or 0)
+        monkeypatch.setattr(tag_worker, "tag_recruit_batch", lambda ids, parallelism=None: stats)
+        return tag_worker, calls
+
+    def test_does_not_claim_while_circuit_open(self, monkeypatch):
+        tag_worker, calls = self._patch(monkeypatch, available=False)
+        assert tag_worker.process_once("w", 20, 5) == 0
+        assert calls["claim"] == 0
+
+    def test_circuit_open_failures_are_released_not_failed(self, monkeypatch):
+        stats = {"tagged": 1, "skipped": 0, "failed": 2, "failed_ids": [20, 30], "circuit_open_ids": [30]}
+        tag_worker, calls = self._patch(monkeypatch, available=True, stats=stats)
+        assert tag_worker.process_once("w", 20, 5) == 3
+        assert (calls["complete"], calls["release"], calls["fail"]) == ([1], [3], [2])